@@ -182,88 +182,87 @@ def progress_callback(current: int, total: int, page_title: str):
 def command_sync(args, config: AppConfig) -> int:
     """同期コマンドの実行"""
     try:
-        orchestrator = SyncOrchestrator(config)
-        
-        # ドライランの場合はプレビューのみ
-        if args.dry_run:
-            print("🔍 同期プレビューを実行中...")
-            preview = orchestrator.get_sync_preview(max_pages=20)
+        with SyncOrchestrator(config) as orchestrator:
+            # ドライランの場合はプレビューのみ
+            if args.dry_run:
+                print("🔍 同期プレビューを実行中...")
+                preview = orchestrator.get_sync_preview(max_pages=20)
+                
+                print(f"📊 同期対象: {preview['total_pages_in_database']}ページ")
+                if preview['potential_conflicts']:
+                    print(f"⚠️  競合の可能性: {len(preview['potential_conflicts'])}件")
+                
+                print("\n📝 プレビューページ:")
+                for page in preview['preview_pages'][:10]:
+                    print(f"  - {page['title']} -> {page['estimated_filename']}")
+                
+                return 0
             
-            print(f"📊 同期対象: {preview['total_pages_in_database']}ページ")
-            if preview['potential_conflicts']:
-                print(f"⚠️  競合の可能性: {len(preview['potential_conflicts'])}件")
+            # 実際の同期実行
+            print("🚀 同期を開始します...")
             
-            print("\n📝 プレビューページ:")
-            for page in preview['preview_pages'][:10]:
-                print(f"  - {page['title']} -> {page['estimated_filename']}")
+            # 進捗コールバックの設定
+            callback = None if args.no_progress else progress_callback
             
-            return 0
-        
-        # 実際の同期実行
-        print("🚀 同期を開始します...")
-        
-        # 進捗コールバックの設定
-        callback = None if args.no_progress else progress_callback
-        
-        if args.page_id:
-            # 単一ページ同期
-            print(f"📄 ページID {args.page_id} を同期中...")
-            success = orchestrator.sync_single_page(args.page_id)
-            if success:
-                print("\n✅ 単一ページ同期完了")
-                return 0
+            if args.page_id:
+                # 単一ページ同期
+                print(f"📄 ページID {args.page_id} を同期中...")
+                success = orchestrator.sync_single_page(args.page_id)
+                if success:
+                    print("\n✅ 単一ページ同期完了")
+                    return 0
+                else:
+                    print("\n❌ 単一ページ同期失敗")
+                    return 1
+                    
+            elif args.since:
+                # 日時フィルター同期
+                try:
+                    since_date = datetime.strptime(args.since, "%Y-%m-%d")
+                    print(f"📅 {args.since}以降に更新されたページを同期中...")
+                    result = orchestrator.sync_pages_modified_after(since_date, callback)
+                except ValueError:
+                    print("❌ 日付形式が正しくありません（YYYY-MM-DD形式で入力してください）", file=sys.stderr)
+                    return 1
+                    
+            elif args.filter:
+                # フィルター同期
+                try:
+                    import json
+                    filter_dict = json.loads(args.filter)
+                    print("🔍 フィルター条件で同期中...")
+                    result = orchestrator.sync_pages_by_filter(filter_dict, callback)
+                except json.JSONDecodeError:
+                    print("❌ フィルター条件のJSON形式が正しくありません", file=sys.stderr)
+                    return 1
+                    
             else:
-                print("\n❌ 単一ページ同期失敗")
-                return 1
-                
-        elif args.since:
-            # 日時フィルター同期
-            try:
-                since_date = datetime.strptime(args.since, "%Y-%m-%d")
-                print(f"📅 {args.since}以降に更新されたページを同期中...")
-                result = orchestrator.sync_pages_modified_after(since_date, callback)
-            except ValueError:
-                print("❌ 日付形式が正しくありません（YYYY-MM-DD形式で入力してください）", file=sys.stderr)
-                return 1
-                
-        elif args.filter:
-            # フィルター同期
-            try:
-                import json
-                filter_dict = json.loads(args.filter)
-                print("🔍 フィルター条件で同期中...")
-                result = orchestrator.sync_pages_by_filter(filter_dict, callback)
-            except json.JSONDecodeError:
-                print("❌ フィルター条件のJSON形式が正しくありません", file=sys.stderr)
-                return 1
+                # 全ページ同期
+                print("📚 全ページを同期中...")
+                result = orchestrator.sync_all_pages(callback)
+            
+            # 結果表示
+            if not args.no_progress:
+                print()  # 進捗表示の改行
                 
-        else:
-            # 全ページ同期
-            print("📚 全ページを同期中...")
-            result = orchestrator.sync_all_pages(callback)
-        
-        # 結果表示
-        if not args.no_progress:
-            print()  # 進捗表示の改行
+            summary = result.get_summary()
             
-        summary = result.get_summary()
-        
-        if summary['success_rate'] == 100:
-            print(f"✅ 同期完了: {summary['successful_pages']}/{summary['total_pages']}ページ")
-        else:
-            print(f"⚠️  同期完了（一部エラー）: {summary['successful_pages']}/{summary['total_pages']}ページ")
-            print(f"   エラー: {summary['error_count']}件, 警告: {summary['warning_count']}件")
-        
-        print(f"⏱️  処理時間: {summary['duration_seconds']:.1f}秒")
-        
-        # レポート生成
-        report = orchestrator.create_sync_report(result)
-        report_file = f"sync_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
-        with open(report_file, 'w', encoding='utf-8') as f:
-            f.write(report)
-        print(f"📄 詳細レポート: {report_file}")
-        
-        return 0 if summary['error_count'] == 0 else 1
+            if summary['success_rate'] == 100:
+                print(f"✅ 同期完了: {summary['successful_pages']}/{summary['total_pages']}ページ")
+            else:
+                print(f"⚠️  同期完了（一部エラー）: {summary['successful_pages']}/{summary['total_pages']}ページ")
+                print(f"   エラー: {summary['error_count']}件, 警告: {summary['warning_count']}件")
+            
+            print(f"⏱️  処理時間: {summary['duration_seconds']:.1f}秒")
+            
+            # レポート生成
+            report = orchestrator.create_sync_report(result)
+            report_file = f"sync_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
+            with open(report_file, 'w', encoding='utf-8') as f:
+                f.write(report)
+            print(f"📄 詳細レポート: {report_file}")
+            
+            return 0 if summary['error_count'] == 0 else 1
         
     except Exception as e:
         print(f"❌ 同期エラー: {e}", file=sys.stderr)
@@ -273,40 +272,39 @@ def command_sync(args, config: AppConfig) -> int:
 def command_test(args, config: AppConfig) -> int:
     """テストコマンドの実行"""
     try:
-        orchestrator = SyncOrchestrator(config)
-        
-        print("🔍 接続テストを実行中...")
-        test_result = orchestrator.test_sync_connection()
-        
-        if test_result["overall_status"]:
-            print("✅ 接続テスト成功")
-        else:
-            print("❌ 接続テスト失敗")
-        
-        if args.detailed:
-            print("\n📊 詳細結果:")
-            checks = {
-                "notion_connection": "Notion API接続",
-                "database_access": "データベースアクセス",
-                "obsidian_vault": "Obsidianボルト",
-                "file_write_permission": "ファイル書き込み権限"
-            }
-            
-            for check, description in checks.items():
-                status = "✅" if test_result[check] else "❌"
-                print(f"  {status} {description}")
-            
-            if test_result["errors"]:
-                print("\n❌ エラー:")
-                for error in test_result["errors"]:
-                    print(f"  - {error}")
+        with SyncOrchestrator(config) as orchestrator:
+            print("🔍 接続テストを実行中...")
+            test_result = orchestrator.test_sync_connection()
             
-            if test_result["warnings"]:
-                print("\n⚠️  警告:")
-                for warning in test_result["warnings"]:
-                    print(f"  - {warning}")
-        
-        return 0 if test_result["overall_status"] else 1
+            if test_result["overall_status"]:
+                print("✅ 接続テスト成功")
+            else:
+                print("❌ 接続テスト失敗")
+            
+            if args.detailed:
+                print("\n📊 詳細結果:")
+                checks = {
+                    "notion_connection": "Notion API接続",
+                    "database_access": "データベースアクセス",
+                    "obsidian_vault": "Obsidianボルト",
+                    "file_write_permission": "ファイル書き込み権限"
+                }
+                
+                for check, description in checks.items():
+                    status = "✅" if test_result[check] else "❌"
+                    print(f"  {status} {description}")
+                
+                if test_result["errors"]:
+                    print("\n❌ エラー:")
+                    for error in test_result["errors"]:
+                        print(f"  - {error}")
+                
+                if test_result["warnings"]:
+                    print("\n⚠️  警告:")
+                    for warning in test_result["warnings"]:
+                        print(f"  - {warning}")
+            
+            return 0 if test_result["overall_status"] else 1
         
     except Exception as e:
         print(f"❌ テストエラー: {e}", file=sys.stderr)
@@ -316,34 +314,33 @@ def command_test(args, config: AppConfig) -> int:
 def command_preview(args, config: AppConfig) -> int:
     """プレビューコマンドの実行"""
     try:
-        orchestrator = SyncOrchestrator(config)
-        
-        print(f"🔍 同期プレビューを実行中（最大{args.max_pages}ページ）...")
-        preview = orchestrator.get_sync_preview(args.max_pages)
-        
-        print(f"\n📊 データベース統計:")
-        print(f"  総ページ数: {preview['total_pages_in_database']}")
-        print(f"  プレビュー対象: {len(preview['preview_pages'])}ページ")
-        
-        if preview['potential_conflicts']:
-            print(f"\n⚠️  ファイル名競合の可能性: {len(preview['potential_conflicts'])}件")
-            for conflict in preview['potential_conflicts'][:5]:
-                print(f"  - {conflict}")
-        
-        print(f"\n📝 プレビューページ:")
-        for page in preview['preview_pages']:
-            print(f"  📄 {page['title']}")
-            print(f"     ファイル名: {page['estimated_filename']}")
-            if page['last_edited']:
-                print(f"     最終更新: {page['last_edited']}")
-            print()
-        
-        if preview['warnings']:
-            print("⚠️  警告:")
-            for warning in preview['warnings']:
-                print(f"  - {warning}")
-        
-        return 0
+        with SyncOrchestrator(config) as orchestrator:
+            print(f"🔍 同期プレビューを実行中（最大{args.max_pages}ページ）...")
+            preview = orchestrator.get_sync_preview(args.max_pages)
+            
+            print(f"\n📊 データベース統計:")
+            print(f"  総ページ数: {preview['total_pages_in_database']}")
+            print(f"  プレビュー対象: {len(preview['preview_pages'])}ページ")
+            
+            if preview['potential_conflicts']:
+                print(f"\n⚠️  ファイル名競合の可能性: {len(preview['potential_conflicts'])}件")
+                for conflict in preview['potential_conflicts'][:5]:
+                    print(f"  - {conflict}")
+            
+            print(f"\n📝 プレビューページ:")
+            for page in preview['preview_pages']:
+                print(f"  📄 {page['title']}")
+                print(f"     ファイル名: {page['estimated_filename']}")
+                if page['last_edited']:
+                    print(f"     最終更新: {page['last_edited']}")
+                print()
+            
+            if preview['warnings']:
+                print("⚠️  警告:")
+                for warning in preview['warnings']:
+                    print(f"  - {warning}")
+            
+            return 0
         
     except Exception as e:
         print(f"❌ プレビューエラー: {e}", file=sys.stderr)
@@ -427,34 +424,33 @@ def command_config(args, config_path: Optional[str]) -> int:
 def command_status(args, config: AppConfig) -> int:
     """ステータスコマンドの実行"""
     try:
-        orchestrator = SyncOrchestrator(config)
-        
-        print("📊 同期状態を確認中...")
-        stats = orchestrator.get_sync_statistics()
-        
-        if "error" in stats:
-            print(f"❌ 統計取得エラー: {stats['error']}")
-            return 1
-        
-        print("\n📈 統計情報:")
-        print(f"  データベース総ページ数: {stats['database_stats']['total_pages']}")
-        print(f"  ローカルMarkdownファイル数: {stats['file_system_stats']['total_markdown_files']}")
-        print(f"  同期カバレッジ: {stats['sync_coverage']['coverage_percentage']:.1f}%")
-        
-        if args.detailed:
-            print(f"\n💾 ファイルシステム:")
-            print(f"  総サイズ: {stats['file_system_stats']['total_size_mb']:.2f}MB")
-            print(f"  平均ファイルサイズ: {stats['file_system_stats']['average_file_size']:.0f}バイト")
-            print(f"  有効ファイル: {stats['file_system_stats']['valid_files']}")
-            print(f"  無効ファイル: {stats['file_system_stats']['invalid_files']}")
-            
-            if stats['sync_coverage']['missing_pages'] > 0:
-                print(f"\n⚠️  未同期ページ: {stats['sync_coverage']['missing_pages']}ページ")
-            
-            if stats['sync_coverage']['extra_files'] > 0:
-                print(f"⚠️  余分なファイル: {stats['sync_coverage']['extra_files']}ファイル")
-        
-        return 0
+        with SyncOrchestrator(config) as orchestrator:
+            print("📊 同期状態を確認中...")
+            stats = orchestrator.get_sync_statistics()
+            
+            if "error" in stats:
+                print(f"❌ 統計取得エラー: {stats['error']}")
+                return 1
+            
+            print("\n📈 統計情報:")
+            print(f"  データベース総ページ数: {stats['database_stats']['total_pages']}")
+            print(f"  ローカルMarkdownファイル数: {stats['file_system_stats']['total_markdown_files']}")
+            print(f"  同期カバレッジ: {stats['sync_coverage']['coverage_percentage']:.1f}%")
+            
+            if args.detailed:
+                print(f"\n💾 ファイルシステム:")
+                print(f"  総サイズ: {stats['file_system_stats']['total_size_mb']:.2f}MB")
+                print(f"  平均ファイルサイズ: {stats['file_system_stats']['average_file_size']:.0f}バイト")
+                print(f"  有効ファイル: {stats['file_system_stats']['valid_files']}")
+                print(f"  無効ファイル: {stats['file_system_stats']['invalid_files']}")
+                
+                if stats['sync_coverage']['missing_pages'] > 0:
+                    print(f"\n⚠️  未同期ページ: {stats['sync_coverage']['missing_pages']}ページ")
+                
+                if stats['sync_coverage']['extra_files'] > 0:
+                    print(f"⚠️  余分なファイル: {stats['sync_coverage']['extra_files']}ファイル")
+            
+            return 0
         
     except Exception as e:
         print(f"❌ ステータス確認エラー: {e}", file=sys.stderr)
@@ -464,29 +460,28 @@ def command_status(args, config: AppConfig) -> int:
 def command_cleanup(args, config: AppConfig) -> int:
     """クリーンアップコマンドの実行"""
     try:
-        orchestrator = SyncOrchestrator(config)
-        
-        if not args.force:
-            response = input("失敗したファイルをクリーンアップしますか？ (y/N): ")
-            if response.lower() not in ['y', 'yes']:
-                print("クリーンアップをキャンセルしました")
-                return 0
-        
-        print("🧹 失敗ファイルのクリーンアップを実行中...")
-        result = orchestrator.cleanup_failed_files()
-        
-        print(f"✅ クリーンアップ完了:")
-        print(f"  チェック済みファイル: {result['checked_files']}")
-        print(f"  削除ファイル: {len(result['deleted_files'])}")
-        print(f"  バックアップファイル: {len(result['backup_files'])}")
-        
-        if result['errors']:
-            print(f"\n❌ エラー:")
-            for error in result['errors']:
-                print(f"  - {error}")
-            return 1
-        
-        return 0
+        with SyncOrchestrator(config) as orchestrator:
+            if not args.force:
+                response = input("失敗したファイルをクリーンアップしますか？ (y/N): ")
+                if response.lower() not in ['y', 'yes']:
+                    print("クリーンアップをキャンセルしました")
+                    return 0
+            
+            print("🧹 失敗ファイルのクリーンアップを実行中...")
+            result = orchestrator.cleanup_failed_files()
+            
+            print(f"✅ クリーンアップ完了:")
+            print(f"  チェック済みファイル: {result['checked_files']}")
+            print(f"  削除ファイル: {len(result['deleted_files'])}")
+            print(f"  バックアップファイル: {len(result['backup_files'])}")
+            
+            if result['errors']:
+                print(f"\n❌ エラー:")
+                for error in result['errors']:
+                    print(f"  - {error}")
+                return 1
+            
+            return 0
         
     except Exception as e:
         print(f"❌ クリーンアップエラー: {e}", file=sys.stderr)
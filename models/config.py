@@ -6,9 +6,18 @@ Notion-Obsidian同期システムの設定を管理するためのデータク
 from dataclasses import dataclass, field
 from typing import Dict, Any, Optional, List
 import os
+import stat
 from pathlib import Path
 
 
+# 設定値として許可される値（検証時はハッシュ参照で判定する）
+_VALID_DATABASE_MODES = frozenset({"table", "description", "skip"})
+_VALID_COLUMN_LAYOUTS = frozenset({"merge", "separator", "warning_only"})
+_VALID_UNSUPPORTED_BLOCKS = frozenset({"skip", "placeholder", "warning"})
+_VALID_QUALITY_LEVELS = frozenset({"strict", "standard", "lenient"})
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR"})
+
+
 @dataclass
 class NotionConfig:
     """Notion API設定"""
@@ -28,28 +37,34 @@ class ObsidianConfig:
     """Obsidian設定"""
     vault_path: str
     subfolder: Optional[str] = None
+    _full_sync_path: str = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """設定値の検証"""
         if not self.vault_path:
             raise ValueError("Obsidianボルトパスが必要です")
         
-        # パスの存在確認
-        vault_path = Path(self.vault_path)
-        if not vault_path.exists():
+        # パスの存在確認（存在とディレクトリ判定を1回のstatで行う）
+        try:
+            vault_stat = os.stat(self.vault_path)
+        except OSError:
             raise ValueError(f"Obsidianボルトパスが存在しません: {self.vault_path}")
-        if not vault_path.is_dir():
+        if not stat.S_ISDIR(vault_stat.st_mode):
             raise ValueError(f"Obsidianボルトパスはディレクトリである必要があります: {self.vault_path}")
+        
+        # 同期先の完全パスは参照のたびに組み立てず、初期化時に一度だけ計算する
+        if self.subfolder:
+            self._full_sync_path = str(Path(self.vault_path) / self.subfolder)
+        else:
+            self._full_sync_path = self.vault_path
     
     @property
     def full_sync_path(self) -> str:
         """同期先の完全パスを取得"""
-        if self.subfolder:
-            return str(Path(self.vault_path) / self.subfolder)
-        return self.vault_path
+        return self._full_sync_path
 
 
-@dataclass
+@dataclass(frozen=True)
 class ConversionConfig:
     """変換設定"""
     database_mode: str = "table"  # "table", "description", "skip"
@@ -72,21 +87,17 @@ class ConversionConfig:
     
     def __post_init__(self):
         """設定値の検証"""
-        valid_database_modes = ["table", "description", "skip"]
-        if self.database_mode not in valid_database_modes:
-            raise ValueError(f"無効なdatabase_mode: {self.database_mode}. 有効な値: {valid_database_modes}")
+        if self.database_mode not in _VALID_DATABASE_MODES:
+            raise ValueError(f"無効なdatabase_mode: {self.database_mode}. 有効な値: {sorted(_VALID_DATABASE_MODES)}")
         
-        valid_column_layouts = ["merge", "separator", "warning_only"]
-        if self.column_layout not in valid_column_layouts:
-            raise ValueError(f"無効なcolumn_layout: {self.column_layout}. 有効な値: {valid_column_layouts}")
+        if self.column_layout not in _VALID_COLUMN_LAYOUTS:
+            raise ValueError(f"無効なcolumn_layout: {self.column_layout}. 有効な値: {sorted(_VALID_COLUMN_LAYOUTS)}")
         
-        valid_unsupported_blocks = ["skip", "placeholder", "warning"]
-        if self.unsupported_blocks not in valid_unsupported_blocks:
-            raise ValueError(f"無効なunsupported_blocks: {self.unsupported_blocks}. 有効な値: {valid_unsupported_blocks}")
+        if self.unsupported_blocks not in _VALID_UNSUPPORTED_BLOCKS:
+            raise ValueError(f"無効なunsupported_blocks: {self.unsupported_blocks}. 有効な値: {sorted(_VALID_UNSUPPORTED_BLOCKS)}")
         
-        valid_quality_levels = ["strict", "standard", "lenient"]
-        if self.quality_level not in valid_quality_levels:
-            raise ValueError(f"無効なquality_level: {self.quality_level}. 有効な値: {valid_quality_levels}")
+        if self.quality_level not in _VALID_QUALITY_LEVELS:
+            raise ValueError(f"無効なquality_level: {self.quality_level}. 有効な値: {sorted(_VALID_QUALITY_LEVELS)}")
         
         # 数値範囲の検証
         if self.max_file_size_mb <= 0 or self.max_file_size_mb > 100:
@@ -95,9 +106,9 @@ class ConversionConfig:
         if self.max_line_length <= 0 or self.max_line_length > 10000:
             raise ValueError("max_line_lengthは0より大きく10000以下である必要があります")
         
-        # デフォルトブロック設定を初期化
+        # デフォルトブロック設定を初期化（frozenのためobject.__setattr__で代入）
         if not self.block_settings:
-            self.block_settings = self._get_default_block_settings()
+            object.__setattr__(self, "block_settings", self._get_default_block_settings())
     
     def _get_default_block_settings(self) -> Dict[str, Dict[str, Any]]:
         """デフォルトブロック設定を取得"""
@@ -252,6 +263,10 @@ class SyncConfig:
     include_properties: bool = True
     overwrite_existing: bool = True
     batch_size: int = 10
+    concurrency: int = 5  # ページコンテンツ取得の同時実行数
+    conversion_workers: int = 0  # Markdown変換用のプロセス数（0の場合は変換をプロセス内で行う）
+    skip_preflight_preview: bool = False  # 同期前の競合プレビューを省略するかどうか
+    incremental: bool = False  # 前回同期以降に更新されたページのみ変換・書き込みするかどうか
     conversion: ConversionConfig = field(default_factory=ConversionConfig)
     
     def __post_init__(self):
@@ -260,6 +275,10 @@ class SyncConfig:
             raise ValueError("batch_sizeは正の整数である必要があります")
         if self.batch_size > 100:
             raise ValueError("batch_sizeは100以下である必要があります（APIレート制限のため）")
+        if self.concurrency <= 0:
+            raise ValueError("concurrencyは正の整数である必要があります")
+        if self.conversion_workers < 0:
+            raise ValueError("conversion_workersは0以上である必要があります")
 
 
 @dataclass
@@ -270,9 +289,8 @@ class LoggingConfig:
     
     def __post_init__(self):
         """設定値の検証"""
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR"]
-        if self.level not in valid_levels:
-            raise ValueError(f"無効なログレベル: {self.level}. 有効な値: {valid_levels}")
+        if self.level not in _VALID_LOG_LEVELS:
+            raise ValueError(f"無効なログレベル: {self.level}. 有効な値: {sorted(_VALID_LOG_LEVELS)}")
 
 
 @dataclass
@@ -289,12 +307,19 @@ class AppConfig:
         notion_config = NotionConfig(**config_dict['notion'])
         obsidian_config = ObsidianConfig(**config_dict['obsidian'])
         
-        sync_data = config_dict.get('sync', {})
-        conversion_data = sync_data.pop('conversion', {})
-        conversion_config = ConversionConfig(**conversion_data)
-        sync_config = SyncConfig(conversion=conversion_config, **sync_data)
-        
-        logging_config = LoggingConfig(**config_dict.get('logging', {}))
+        # 省略されたセクションはデフォルト値で作成し、空の辞書を作らない
+        # （入力辞書は変更しない）
+        sync_data = config_dict.get('sync')
+        if sync_data:
+            conversion_data = sync_data.get('conversion')
+            conversion_config = ConversionConfig(**conversion_data) if conversion_data else ConversionConfig()
+            sync_kwargs = {key: value for key, value in sync_data.items() if key != 'conversion'}
+            sync_config = SyncConfig(conversion=conversion_config, **sync_kwargs)
+        else:
+            sync_config = SyncConfig()
+        
+        logging_data = config_dict.get('logging')
+        logging_config = LoggingConfig(**logging_data) if logging_data else LoggingConfig()
         
         return cls(
             notion=notion_config,
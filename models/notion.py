@@ -3,12 +3,26 @@ Notionデータモデル
 Notion APIから取得したデータを表現するためのデータクラス
 """
 
+import sys
 from dataclasses import dataclass, field
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, Iterable, List, Optional, Union
 from datetime import datetime
 from enum import Enum
 
 
+def join_plain_text(rich_text: Iterable[Dict[str, Any]]) -> str:
+    """
+    リッチテキスト配列のplain_textを連結
+    
+    Args:
+        rich_text: Notion APIのリッチテキスト配列
+        
+    Returns:
+        連結されたプレーンテキスト
+    """
+    return "".join(item["plain_text"] for item in rich_text if item.get("plain_text"))
+
+
 class NotionBlockType(Enum):
     """Notionブロックタイプの列挙"""
     PARAGRAPH = "paragraph"
@@ -133,9 +147,9 @@ class NotionProperty:
     def get_plain_text_value(self) -> str:
         """プレーンテキスト値を取得"""
         if self.type == "title" and isinstance(self.value, list):
-            return "".join([item.get("plain_text", "") for item in self.value])
+            return join_plain_text(self.value)
         elif self.type == "rich_text" and isinstance(self.value, list):
-            return "".join([item.get("plain_text", "") for item in self.value])
+            return join_plain_text(self.value)
         elif self.type == "select" and self.value:
             return self.value.get("name", "")
         elif self.type == "multi_select" and isinstance(self.value, list):
@@ -175,6 +189,9 @@ class NotionBlock:
             raise ValueError("ブロックIDが必要です")
         if not self.type:
             raise ValueError("ブロックタイプが必要です")
+        
+        # ブロックタイプは種類が限られるため、変換テーブルのキーと同じ文字列オブジェクトを共有する
+        self.type = sys.intern(self.type)
     
     @property
     def block_type(self) -> NotionBlockType:
@@ -184,24 +201,28 @@ class NotionBlock:
         except ValueError:
             return NotionBlockType.UNSUPPORTED
     
+    @property
+    def payload(self) -> Dict[str, Any]:
+        """ブロックタイプ名のキーに格納されたブロック固有データを取得"""
+        return self.content.get(self.type, {})
+    
+    @property
+    def rich_text(self) -> List[Dict[str, Any]]:
+        """ブロック固有データ内のリッチテキスト（生データ）を取得"""
+        return self.content.get(self.type, {}).get("rich_text", [])
+    
     def get_text_content(self) -> List[NotionRichText]:
         """ブロックのテキストコンテンツを取得"""
         if self.type in ["paragraph", "heading_1", "heading_2", "heading_3", 
-                        "bulleted_list_item", "numbered_list_item", "to_do", "quote"]:
-            rich_text_data = self.content.get(self.type, {}).get("rich_text", [])
-            return [NotionRichText(**item) for item in rich_text_data]
-        elif self.type == "callout":
-            rich_text_data = self.content.get("callout", {}).get("rich_text", [])
-            return [NotionRichText(**item) for item in rich_text_data]
-        elif self.type == "toggle":
-            rich_text_data = self.content.get("toggle", {}).get("rich_text", [])
-            return [NotionRichText(**item) for item in rich_text_data]
+                        "bulleted_list_item", "numbered_list_item", "to_do", "quote",
+                        "callout", "toggle"]:
+            return [NotionRichText(**item) for item in self.rich_text]
         return []
     
     def get_plain_text(self) -> str:
         """プレーンテキストを取得"""
         rich_texts = self.get_text_content()
-        return "".join([rt.plain_text for rt in rich_texts])
+        return "".join(rt.plain_text for rt in rich_texts)
     
     def is_supported(self) -> bool:
         """サポートされているブロックタイプかどうか"""
@@ -4,6 +4,7 @@
 """
 
 import logging
+from functools import lru_cache
 from typing import Dict, List, Any, Optional
 
 from models.notion import NotionBlock
@@ -12,6 +13,27 @@ from services.conversion_limitations import ConversionLimitationTracker, Convers
 from services.link_processor import NotionLinkProcessor
 
 
+@lru_cache(maxsize=4096)
+def _format_annotated_text(text: str, bold: bool, italic: bool, strikethrough: bool,
+                           underline: bool, code: bool) -> str:
+    """装飾フラグに従ってテキストをMarkdown記法で囲む（同じ組み合わせは結果を再利用）"""
+    formatted_text = text
+    
+    if bold:
+        formatted_text = f"**{formatted_text}**"
+    if italic:
+        formatted_text = f"*{formatted_text}*"
+    if strikethrough:
+        formatted_text = f"~~{formatted_text}~~"
+    if underline:
+        # Markdownには下線がないため、HTMLタグを使用
+        formatted_text = f"<u>{formatted_text}</u>"
+    if code:
+        formatted_text = f"`{formatted_text}`"
+    
+    return formatted_text
+
+
 class AdvancedBlockConverter:
     """高度なブロック変換機能"""
     
@@ -27,6 +49,52 @@ class AdvancedBlockConverter:
         self.limitation_tracker = ConversionLimitationTracker(conversion_config)
         self.warning_system = ConversionWarningSystem(self.limitation_tracker)
         self.link_processor = NotionLinkProcessor(conversion_config)
+        
+        # ブロックタイプごとの変換メソッド（未登録のタイプはサポート外として扱う）
+        self._block_converters = {
+            # 基本的なテキストブロック
+            "paragraph": self._convert_paragraph_block,
+            "heading_1": self._convert_heading_block,
+            "heading_2": self._convert_heading_block,
+            "heading_3": self._convert_heading_block,
+            "bulleted_list_item": self._convert_bulleted_list_block,
+            "numbered_list_item": self._convert_numbered_list_block,
+            "to_do": self._convert_todo_block,
+            "quote": self._convert_quote_block,
+            "callout": self._convert_callout_block,
+            "divider": self._convert_divider_block,
+            
+            # 高度なブロック
+            "code": self._convert_code_block,
+            "image": self._convert_image_block,
+            "table": self._convert_table_block,
+            "table_row": self._convert_table_row_block,
+            "toggle": self._convert_toggle_block,
+            "equation": self._convert_equation_block,
+            "bookmark": self._convert_bookmark_block,
+            "file": self._convert_file_block,
+            "video": self._convert_video_block,
+            
+            # 制限のあるブロックタイプの代替表現
+            "child_database": self._convert_database_block,
+            "column_list": self._convert_column_list_block,
+            "column": self._convert_column_block,
+            "synced_block": self._convert_synced_block,
+            "template": self._convert_template_block,
+            "link_to_page": self._convert_link_to_page_block,
+            "table_of_contents": self._convert_table_of_contents_block,
+            "breadcrumb": self._convert_breadcrumb_block,
+        }
+        
+        # サポートされていないブロックの扱いは設定で決まるため、処理を初期化時に選んでおく
+        unsupported_handlers = {
+            "skip": self._skip_unsupported_block,
+            "placeholder": self._placeholder_unsupported_block,
+            "warning": self._warn_unsupported_block,
+        }
+        self._unsupported_handler = unsupported_handlers.get(
+            conversion_config.unsupported_blocks, self._placeholder_unsupported_block
+        )
     
     def convert_blocks_to_markdown(self, blocks: List[NotionBlock]) -> str:
         """
@@ -88,78 +156,19 @@ class AdvancedBlockConverter:
         Returns:
             変換されたMarkdown文字列（変換不可の場合はNone）
         """
-        block_type = block.type
-        
-        # 基本的なテキストブロック
-        if block_type == "paragraph":
-            return self._convert_paragraph_block(block)
-        elif block_type in ["heading_1", "heading_2", "heading_3"]:
-            return self._convert_heading_block(block)
-        elif block_type == "bulleted_list_item":
-            return self._convert_bulleted_list_block(block)
-        elif block_type == "numbered_list_item":
-            return self._convert_numbered_list_block(block)
-        elif block_type == "to_do":
-            return self._convert_todo_block(block)
-        elif block_type == "quote":
-            return self._convert_quote_block(block)
-        elif block_type == "callout":
-            return self._convert_callout_block(block)
-        elif block_type == "divider":
-            return self._convert_divider_block(block)
-        
-        # 高度なブロック
-        elif block_type == "code":
-            return self._convert_code_block(block)
-        elif block_type == "image":
-            return self._convert_image_block(block)
-        elif block_type == "table":
-            return self._convert_table_block(block)
-        elif block_type == "table_row":
-            return self._convert_table_row_block(block)
-        elif block_type == "toggle":
-            return self._convert_toggle_block(block)
-        elif block_type == "equation":
-            return self._convert_equation_block(block)
-        elif block_type == "bookmark":
-            return self._convert_bookmark_block(block)
-        elif block_type == "file":
-            return self._convert_file_block(block)
-        elif block_type == "video":
-            return self._convert_video_block(block)
-        
-        # 制限のあるブロックタイプの代替表現
-        elif block_type == "child_database":
-            return self._convert_database_block(block)
-        elif block_type == "column_list":
-            return self._convert_column_list_block(block)
-        elif block_type == "column":
-            return self._convert_column_block(block)
-        elif block_type == "synced_block":
-            return self._convert_synced_block(block)
-        elif block_type == "template":
-            return self._convert_template_block(block)
-        elif block_type == "link_to_page":
-            return self._convert_link_to_page_block(block)
-        elif block_type == "table_of_contents":
-            return self._convert_table_of_contents_block(block)
-        elif block_type == "breadcrumb":
-            return self._convert_breadcrumb_block(block)
-        
-        # サポートされていないブロック
-        else:
-            return self._handle_unsupported_block(block)
+        converter = self._block_converters.get(block.type, self._handle_unsupported_block)
+        return converter(block)
     
     # 基本ブロック変換メソッド
     
     def _convert_paragraph_block(self, block: NotionBlock) -> str:
         """段落ブロックの変換"""
-        text_content = self._extract_rich_text_from_block(block, "paragraph")
+        text_content = self._extract_rich_text_from_content(block.rich_text)
         return text_content if text_content.strip() else ""
     
     def _convert_heading_block(self, block: NotionBlock) -> str:
         """見出しブロックの変換"""
-        text_content = self._extract_rich_text_from_block(block, block.type)
+        text_content = self._extract_rich_text_from_content(block.rich_text)
         if not text_content.strip():
             return ""
         
@@ -169,25 +178,25 @@ class AdvancedBlockConverter:
     
     def _convert_bulleted_list_block(self, block: NotionBlock) -> str:
         """箇条書きリストブロックの変換"""
-        text_content = self._extract_rich_text_from_block(block, "bulleted_list_item")
+        text_content = self._extract_rich_text_from_content(block.rich_text)
         return f"- {text_content}" if text_content.strip() else ""
     
     def _convert_numbered_list_block(self, block: NotionBlock) -> str:
         """番号付きリストブロックの変換"""
-        text_content = self._extract_rich_text_from_block(block, "numbered_list_item")
+        text_content = self._extract_rich_text_from_content(block.rich_text)
         return f"1. {text_content}" if text_content.strip() else ""
     
     def _convert_todo_block(self, block: NotionBlock) -> str:
         """TODOブロックの変換"""
-        text_content = self._extract_rich_text_from_block(block, "to_do")
-        todo_data = block.content.get("to_do", {})
+        text_content = self._extract_rich_text_from_content(block.rich_text)
+        todo_data = block.payload
         checked = todo_data.get("checked", False)
         checkbox = "[x]" if checked else "[ ]"
         return f"- {checkbox} {text_content}" if text_content.strip() else f"- {checkbox}"
     
     def _convert_quote_block(self, block: NotionBlock) -> str:
         """引用ブロックの変換"""
-        text_content = self._extract_rich_text_from_block(block, "quote")
+        text_content = self._extract_rich_text_from_content(block.rich_text)
         return f"> {text_content}" if text_content.strip() else ""
     
     def _convert_callout_block(self, block: NotionBlock) -> str:
@@ -204,7 +213,7 @@ class AdvancedBlockConverter:
     
     def _convert_code_block(self, block: NotionBlock) -> str:
         """コードブロックの変換"""
-        code_data = block.content.get("code", {})
+        code_data = block.payload
         text_content = self._extract_rich_text_from_content(code_data.get("rich_text", []))
         language = code_data.get("language", "")
         
@@ -242,7 +251,7 @@ class AdvancedBlockConverter:
     
     def _convert_image_block(self, block: NotionBlock) -> str:
         """画像ブロックの変換"""
-        image_data = block.content.get("image", {})
+        image_data = block.payload
         
         # 画像URLの取得
         image_url = ""
@@ -290,7 +299,7 @@ class AdvancedBlockConverter:
     
     def _convert_table_row_block(self, block: NotionBlock) -> str:
         """テーブル行ブロックの変換"""
-        table_row_data = block.content.get("table_row", {})
+        table_row_data = block.payload
         cells = table_row_data.get("cells", [])
         
         if not cells:
@@ -317,7 +326,7 @@ class AdvancedBlockConverter:
     
     def _convert_equation_block(self, block: NotionBlock) -> str:
         """数式ブロックの変換"""
-        equation_data = block.content.get("equation", {})
+        equation_data = block.payload
         expression = equation_data.get("expression", "")
         
         if not expression:
@@ -332,7 +341,7 @@ class AdvancedBlockConverter:
     
     def _convert_bookmark_block(self, block: NotionBlock) -> str:
         """ブックマークブロックの変換"""
-        bookmark_data = block.content.get("bookmark", {})
+        bookmark_data = block.payload
         url = bookmark_data.get("url", "")
         caption_content = ""
         
@@ -351,7 +360,7 @@ class AdvancedBlockConverter:
     
     def _convert_file_block(self, block: NotionBlock) -> str:
         """ファイルブロックの変換"""
-        file_data = block.content.get("file", {})
+        file_data = block.payload
         
         # ファイルURLの取得
         file_url = ""
@@ -382,7 +391,7 @@ class AdvancedBlockConverter:
     
     def _convert_video_block(self, block: NotionBlock) -> str:
         """動画ブロックの変換"""
-        video_data = block.content.get("video", {})
+        video_data = block.payload
         
         # 動画URLの取得
         video_url = ""
@@ -416,7 +425,7 @@ class AdvancedBlockConverter:
             f"ブロックID: {block.id}"
         )
         
-        database_data = block.content.get("child_database", {})
+        database_data = block.payload
         title = database_data.get("title", "データベース")
         
         # 設定に応じて変換方法を変更
@@ -467,7 +476,7 @@ class AdvancedBlockConverter:
             f"ブロックID: {block.id}"
         )
         
-        synced_data = block.content.get("synced_block", {})
+        synced_data = block.payload
         synced_from = synced_data.get("synced_from")
         
         if synced_from:
@@ -485,14 +494,14 @@ class AdvancedBlockConverter:
             f"ブロックID: {block.id}"
         )
         
-        template_data = block.content.get("template", {})
+        template_data = block.payload
         title = self._extract_rich_text_from_content(template_data.get("rich_text", []))
         
         return f"📋 **テンプレート: {title if title else 'テンプレート'}**\n\n> このセクションはNotionテンプレートです。実際の使用時には動的にコンテンツが生成されます。"
     
     def _convert_link_to_page_block(self, block: NotionBlock) -> str:
         """ページリンクブロックの代替表現変換"""
-        link_data = block.content.get("link_to_page", {})
+        link_data = block.payload
         page_id = ""
         
         if link_data.get("type") == "page_id":
@@ -507,7 +516,7 @@ class AdvancedBlockConverter:
     
     def _convert_table_of_contents_block(self, block: NotionBlock) -> str:
         """目次ブロックの代替表現変換"""
-        toc_data = block.content.get("table_of_contents", {})
+        toc_data = block.payload
         color = toc_data.get("color", "default")
         
         return f"📑 **目次**\n\n> この位置にページの目次が表示されます。\n> Markdownビューアーによっては自動的に目次が生成される場合があります。"
@@ -518,7 +527,7 @@ class AdvancedBlockConverter:
     
     def _convert_enhanced_callout_block(self, block: NotionBlock) -> str:
         """拡張コールアウトブロックの変換（色とスタイル対応）"""
-        callout_data = block.content.get("callout", {})
+        callout_data = block.payload
         text_content = self._extract_rich_text_from_content(callout_data.get("rich_text", []))
         icon = callout_data.get("icon", {})
         color = callout_data.get("color", "default")
@@ -554,7 +563,7 @@ class AdvancedBlockConverter:
     
     def _convert_enhanced_toggle_block(self, block: NotionBlock) -> str:
         """拡張トグルブロックの変換（折りたたみ可能なMarkdown）"""
-        text_content = self._extract_rich_text_from_block(block, "toggle")
+        text_content = self._extract_rich_text_from_content(block.rich_text)
         
         # 設定に応じて変換方法を変更
         if self.config.get_block_setting("toggle", "use_details_tag", True):
@@ -577,22 +586,20 @@ class AdvancedBlockConverter:
         # 警告システムに通知
         self.warning_system.warn_unsupported_block(block.type, f"ブロックID: {block.id}")
         
-        # 直接設定を確認
-        if self.config.unsupported_blocks == "skip":
-            return None
-        elif self.config.unsupported_blocks == "placeholder":
-            return f"<!-- サポートされていないブロック: {block.type} -->"
-        elif self.config.unsupported_blocks == "warning":
-            self.logger.warning(f"サポートされていないブロックタイプ: {block.type}")
-            return f"<!-- 警告: {block.type}ブロックはサポートされていません -->"
-        else:
-            return f"<!-- サポートされていないブロック: {block.type} -->"
+        return self._unsupported_handler(block)
     
-    def _extract_rich_text_from_block(self, block: NotionBlock, block_type: str) -> str:
-        """ブロックからリッチテキストを抽出"""
-        block_content = block.content.get(block_type, {})
-        rich_text_data = block_content.get("rich_text", [])
-        return self._extract_rich_text_from_content(rich_text_data)
+    def _skip_unsupported_block(self, block: NotionBlock) -> None:
+        """サポートされていないブロックを出力しない"""
+        return None
+    
+    def _placeholder_unsupported_block(self, block: NotionBlock) -> str:
+        """サポートされていないブロックをプレースホルダーに置き換える"""
+        return f"<!-- サポートされていないブロック: {block.type} -->"
+    
+    def _warn_unsupported_block(self, block: NotionBlock) -> str:
+        """サポートされていないブロックを警告付きのコメントに置き換える"""
+        self.logger.warning(f"サポートされていないブロックタイプ: {block.type}")
+        return f"<!-- 警告: {block.type}ブロックはサポートされていません -->"
     
     def _extract_rich_text_from_content(self, rich_text_data: List[Dict[str, Any]]) -> str:
         """リッチテキストデータからMarkdown形式のテキストを抽出"""
@@ -610,19 +617,14 @@ class AdvancedBlockConverter:
             href = text_item.get("href")
             
             # テキストの装飾を適用
-            formatted_text = plain_text
-            
-            if annotations.get("bold"):
-                formatted_text = f"**{formatted_text}**"
-            if annotations.get("italic"):
-                formatted_text = f"*{formatted_text}*"
-            if annotations.get("strikethrough"):
-                formatted_text = f"~~{formatted_text}~~"
-            if annotations.get("underline"):
-                # Markdownには下線がないため、HTMLタグを使用
-                formatted_text = f"<u>{formatted_text}</u>"
-            if annotations.get("code"):
-                formatted_text = f"`{formatted_text}`"
+            formatted_text = _format_annotated_text(
+                plain_text,
+                bool(annotations.get("bold")),
+                bool(annotations.get("italic")),
+                bool(annotations.get("strikethrough")),
+                bool(annotations.get("underline")),
+                bool(annotations.get("code"))
+            )
             
             # リンクの処理（高度なリンク処理を使用）
             if href:
@@ -8,12 +8,37 @@ import logging
 import os
 import hashlib
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Dict, List, Any, Optional, Set
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from pathlib import Path
 
 from models.config import ConversionConfig
 
+try:
+    import orjson
+except ImportError:  # オプション依存関係（未インストール時は標準jsonを使用）
+    orjson = None
+
+try:
+    import xxhash
+except ImportError:  # オプション依存関係（未インストール時はhashlib.blake2bを使用）
+    xxhash = None
+
+
+def _hash_text(text: str) -> str:
+    """変更検出用の非暗号学的ハッシュ（16進文字列）を計算"""
+    data = text.encode('utf-8')
+    if xxhash is not None:
+        return xxhash.xxh3_128_hexdigest(data)
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    """ISO 8601形式の日時文字列をパース（同期ごとに同じ値が繰り返し現れるためキャッシュする）"""
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
 
 @dataclass
 class PageCacheEntry:
@@ -29,7 +54,17 @@ class PageCacheEntry:
     
     def to_dict(self) -> Dict[str, Any]:
         """辞書形式に変換"""
-        return asdict(self)
+        # asdictは値を再帰的にコピーするため、フィールドを直接並べて組み立てる
+        return {
+            "page_id": self.page_id,
+            "title": self.title,
+            "last_edited_time": self.last_edited_time,
+            "content_hash": self.content_hash,
+            "file_path": self.file_path,
+            "cached_at": self.cached_at,
+            "properties_hash": self.properties_hash,
+            "block_count": self.block_count
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'PageCacheEntry':
@@ -64,10 +99,17 @@ class CacheManager:
         """キャッシュファイルを読み込み"""
         try:
             if self.cache_file.exists():
-                with open(self.cache_file, 'r', encoding='utf-8') as f:
-                    cache_data = json.load(f)
+                with open(self.cache_file, 'rb') as f:
+                    data = f.read()
+                cache_data = orjson.loads(data) if orjson is not None else json.loads(data)
                     
+                # 同じ値の文字列を共有し、大きなキャッシュの読み込み時のメモリを抑える
+                shared_strings: Dict[str, str] = {}
                 for page_id, entry_data in cache_data.items():
+                    entry_data["page_id"] = page_id
+                    last_edited_time = entry_data.get("last_edited_time")
+                    if last_edited_time is not None:
+                        entry_data["last_edited_time"] = shared_strings.setdefault(last_edited_time, last_edited_time)
                     self.cache[page_id] = PageCacheEntry.from_dict(entry_data)
                 
                 self.logger.info(f"キャッシュを読み込みました: {len(self.cache)}エントリ")
@@ -86,8 +128,15 @@ class CacheManager:
                 for page_id, entry in self.cache.items()
             }
             
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, ensure_ascii=False, indent=2)
+            # 書き込み途中で中断されてもキャッシュが壊れないよう一時ファイル経由で置き換える
+            temp_file = self.cache_file.with_suffix(".tmp")
+            if orjson is not None:
+                with open(temp_file, 'wb') as f:
+                    f.write(orjson.dumps(cache_data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    json.dump(cache_data, f, ensure_ascii=False, indent=2)
+            os.replace(temp_file, self.cache_file)
             
             self.logger.debug(f"キャッシュを保存しました: {len(self.cache)}エントリ")
             
@@ -186,13 +235,13 @@ class CacheManager:
         Returns:
             変更されたページのリスト
         """
+        # 最終編集時刻だけを比較するため、is_page_changedを経由せずキャッシュを直接参照する
+        cache = self.cache
         changed_pages = []
         
         for page_data in pages_data:
-            page_id = page_data.get('id')
-            last_edited_time = page_data.get('last_edited_time')
-            
-            if self.is_page_changed(page_id, last_edited_time):
+            cached_entry = cache.get(page_data.get('id'))
+            if cached_entry is None or cached_entry.last_edited_time != page_data.get('last_edited_time'):
                 changed_pages.append(page_data)
         
         self.logger.info(f"変更検出: {len(changed_pages)}/{len(pages_data)}ページが変更されています")
@@ -228,7 +277,7 @@ class CacheManager:
         
         for page_id, entry in self.cache.items():
             try:
-                cached_at = datetime.fromisoformat(entry.cached_at)
+                cached_at = _parse_iso(entry.cached_at)
                 if cached_at < cutoff_date:
                     old_entries.append(page_id)
             except ValueError:
@@ -265,7 +314,7 @@ class CacheManager:
         cached_times = []
         for entry in self.cache.values():
             try:
-                cached_times.append(datetime.fromisoformat(entry.cached_at))
+                cached_times.append(_parse_iso(entry.cached_at))
             except ValueError:
                 continue
         
@@ -288,9 +337,9 @@ class CacheManager:
             content: コンテンツ文字列
             
         Returns:
-            SHA256ハッシュ
+            ハッシュ値（16進文字列）
         """
-        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+        return _hash_text(content)
     
     def _calculate_properties_hash(self, properties: Dict[str, Any]) -> str:
         """
@@ -300,11 +349,11 @@ class CacheManager:
             properties: プロパティ辞書
             
         Returns:
-            SHA256ハッシュ
+            ハッシュ値（16進文字列）
         """
         # プロパティを正規化してハッシュ化
         normalized_props = json.dumps(properties, sort_keys=True, ensure_ascii=False)
-        return hashlib.sha256(normalized_props.encode('utf-8')).hexdigest()
+        return _hash_text(normalized_props)
     
     def export_cache_report(self) -> str:
         """
@@ -382,28 +431,30 @@ class ChangeDetector:
         Returns:
             変更検出結果
         """
-        current_page_ids = {page['id'] for page in current_pages}
-        cached_page_ids = set(self.cache_manager.cache.keys())
-        
-        # 新規ページ
-        new_pages = current_page_ids - cached_page_ids
+        cache = self.cache_manager.cache
+        current_times = {page['id']: page.get('last_edited_time', '') for page in current_pages}
         
-        # 削除されたページ
-        deleted_pages = cached_page_ids - current_page_ids
+        # 新規・削除ページは集合演算で求める
+        new_pages = current_times.keys() - cache.keys()
+        deleted_pages = cache.keys() - current_times.keys()
         
-        # 変更されたページ
+        # 両方に存在するページは最終編集時刻で変更・未変更に分類（現在のページ順を維持）
         modified_pages = []
-        for page in current_pages:
-            page_id = page['id']
-            if page_id in cached_page_ids:
-                if self.cache_manager.is_page_changed(page_id, page.get('last_edited_time', '')):
-                    modified_pages.append(page_id)
+        unchanged_pages = []
+        for page_id, last_edited_time in current_times.items():
+            cached_entry = cache.get(page_id)
+            if cached_entry is None:
+                continue
+            if cached_entry.last_edited_time != last_edited_time:
+                modified_pages.append(page_id)
+            else:
+                unchanged_pages.append(page_id)
         
         result = {
             "new": list(new_pages),
             "modified": modified_pages,
             "deleted": list(deleted_pages),
-            "unchanged": list(current_page_ids - set(new_pages) - set(modified_pages))
+            "unchanged": unchanged_pages
         }
         
         self.logger.info(f"変更検出結果: 新規={len(result['new'])}, "
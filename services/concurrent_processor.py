@@ -48,7 +48,7 @@ class RateLimiter:
         self.max_requests_per_second = max_requests_per_second
         self.burst_limit = burst_limit
         self.tokens = burst_limit
-        self.last_update = time.time()
+        self.last_update = time.monotonic()
         self.lock = asyncio.Lock()
         self.logger = logging.getLogger(__name__)
     
@@ -60,26 +60,28 @@ class RateLimiter:
             トークンを取得できた場合True
         """
         async with self.lock:
-            now = time.time()
-            time_passed = now - self.last_update
+            now = time.monotonic()
             
             # トークンを補充
             self.tokens = min(
                 self.burst_limit,
-                self.tokens + time_passed * self.max_requests_per_second
+                self.tokens + (now - self.last_update) * self.max_requests_per_second
             )
             self.last_update = now
             
             if self.tokens >= 1.0:
                 self.tokens -= 1.0
                 return True
-            else:
-                # 待機時間を計算
-                wait_time = (1.0 - self.tokens) / self.max_requests_per_second
-                self.logger.debug(f"レート制限により{wait_time:.2f}秒待機")
-                await asyncio.sleep(wait_time)
-                self.tokens = 0.0
-                return True
+            
+            # 不足分のトークンが貯まるまで1回だけ待機する
+            wait_time = (1.0 - self.tokens) / self.max_requests_per_second
+            self.logger.debug("レート制限により%.2f秒待機", wait_time)
+            await asyncio.sleep(wait_time)
+            
+            # 待機中に貯まったトークンは今回の取得で使い切ったため、補充の起点を待機終了時刻に進める
+            self.tokens = 0.0
+            self.last_update = now + wait_time
+            return True
     
     def get_wait_time(self) -> float:
         """
@@ -88,9 +90,11 @@ class RateLimiter:
         Returns:
             待機時間（秒）
         """
-        if self.tokens >= 1.0:
+        elapsed = max(0.0, time.monotonic() - self.last_update)
+        tokens = min(self.burst_limit, self.tokens + elapsed * self.max_requests_per_second)
+        if tokens >= 1.0:
             return 0.0
-        return (1.0 - self.tokens) / self.max_requests_per_second
+        return (1.0 - tokens) / self.max_requests_per_second
 
 
 class ConcurrentProcessor:
@@ -113,6 +117,9 @@ class ConcurrentProcessor:
         burst_limit = getattr(config, 'notion_api_burst_limit', 10)
         self.rate_limiter = RateLimiter(rate_limit, burst_limit)
         
+        # スレッド並行処理用のワーカープール（初回使用時に生成し、呼び出し間で再利用）
+        self._executor: Optional[ThreadPoolExecutor] = None
+        
         # 統計情報
         self.stats = {
             "total_processed": 0,
@@ -122,10 +129,31 @@ class ConcurrentProcessor:
             "average_time": 0.0
         }
     
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """
+        スレッド並行処理用のワーカープールを取得
+        
+        Returns:
+            共有ThreadPoolExecutor
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="page-process"
+            )
+        return self._executor
+    
+    def close(self):
+        """ワーカープールを終了"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+    
     async def process_pages_async(self, 
                                  pages: List[Dict[str, Any]], 
                                  processor_func: Callable[[Dict[str, Any]], Awaitable[Any]],
-                                 progress_callback: Optional[Callable[[int, int], None]] = None) -> List[ProcessingResult]:
+                                 progress_callback: Optional[Callable[[int, int], None]] = None,
+                                 progress_interval: int = 1) -> List[ProcessingResult]:
         """
         ページを非同期で並行処理
         
@@ -133,64 +161,70 @@ class ConcurrentProcessor:
             pages: 処理するページのリスト
             processor_func: 処理関数（非同期）
             progress_callback: 進捗コールバック関数
+            progress_interval: 進捗を通知する完了件数の間隔（最後の1件は必ず通知）
             
         Returns:
             処理結果のリスト
         """
-        start_time = time.time()
-        results = []
+        start_time = time.perf_counter()
+        total = len(pages)
         semaphore = asyncio.Semaphore(self.max_workers)
+        progress_interval = max(1, progress_interval)
+        completed = 0
+        next_report = progress_interval
+        
+        def report_progress() -> None:
+            """完了件数を数え、通知間隔に達したら進捗を通知"""
+            nonlocal completed, next_report
+            completed += 1
+            if completed >= next_report or completed == total:
+                progress_callback(completed, total)
+                next_report = completed + progress_interval
         
         async def process_single_page(page: Dict[str, Any]) -> ProcessingResult:
-            """単一ページの処理"""
+            """単一ページの処理（コールバックの例外はgatherを通じて呼び出し元に伝わる）"""
+            result = await process_page(page)
+            if progress_callback:
+                report_progress()
+            return result
+        
+        async def process_page(page: Dict[str, Any]) -> ProcessingResult:
+            """単一ページを処理して結果を作成"""
             async with semaphore:
                 # レート制限を適用
                 await self.rate_limiter.acquire()
                 
                 page_id = page.get('id', 'unknown')
-                page_start_time = time.time()
+                page_start_time = time.perf_counter()
                 
                 try:
                     result = await processor_func(page)
-                    processing_time = time.time() - page_start_time
-                    
                     return ProcessingResult(
                         page_id=page_id,
                         success=True,
                         result=result,
-                        processing_time=processing_time
+                        processing_time=time.perf_counter() - page_start_time
                     )
                     
                 except Exception as e:
-                    processing_time = time.time() - page_start_time
                     error_msg = str(e)
-                    self.logger.error(f"ページ処理エラー ({page_id}): {error_msg}")
+                    self.logger.error("ページ処理エラー (%s): %s", page_id, error_msg)
                     
                     return ProcessingResult(
                         page_id=page_id,
                         success=False,
                         error=error_msg,
-                        processing_time=processing_time
+                        processing_time=time.perf_counter() - page_start_time
                     )
         
-        # 全ページを並行処理
-        tasks = [process_single_page(page) for page in pages]
-        completed = 0
-        
-        for coro in asyncio.as_completed(tasks):
-            result = await coro
-            results.append(result)
-            completed += 1
-            
-            # 進捗コールバック
-            if progress_callback:
-                progress_callback(completed, len(pages))
+        # 全ページをgatherで一括して待機する
+        results = list(await asyncio.gather(*(process_single_page(page) for page in pages)))
         
         # 統計情報を更新
-        total_time = time.time() - start_time
+        total_time = time.perf_counter() - start_time
         self._update_stats(results, total_time)
         
-        self.logger.info(f"並行処理完了: {len(pages)}ページ, {total_time:.2f}秒")
+        self.logger.info("並行処理完了: %dページ, %.2f秒", total, total_time)
         return results
     
     def process_pages_threaded(self, 
@@ -208,13 +242,13 @@ class ConcurrentProcessor:
         Returns:
             処理結果のリスト
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         results = []
         
         def process_single_page(page: Dict[str, Any]) -> ProcessingResult:
             """単一ページの処理"""
             page_id = page.get('id', 'unknown')
-            page_start_time = time.time()
+            page_start_time = time.perf_counter()
             
             try:
                 # 同期的なレート制限（簡易版）
@@ -223,7 +257,7 @@ class ConcurrentProcessor:
                     time.sleep(wait_time)
                 
                 result = processor_func(page)
-                processing_time = time.time() - page_start_time
+                processing_time = time.perf_counter() - page_start_time
                 
                 return ProcessingResult(
                     page_id=page_id,
@@ -233,7 +267,7 @@ class ConcurrentProcessor:
                 )
                 
             except Exception as e:
-                processing_time = time.time() - page_start_time
+                processing_time = time.perf_counter() - page_start_time
                 error_msg = str(e)
                 self.logger.error(f"ページ処理エラー ({page_id}): {error_msg}")
                 
@@ -244,22 +278,22 @@ class ConcurrentProcessor:
                     processing_time=processing_time
                 )
         
-        # スレッドプールで並行処理
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_page = {executor.submit(process_single_page, page): page for page in pages}
-            completed = 0
+        # スレッドプールで並行処理（プールは呼び出し間で共有）
+        executor = self._get_executor()
+        futures = [executor.submit(process_single_page, page) for page in pages]
+        completed = 0
+        
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            completed += 1
             
-            for future in as_completed(future_to_page):
-                result = future.result()
-                results.append(result)
-                completed += 1
-                
-                # 進捗コールバック
-                if progress_callback:
-                    progress_callback(completed, len(pages))
+            # 進捗コールバック
+            if progress_callback:
+                progress_callback(completed, len(pages))
         
         # 統計情報を更新
-        total_time = time.time() - start_time
+        total_time = time.perf_counter() - start_time
         self._update_stats(results, total_time)
         
         self.logger.info(f"スレッド並行処理完了: {len(pages)}ページ, {total_time:.2f}秒")
@@ -343,18 +377,21 @@ class ConcurrentProcessor:
     
     def _update_stats(self, results: List[ProcessingResult], total_time: float):
         """統計情報を更新"""
-        successful = sum(1 for r in results if r.success)
-        failed = len(results) - successful
-        
-        self.stats.update({
-            "total_processed": self.stats["total_processed"] + len(results),
-            "successful": self.stats["successful"] + successful,
-            "failed": self.stats["failed"] + failed,
-            "total_time": self.stats["total_time"] + total_time,
-        })
-        
-        if self.stats["total_processed"] > 0:
-            self.stats["average_time"] = self.stats["total_time"] / self.stats["total_processed"]
+        # 結果は1回だけ走査し、集計値はローカル変数で扱う
+        successful = 0
+        for r in results:
+            if r.success:
+                successful += 1
+        processed = len(results)
+        
+        stats = self.stats
+        stats["total_processed"] += processed
+        stats["successful"] += successful
+        stats["failed"] += processed - successful
+        stats["total_time"] += total_time
+        
+        if stats["total_processed"] > 0:
+            stats["average_time"] = stats["total_time"] / stats["total_processed"]
     
     def get_processing_stats(self) -> Dict[str, Any]:
         """
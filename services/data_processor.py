@@ -10,7 +10,7 @@ from datetime import datetime
 
 from models.notion import (
     NotionPage, NotionPageContent, NotionBlock, NotionProperty, 
-    NotionRichText, NotionBlockType
+    NotionRichText, NotionBlockType, join_plain_text
 )
 from models.markdown import MarkdownFile, MarkdownConversionResult
 from models.config import ConversionConfig
@@ -115,13 +115,13 @@ class DataProcessor:
         """タイトルプロパティの抽出"""
         if not value:
             return ""
-        return "".join([item.get("plain_text", "") for item in value])
+        return join_plain_text(value)
     
     def _extract_rich_text_property(self, value: List[Dict[str, Any]]) -> str:
         """リッチテキストプロパティの抽出"""
         if not value:
             return ""
-        return "".join([item.get("plain_text", "") for item in value])
+        return join_plain_text(value)
     
     def _extract_select_property(self, value: Optional[Dict[str, Any]]) -> Optional[str]:
         """選択プロパティの抽出"""
@@ -5,7 +5,7 @@ Notionリンクと参照の処理システム
 
 import logging
 import re
-from typing import Dict, List, Any, Optional, Set, Tuple
+from typing import Dict, List, Any, Optional, Tuple, KeysView
 from urllib.parse import urlparse, parse_qs
 from dataclasses import dataclass
 
@@ -35,12 +35,12 @@ class PageReference:
 class NotionLinkProcessor:
     """Notionリンク処理システム"""
     
-    # Notion URLパターン
+    # Notion URLパターン（IDはASCIIのみのためre.ASCIIで照合）
     NOTION_URL_PATTERNS = {
-        'database': re.compile(r'https://(?:www\.)?notion\.so/([a-zA-Z0-9\-]+)\?v=([a-zA-Z0-9\-]+)'),
-        'block': re.compile(r'https://(?:www\.)?notion\.so/([a-zA-Z0-9\-]+)#([a-zA-Z0-9\-]+)'),
-        'page': re.compile(r'https://(?:www\.)?notion\.so/([a-zA-Z0-9\-]+)/([a-zA-Z0-9\-]+)'),
-        'page_short': re.compile(r'https://(?:www\.)?notion\.so/([a-zA-Z0-9\-]+)$')
+        'database': re.compile(r'https://(?:www\.)?notion\.so/([a-zA-Z0-9\-]+)\?v=([a-zA-Z0-9\-]+)', re.ASCII),
+        'block': re.compile(r'https://(?:www\.)?notion\.so/([a-zA-Z0-9\-]+)#([a-zA-Z0-9\-]+)', re.ASCII),
+        'page': re.compile(r'https://(?:www\.)?notion\.so/([a-zA-Z0-9\-]+)/([a-zA-Z0-9\-]+)', re.ASCII),
+        'page_short': re.compile(r'https://(?:www\.)?notion\.so/([a-zA-Z0-9\-]+)$', re.ASCII)
     }
     
     def __init__(self, config: ConversionConfig):
@@ -53,9 +53,14 @@ class NotionLinkProcessor:
         self.config = config
         self.logger = logging.getLogger(__name__)
         self.page_registry: Dict[str, PageReference] = {}
-        self.broken_links: Set[str] = set()
+        self._broken_refs: Dict[str, LinkReference] = {}
         self.processed_links: Dict[str, LinkReference] = {}
     
+    @property
+    def broken_links(self) -> KeysView[str]:
+        """壊れたリンクのURL一覧（_broken_refsのキービュー）"""
+        return self._broken_refs.keys()
+    
     def register_page(self, page_id: str, title: str, url: str, is_accessible: bool = True):
         """
         ページをレジストリに登録
@@ -106,8 +111,8 @@ class NotionLinkProcessor:
             リンク参照情報
         """
         try:
-            # 外部リンクかどうかを確認
-            if not self._is_notion_url(url):
+            # 外部リンクかどうかを確認（_is_notion_urlと同じ判定をインライン化）
+            if "notion.so" not in url.lower():
                 return LinkReference(
                     original_url=url,
                     link_type="external",
@@ -217,14 +222,15 @@ class NotionLinkProcessor:
             )
         else:
             # 未知のページ
-            self.broken_links.add(url)
-            return LinkReference(
+            link_ref = LinkReference(
                 original_url=url,
                 link_type="page",
                 target_id=page_id,
                 is_valid=False,
                 error_message="参照先ページが見つかりません"
             )
+            self._broken_refs[url] = link_ref
+            return link_ref
     
     def _create_database_link_reference(self, url: str, database_id: str, context: str) -> LinkReference:
         """
@@ -249,14 +255,15 @@ class NotionLinkProcessor:
             )
         else:
             # 未知のデータベース
-            self.broken_links.add(url)
-            return LinkReference(
+            link_ref = LinkReference(
                 original_url=url,
                 link_type="database",
                 target_id=database_id,
                 is_valid=False,
                 error_message="参照先データベースが見つかりません"
             )
+            self._broken_refs[url] = link_ref
+            return link_ref
     
     def _create_block_link_reference(self, url: str, page_id: str, block_id: str, context: str) -> LinkReference:
         """
@@ -282,14 +289,15 @@ class NotionLinkProcessor:
             )
         else:
             # 未知のページ
-            self.broken_links.add(url)
-            return LinkReference(
+            link_ref = LinkReference(
                 original_url=url,
                 link_type="block",
                 target_id=f"{page_id}#{block_id}",
                 is_valid=False,
                 error_message="参照先ページが見つかりません"
             )
+            self._broken_refs[url] = link_ref
+            return link_ref
     
     def convert_link_to_markdown(self, link_ref: LinkReference, display_text: str = "") -> str:
         """
@@ -506,22 +514,14 @@ class NotionLinkProcessor:
             ""
         ]
         
-        for i, broken_url in enumerate(sorted(self.broken_links), 1):
-            link_ref = self.processed_links.get(broken_url)
-            if link_ref:
-                report_lines.extend([
-                    f"## {i}. {link_ref.link_type}リンク",
-                    f"- **URL**: {broken_url}",
-                    f"- **エラー**: {link_ref.error_message}",
-                    f"- **対象ID**: {link_ref.target_id or '不明'}",
-                    ""
-                ])
-            else:
-                report_lines.extend([
-                    f"## {i}. 不明なリンク",
-                    f"- **URL**: {broken_url}",
-                    ""
-                ])
+        for i, (broken_url, link_ref) in enumerate(sorted(self._broken_refs.items()), 1):
+            report_lines.extend([
+                f"## {i}. {link_ref.link_type}リンク",
+                f"- **URL**: {broken_url}",
+                f"- **エラー**: {link_ref.error_message}",
+                f"- **対象ID**: {link_ref.target_id or '不明'}",
+                ""
+            ])
         
         report_lines.extend([
             "## 対処方法",
@@ -4,19 +4,82 @@ Notion APIとの通信を管理するクライアントクラス
 """
 
 import time
+import sys
+import random
 import logging
-from typing import Dict, List, Any, Optional
-from datetime import datetime
-import requests
+import threading
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Any, Optional, Tuple, Iterator
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import httpx
 from notion_client import Client
 from notion_client.errors import APIResponseError, RequestTimeoutError
 
+try:
+    import orjson
+except ImportError:  # オプション依存関係（未インストール時は標準jsonでパース）
+    orjson = None
+
+try:
+    import h2  # noqa: F401  httpxのHTTP/2サポートに必要
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 from models.notion import (
     NotionPage, NotionPageContent, NotionBlock, NotionProperty, 
-    NotionDatabase, NotionRichText
+    NotionDatabase, NotionRichText, join_plain_text
 )
 
 
+# プロパティ値が存在しない場合のデフォルト値（タイプ別）
+# ここにないタイプはNoneを返す
+_PROPERTY_DEFAULT_FACTORIES = {
+    "title": list,
+    "rich_text": list,
+    "multi_select": list,
+    "people": list,
+    "files": list,
+    "relation": list,
+    "checkbox": bool,
+    "formula": dict,
+    "rollup": dict,
+}
+
+
+if sys.version_info >= (3, 11):
+    # 3.11以降のfromisoformatは末尾の"Z"をそのまま受け付ける
+    _fromisoformat = datetime.fromisoformat
+else:
+    def _fromisoformat(datetime_str: str) -> datetime:
+        """ISO形式の日時文字列をパース（"Z"を+00:00に置換）"""
+        return datetime.fromisoformat(datetime_str.replace('Z', '+00:00'))
+
+# 同じタイムスタンプの再パースを避けるためキャッシュ
+_parse_iso_datetime = lru_cache(maxsize=4096)(_fromisoformat)
+
+
+# NotionBlockのフィールドに展開済みのため、contentには保持しないキー
+_PROJECTED_BLOCK_KEYS = frozenset({
+    "id", "type", "has_children", "archived", "created_time",
+    "last_edited_time", "created_by", "last_edited_by", "parent",
+})
+
+# 子ブロックが別ページ・別データベースの中身であり、ページ本文として展開しないブロックタイプ
+_DETACHED_CHILDREN_BLOCK_TYPES = frozenset({"child_page", "child_database"})
+
+
+class _NotionHTTPClient(Client):
+    """成功レスポンスをorjsonでパースするnotion_clientクライアント"""
+    
+    def _parse_response(self, response: httpx.Response) -> Any:
+        if orjson is None or not response.is_success:
+            return super()._parse_response(response)
+        return orjson.loads(response.content)
+
+
 class NotionAPIError(Exception):
     """Notion API関連のエラー"""
     pass
@@ -24,19 +87,33 @@ class NotionAPIError(Exception):
 
 class NotionRateLimitError(NotionAPIError):
     """レート制限エラー"""
-    pass
+    
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        """
+        初期化
+        
+        Args:
+            message: エラーメッセージ
+            retry_after: サーバーが指定した再試行までの秒数（Retry-Afterヘッダー）
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
 
 
 class NotionClient:
     """Notion APIクライアント"""
     
-    def __init__(self, api_token: str, database_id: str):
+    def __init__(self, api_token: str, database_id: str, max_concurrent_requests: int = 3,
+                 rate_limit_capacity: float = 3.0, rate_limit_refill_rate: float = 3.0):
         """
         初期化
         
         Args:
             api_token: Notion APIトークン
             database_id: 対象のデータベースID
+            max_concurrent_requests: 複数ページ取得時の最大同時リクエスト数
+            rate_limit_capacity: トークンバケットの容量（許容するバースト数）
+            rate_limit_refill_rate: 1秒あたりのトークン補充数（長期的なリクエスト上限）
         """
         if not api_token:
             raise ValueError("Notion APIトークンが必要です")
@@ -45,32 +122,97 @@ class NotionClient:
         
         self.api_token = api_token
         self.database_id = database_id
-        self.client = Client(auth=api_token)
+        self.max_concurrent_requests = max(1, max_concurrent_requests)
         self.logger = logging.getLogger(__name__)
         
-        # レート制限管理
-        self.last_request_time = 0
-        self.min_request_interval = 0.34  # 約3リクエスト/秒
+        # プロセス内で共有するコネクションプール
+        # ページ取得スレッドと子ブロック取得用プールが同時に接続を使うため、
+        # 双方の並行数+先読み分を維持し、プール待ちで直列化されないようにする
+        # 接続確立の失敗はトランスポート層で再試行する
+        pool_size = self.max_concurrent_requests * 2 + 1
+        self.transport_retries = 2
+        self.client = _NotionHTTPClient(
+            auth=api_token,
+            client=httpx.Client(
+                transport=httpx.HTTPTransport(
+                    http2=HTTP2_AVAILABLE,
+                    limits=httpx.Limits(
+                        max_connections=pool_size,
+                        max_keepalive_connections=pool_size
+                    ),
+                    retries=self.transport_retries
+                )
+            )
+        )
+        
+        # レート制限管理（トークンバケット: 約3リクエスト/秒）
+        self.rate_limit_capacity = rate_limit_capacity
+        self.rate_limit_refill_rate = rate_limit_refill_rate
+        self._bucket_tokens = rate_limit_capacity
+        self._bucket_last = time.monotonic()
+        self._rate_limit_lock = threading.Lock()
+        
+        # 429の発生状況に応じてリクエスト間隔を調整（AIMD）
+        self._min_request_interval = 1.0 / rate_limit_refill_rate
+        self._max_request_interval = max(2.0, self._min_request_interval)
+        self._current_interval = self._min_request_interval
         self.max_retries = 3
         self.base_retry_delay = 1.0
+        
+        # データベース情報のキャッシュ（取得時刻, APIレスポンス）
+        self._db_info_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._db_info_ttl = 300.0
+        
+        # 子ブロック取得用の共有ワーカープール
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=self.max_concurrent_requests,
+            thread_name_prefix="notion-io"
+        )
+    
+    def close(self) -> None:
+        """子ブロック取得用のワーカープールとHTTPコネクションプールを終了"""
+        self._io_pool.shutdown(wait=True)
+        self.client.close()
+    
+    def __enter__(self) -> "NotionClient":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
     
     def _wait_for_rate_limit(self) -> None:
-        """レート制限を考慮した待機"""
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
-        
-        if time_since_last_request < self.min_request_interval:
-            sleep_time = self.min_request_interval - time_since_last_request
+        """トークンバケットでレート制限を考慮した待機（複数スレッドから呼ばれても安全）"""
+        while True:
+            with self._rate_limit_lock:
+                now = time.monotonic()
+                elapsed = now - self._bucket_last
+                self._bucket_last = now
+                
+                # 経過時間分のトークンを補充（補充速度は現在のリクエスト間隔に従う）
+                refill_rate = 1.0 / self._current_interval
+                self._bucket_tokens = min(
+                    self.rate_limit_capacity,
+                    self._bucket_tokens + elapsed * refill_rate
+                )
+                
+                if self._bucket_tokens >= 1.0:
+                    self._bucket_tokens -= 1.0
+                    return
+                
+                sleep_time = (1.0 - self._bucket_tokens) / refill_rate
+            
+            # ロックを解放してから待機し、他スレッドの補充計算を妨げない
             self.logger.debug(f"レート制限のため{sleep_time:.2f}秒待機")
             time.sleep(sleep_time)
-        
-        self.last_request_time = time.time()
     
     def _handle_api_error(self, error: Exception, operation: str) -> None:
         """APIエラーのハンドリング"""
         if isinstance(error, APIResponseError):
             if error.status == 429:  # Too Many Requests
-                raise NotionRateLimitError(f"レート制限に達しました: {operation}")
+                raise NotionRateLimitError(
+                    f"レート制限に達しました: {operation}",
+                    retry_after=self._parse_retry_after(error)
+                )
             elif error.status == 401:
                 raise NotionAPIError(f"認証エラー: APIトークンを確認してください")
             elif error.status == 404:
@@ -82,23 +224,96 @@ class NotionClient:
         else:
             raise NotionAPIError(f"予期しないエラー: {operation} - {str(error)}")
     
+    def _parse_retry_after(self, error: Exception) -> Optional[float]:
+        """
+        エラーレスポンスのRetry-Afterヘッダーを秒数に変換
+        
+        Args:
+            error: APIエラー
+            
+        Returns:
+            待機秒数（ヘッダーがない、または解析できない場合はNone）
+        """
+        if isinstance(error, NotionRateLimitError):
+            return error.retry_after
+        
+        headers = getattr(error, "headers", None)
+        if not headers:
+            return None
+        
+        value = headers.get("Retry-After")
+        if not value:
+            return None
+        
+        try:
+            # 秒数形式
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        
+        try:
+            # HTTP日付形式
+            retry_at = parsedate_to_datetime(value)
+            if retry_at.tzinfo is None:
+                retry_at = retry_at.replace(tzinfo=timezone.utc)
+            return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            self.logger.debug(f"Retry-Afterヘッダーの解析に失敗: {value}")
+            return None
+    
+    def _is_rate_limit_error(self, error: Exception) -> bool:
+        """レート制限（429）エラーかどうかを判定"""
+        if isinstance(error, NotionRateLimitError):
+            return True
+        return isinstance(error, APIResponseError) and error.status == 429
+    
+    def _on_rate_limited(self) -> None:
+        """
+        レート制限到達時の処理
+        
+        トークンを空にして他スレッドのリクエストも抑制し、
+        リクエスト間隔を乗算的に広げる
+        """
+        with self._rate_limit_lock:
+            self._bucket_tokens = 0.0
+            self._bucket_last = time.monotonic()
+            self._current_interval = min(self._max_request_interval, self._current_interval * 1.5)
+    
+    def _on_request_success(self) -> None:
+        """リクエスト成功時にリクエスト間隔を加算的に元へ戻す"""
+        if self._current_interval <= self._min_request_interval:
+            return
+        with self._rate_limit_lock:
+            self._current_interval = max(self._min_request_interval, self._current_interval - 0.01)
+    
     def _retry_with_backoff(self, func, *args, **kwargs):
-        """指数バックオフでリトライ"""
+        """リトライ（レート制限時はRetry-Afterを優先し、なければ指数バックオフ）"""
         for attempt in range(self.max_retries):
             try:
                 self._wait_for_rate_limit()
-                return func(*args, **kwargs)
-            except NotionRateLimitError:
-                if attempt == self.max_retries - 1:
-                    raise
-                delay = self.base_retry_delay * (2 ** attempt)
-                self.logger.warning(f"レート制限のため{delay}秒待機してリトライ (試行 {attempt + 1}/{self.max_retries})")
-                time.sleep(delay)
+                result = func(*args, **kwargs)
+                self._on_request_success()
+                return result
             except Exception as e:
-                if attempt == self.max_retries - 1:
+                # 接続エラーはトランスポート層で再試行済みのため、ここでは再試行しない
+                if attempt == self.max_retries - 1 or isinstance(e, httpx.ConnectError):
                     raise
-                self.logger.warning(f"リトライ {attempt + 1}/{self.max_retries}: {str(e)}")
-                time.sleep(self.base_retry_delay)
+                
+                if self._is_rate_limit_error(e):
+                    retry_after = self._parse_retry_after(e)
+                    if retry_after is not None:
+                        delay = retry_after
+                    else:
+                        delay = self.base_retry_delay * (2 ** attempt)
+                    # 同時に再試行が集中しないようジッターを加える
+                    delay += random.uniform(0, 0.25 * delay)
+                    self._on_rate_limited()
+                    self.logger.warning(f"レート制限のため{delay:.2f}秒待機してリトライ (試行 {attempt + 1}/{self.max_retries})")
+                else:
+                    delay = self.base_retry_delay
+                    self.logger.warning(f"リトライ {attempt + 1}/{self.max_retries}: {str(e)}")
+                
+                time.sleep(delay)
     
     def test_connection(self) -> bool:
         """
@@ -108,13 +323,36 @@ class NotionClient:
             接続が成功した場合True
         """
         try:
-            self._retry_with_backoff(self.client.databases.retrieve, self.database_id)
+            self._retrieve_database()
             self.logger.info("Notion API接続テスト成功")
             return True
         except Exception as e:
             self.logger.error(f"Notion API接続テスト失敗: {str(e)}")
             return False
     
+    def _retrieve_database(self) -> Dict[str, Any]:
+        """
+        データベース情報のAPIレスポンスを取得（TTL付きキャッシュ）
+        
+        Returns:
+            databases.retrieveのレスポンス
+        """
+        if self._db_info_cache is not None:
+            cached_at, response = self._db_info_cache
+            if time.monotonic() - cached_at < self._db_info_ttl:
+                return response
+        
+        response = self._retry_with_backoff(
+            self.client.databases.retrieve,
+            self.database_id
+        )
+        self._db_info_cache = (time.monotonic(), response)
+        return response
+    
+    def invalidate_database_info(self) -> None:
+        """データベース情報のキャッシュを破棄（スキーマ変更後などに使用）"""
+        self._db_info_cache = None
+    
     def get_database_info(self) -> NotionDatabase:
         """
         データベース情報を取得
@@ -123,18 +361,10 @@ class NotionClient:
             NotionDatabaseオブジェクト
         """
         try:
-            response = self._retry_with_backoff(
-                self.client.databases.retrieve, 
-                self.database_id
-            )
+            response = self._retrieve_database()
             
             # タイトルの抽出
-            title = ""
-            if response.get("title"):
-                title = "".join([
-                    item.get("plain_text", "") 
-                    for item in response["title"]
-                ])
+            title = join_plain_text(response.get("title") or [])
             
             # 説明の抽出
             description = []
@@ -186,43 +416,9 @@ class NotionClient:
             NotionPageオブジェクトのリスト
         """
         pages = []
-        has_more = True
-        next_cursor = None
         
         try:
-            while has_more:
-                query_params = {
-                    "database_id": self.database_id,
-                    "page_size": min(page_size, 100)  # APIの制限
-                }
-                
-                if next_cursor:
-                    query_params["start_cursor"] = next_cursor
-                
-                # フィルター条件を追加
-                if filter_dict:
-                    query_params["filter"] = filter_dict
-                # Note: archivedはページレベルのプロパティのため、
-                # データベースクエリではフィルターできません。
-                # 取得後にPythonコードでフィルタリングします。
-                
-                # ソート条件を追加
-                if sorts:
-                    query_params["sorts"] = sorts
-                else:
-                    # デフォルトで最終編集日時の降順
-                    query_params["sorts"] = [
-                        {
-                            "timestamp": "last_edited_time",
-                            "direction": "descending"
-                        }
-                    ]
-                
-                response = self._retry_with_backoff(
-                    self.client.databases.query,
-                    **query_params
-                )
-                
+            for response in self._iter_raw_results(page_size, filter_dict, sorts):
                 # ページを変換
                 for page_data in response.get("results", []):
                     page = self._convert_to_notion_page(page_data)
@@ -231,9 +427,6 @@ class NotionClient:
                         continue
                     pages.append(page)
                 
-                has_more = response.get("has_more", False)
-                next_cursor = response.get("next_cursor")
-                
                 self.logger.debug(f"取得済みページ数: {len(pages)}")
             
             self.logger.info(f"データベースから{len(pages)}ページを取得しました")
@@ -242,6 +435,70 @@ class NotionClient:
         except Exception as e:
             self._handle_api_error(e, "データベースページ取得")
     
+    def _iter_raw_results(self,
+                          page_size: int = 100,
+                          filter_dict: Optional[Dict[str, Any]] = None,
+                          sorts: Optional[List[Dict[str, Any]]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        データベースクエリのレスポンスをページネーションに沿って順次取得
+        
+        呼び出し側が現在のレスポンスを処理している間に次ページを先読みする
+        
+        Args:
+            page_size: 1回のリクエストで取得するページ数
+            filter_dict: フィルター条件
+            sorts: ソート条件
+            
+        Yields:
+            databases.queryのレスポンス
+        """
+        query_params = {
+            "database_id": self.database_id,
+            "page_size": min(page_size, 100)  # APIの制限
+        }
+        
+        # フィルター条件を追加
+        if filter_dict:
+            query_params["filter"] = filter_dict
+        # Note: archivedはページレベルのプロパティのため、
+        # データベースクエリではフィルターできません。
+        # 取得後にPythonコードでフィルタリングします。
+        
+        # ソート条件を追加
+        if sorts:
+            query_params["sorts"] = sorts
+        else:
+            # デフォルトで最終編集日時の降順
+            query_params["sorts"] = [
+                {
+                    "timestamp": "last_edited_time",
+                    "direction": "descending"
+                }
+            ]
+        
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+            response = self._retry_with_backoff(
+                self.client.databases.query,
+                **query_params
+            )
+            
+            while True:
+                next_future = None
+                next_cursor = response.get("next_cursor")
+                if response.get("has_more", False) and next_cursor:
+                    next_future = prefetcher.submit(
+                        self._retry_with_backoff,
+                        self.client.databases.query,
+                        **query_params,
+                        start_cursor=next_cursor
+                    )
+                
+                yield response
+                
+                if next_future is None:
+                    return
+                response = next_future.result()
+    
     def get_pages_by_title(self, title_pattern: str) -> List[NotionPage]:
         """
         タイトルでページを検索
@@ -253,19 +510,57 @@ class NotionClient:
             マッチしたNotionPageオブジェクトのリスト
         """
         try:
-            # タイトルプロパティでフィルター
-            filter_dict = {
-                "property": "title",  # 実際のタイトルプロパティ名に応じて調整が必要
-                "rich_text": {
-                    "contains": title_pattern
-                }
-            }
-            
-            return self.get_database_pages(filter_dict=filter_dict)
+            return self.get_database_pages(filter_dict=self._build_title_filter(title_pattern))
             
         except Exception as e:
             self._handle_api_error(e, f"タイトル検索: {title_pattern}")
     
+    def get_pages_by_titles(self, title_patterns: List[str], 
+                           chunk_size: int = 20) -> Dict[str, List[NotionPage]]:
+        """
+        複数のタイトルパターンでページを一括検索
+        
+        パターンをOR条件でまとめたクエリで取得し、結果をパターンごとに振り分ける。
+        リンク解決などで多数のタイトルを検索する場合に、パターン数分のクエリを
+        chunk_size件ごとの1クエリにまとめられる
+        
+        Args:
+            title_patterns: 検索するタイトルパターンのリスト
+            chunk_size: 1回のクエリにまとめるパターン数
+            
+        Returns:
+            パターンをキー、マッチしたNotionPageオブジェクトのリストを値とする辞書
+        """
+        results: Dict[str, List[NotionPage]] = {pattern: [] for pattern in title_patterns}
+        patterns = list(results)
+        
+        try:
+            for i in range(0, len(patterns), chunk_size):
+                chunk = patterns[i:i + chunk_size]
+                filter_dict = {"or": [self._build_title_filter(pattern) for pattern in chunk]}
+                
+                # Notionのcontainsは大文字小文字を区別しないため、振り分けも同様に行う
+                folded_chunk = [(pattern, pattern.casefold()) for pattern in chunk]
+                for page in self.get_database_pages(filter_dict=filter_dict):
+                    folded_title = page.title.casefold()
+                    for pattern, folded_pattern in folded_chunk:
+                        if folded_pattern in folded_title:
+                            results[pattern].append(page)
+            
+            return results
+            
+        except Exception as e:
+            self._handle_api_error(e, f"タイトル一括検索: {len(patterns)}件")
+    
+    def _build_title_filter(self, title_pattern: str) -> Dict[str, Any]:
+        """タイトル検索用のフィルター条件を作成"""
+        return {
+            "property": "title",  # 実際のタイトルプロパティ名に応じて調整が必要
+            "rich_text": {
+                "contains": title_pattern
+            }
+        }
+    
     def get_pages_modified_after(self, after_date: datetime) -> List[NotionPage]:
         """
         指定日時以降に更新されたページを取得
@@ -289,49 +584,69 @@ class NotionClient:
         except Exception as e:
             self._handle_api_error(e, f"更新日時フィルター: {after_date}")
     
-    def get_page_count(self) -> int:
+    def get_page_count(self, archived: bool = False) -> int:
         """
         データベース内のページ数を取得
         
+        Notion APIは総数を直接提供しないため、ページネーションを辿って
+        レスポンスの件数を数える（NotionPageオブジェクトは生成しない）
+        
+        Args:
+            archived: アーカイブされたページも数えるかどうか
+            
         Returns:
             ページ数
         """
         try:
-            # 最小限のデータで1ページだけ取得してカウント情報を得る
-            response = self._retry_with_backoff(
-                self.client.databases.query,
-                database_id=self.database_id,
-                page_size=1
-            )
-            
-            # 正確なカウントを得るために全ページを取得
-            # （Notion APIは総数を直接提供しないため）
-            pages = self.get_database_pages()
-            return len(pages)
+            count = 0
+            for response in self._iter_raw_results():
+                results = response.get("results", [])
+                if archived:
+                    count += len(results)
+                else:
+                    count += sum(1 for page_data in results if not page_data.get("archived", False))
+            return count
             
         except Exception as e:
             self._handle_api_error(e, "ページ数取得")
     
-    def get_pages_in_batches(self, batch_size: int = 10) -> List[List[NotionPage]]:
+    def get_pages_in_batches(self, batch_size: int = 10, archived: bool = False) -> Iterator[List[NotionPage]]:
         """
-        ページをバッチ単位で取得
+        ページをバッチ単位で順次取得
+        
+        全ページの取得を待たず、batch_size件揃った時点でバッチを返す
         
         Args:
             batch_size: バッチサイズ
+            archived: アーカイブされたページも含めるかどうか
             
-        Returns:
-            バッチごとに分割されたNotionPageオブジェクトのリスト
+        Yields:
+            NotionPageオブジェクトのバッチ
         """
         try:
-            all_pages = self.get_database_pages()
-            batches = []
+            batch = []
+            total_pages = 0
+            batch_count = 0
             
-            for i in range(0, len(all_pages), batch_size):
-                batch = all_pages[i:i + batch_size]
-                batches.append(batch)
+            for response in self._iter_raw_results():
+                for page_data in response.get("results", []):
+                    # archivedフィルタリング（変換前に判定）
+                    if not archived and page_data.get("archived", False):
+                        continue
+                    batch.append(self._convert_to_notion_page(page_data))
+                    
+                    if len(batch) >= batch_size:
+                        total_pages += len(batch)
+                        batch_count += 1
+                        yield batch
+                        batch = []
+            
+            if batch:
+                total_pages += len(batch)
+                batch_count += 1
+                yield batch
             
-            self.logger.info(f"{len(all_pages)}ページを{len(batches)}バッチに分割しました")
-            return batches
+            self.logger.info(f"{total_pages}ページを{batch_count}バッチで取得しました")
             
         except Exception as e:
             self._handle_api_error(e, f"バッチ取得 (サイズ: {batch_size})")
@@ -375,17 +690,30 @@ class NotionClient:
         Returns:
             NotionPageContentオブジェクトのリスト
         """
-        contents = []
+        results: List[Optional[NotionPageContent]] = [None] * len(page_ids)
+        completed = 0
         
-        for i, page_id in enumerate(page_ids):
-            try:
-                content = self.get_page_content(page_id, include_children)
-                contents.append(content)
-                self.logger.debug(f"ページコンテンツ取得完了: {i+1}/{len(page_ids)}")
-            except Exception as e:
-                self.logger.error(f"ページコンテンツ取得失敗 (ID: {page_id}): {str(e)}")
-                # エラーが発生しても他のページの処理を継続
-                continue
+        # I/O待ちが支配的なため、スレッドプールで並行取得する
+        # （リクエスト間隔は_wait_for_rate_limitで全スレッド共通に制御）
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_requests) as executor:
+            future_to_index = {
+                executor.submit(self.get_page_content, page_id, include_children): i
+                for i, page_id in enumerate(page_ids)
+            }
+            
+            for future in as_completed(future_to_index):
+                index = future_to_index[future]
+                try:
+                    results[index] = future.result()
+                    completed += 1
+                    self.logger.debug(f"ページコンテンツ取得完了: {completed}/{len(page_ids)}")
+                except Exception as e:
+                    self.logger.error(f"ページコンテンツ取得失敗 (ID: {page_ids[index]}): {str(e)}")
+                    # エラーが発生しても他のページの処理を継続
+                    continue
+        
+        # 入力順を維持して返す
+        contents = [content for content in results if content is not None]
         
         self.logger.info(f"{len(contents)}/{len(page_ids)}ページのコンテンツを取得しました")
         return contents
@@ -410,14 +738,64 @@ class NotionClient:
         except Exception as e:
             self._handle_api_error(e, f"ページプロパティ取得 (ID: {page_id})")
     
+    def iter_page_blocks(self, page_id: str, include_children: bool = True) -> Iterator[NotionBlock]:
+        """
+        ページのトップレベルブロックを順次取得
+        
+        APIレスポンス（最大100ブロック）ごとに子ブロックを揃えてから返すため、
+        ページ全体をメモリに保持せずに処理できる
+        
+        Args:
+            page_id: ページID
+            include_children: 子ブロックも含めるかどうか
+            
+        Yields:
+            子ブロックを含むNotionBlockオブジェクト
+        """
+        for blocks in self._iter_block_children_batches(page_id):
+            if include_children:
+                self._fill_children(blocks)
+            yield from blocks
+    
     def _get_page_blocks(self, page_id: str, include_children: bool = True) -> List[NotionBlock]:
-        """ページのブロックを再帰的に取得"""
+        """ページのブロックを取得（子ブロックは階層ごとに並行取得）"""
+        return list(self.iter_page_blocks(page_id, include_children))
+    
+    def _fill_children(self, blocks: List[NotionBlock]) -> None:
+        """子ブロックを幅優先で階層ごとに並行取得して設定"""
+        level = [
+            block for block in blocks
+            if block.has_children and block.type not in _DETACHED_CHILDREN_BLOCK_TYPES
+        ]
+        while level:
+            children_lists = self._io_pool.map(
+                self._list_block_children,
+                [block.id for block in level]
+            )
+            
+            next_level = []
+            for block, children in zip(level, children_lists):
+                block.children = children
+                next_level.extend(
+                    child for child in children
+                    if child.has_children and child.type not in _DETACHED_CHILDREN_BLOCK_TYPES
+                )
+            level = next_level
+    
+    def _list_block_children(self, block_id: str) -> List[NotionBlock]:
+        """ブロック直下の子ブロックを取得（再帰なし）"""
         blocks = []
+        for batch in self._iter_block_children_batches(block_id):
+            blocks.extend(batch)
+        return blocks
+    
+    def _iter_block_children_batches(self, block_id: str) -> Iterator[List[NotionBlock]]:
+        """ブロック直下の子ブロックをAPIレスポンス単位で取得"""
         has_more = True
         next_cursor = None
         
         while has_more:
-            query_params = {"block_id": page_id, "page_size": 100}
+            query_params = {"block_id": block_id, "page_size": 100}
             if next_cursor:
                 query_params["start_cursor"] = next_cursor
             
@@ -426,37 +804,36 @@ class NotionClient:
                 **query_params
             )
             
-            for block_data in response.get("results", []):
-                block = self._convert_to_notion_block(block_data)
-                
-                # 子ブロックがある場合は再帰的に取得
-                if block.has_children and include_children:
-                    block.children = self._get_page_blocks(block.id, include_children)
-                
-                blocks.append(block)
+            yield [
+                self._convert_to_notion_block(block_data)
+                for block_data in response.get("results", [])
+            ]
             
             has_more = response.get("has_more", False)
             next_cursor = response.get("next_cursor")
-        
-        return blocks
     
     def _convert_to_notion_page(self, page_data: Dict[str, Any]) -> NotionPage:
         """APIレスポンスをNotionPageオブジェクトに変換"""
-        properties = {}
+        # ページ数×プロパティ数だけ実行されるため、メソッド参照をローカルに束縛する
+        extract_value = self._extract_property_value
+        parse_datetime = self._parse_datetime
+        intern = sys.intern
         
+        # プロパティ名・タイプは全ページで共通のため、internして文字列を共有する
+        properties = {}
         for prop_name, prop_data in page_data.get("properties", {}).items():
-            prop = NotionProperty(
+            prop_name = intern(prop_name)
+            properties[prop_name] = NotionProperty(
                 id=prop_data.get("id", ""),
                 name=prop_name,
-                type=prop_data.get("type", ""),
-                value=self._extract_property_value(prop_data)
+                type=intern(prop_data.get("type") or ""),
+                value=extract_value(prop_data)
             )
-            properties[prop_name] = prop
         
         return NotionPage(
             id=page_data["id"],
-            created_time=self._parse_datetime(page_data.get("created_time")),
-            last_edited_time=self._parse_datetime(page_data.get("last_edited_time")),
+            created_time=parse_datetime(page_data.get("created_time")),
+            last_edited_time=parse_datetime(page_data.get("last_edited_time")),
             created_by=page_data.get("created_by", {}),
             last_edited_by=page_data.get("last_edited_by", {}),
             cover=page_data.get("cover"),
@@ -470,53 +847,33 @@ class NotionClient:
     
     def _convert_to_notion_block(self, block_data: Dict[str, Any]) -> NotionBlock:
         """APIレスポンスをNotionBlockオブジェクトに変換"""
+        parse_datetime = self._parse_datetime
         return NotionBlock(
             id=block_data["id"],
             type=block_data.get("type", ""),
             has_children=block_data.get("has_children", False),
             archived=block_data.get("archived", False),
-            created_time=self._parse_datetime(block_data.get("created_time")),
-            last_edited_time=self._parse_datetime(block_data.get("last_edited_time")),
+            created_time=parse_datetime(block_data.get("created_time")),
+            last_edited_time=parse_datetime(block_data.get("last_edited_time")),
             created_by=block_data.get("created_by"),
             last_edited_by=block_data.get("last_edited_by"),
             parent=block_data.get("parent"),
-            content=block_data
+            content={
+                key: value for key, value in block_data.items()
+                if key not in _PROJECTED_BLOCK_KEYS
+            }
         )
     
     def _extract_property_value(self, prop_data: Dict[str, Any]) -> Any:
         """プロパティ値を抽出"""
         prop_type = prop_data.get("type")
         
-        if prop_type in ["title", "rich_text"]:
-            return prop_data.get(prop_type, [])
-        elif prop_type in ["select", "status"]:
-            return prop_data.get(prop_type)
-        elif prop_type == "multi_select":
-            return prop_data.get("multi_select", [])
-        elif prop_type == "date":
-            return prop_data.get("date")
-        elif prop_type == "checkbox":
-            return prop_data.get("checkbox", False)
-        elif prop_type == "number":
-            return prop_data.get("number")
-        elif prop_type in ["url", "email", "phone_number"]:
-            return prop_data.get(prop_type)
-        elif prop_type == "people":
-            return prop_data.get("people", [])
-        elif prop_type == "files":
-            return prop_data.get("files", [])
-        elif prop_type == "relation":
-            return prop_data.get("relation", [])
-        elif prop_type in ["created_time", "last_edited_time"]:
-            return prop_data.get(prop_type)
-        elif prop_type in ["created_by", "last_edited_by"]:
-            return prop_data.get(prop_type)
-        elif prop_type == "formula":
-            return prop_data.get("formula", {})
-        elif prop_type == "rollup":
-            return prop_data.get("rollup", {})
-        else:
-            return prop_data.get(prop_type)
+        if prop_type in prop_data:
+            return prop_data[prop_type]
+        
+        # 値が存在しない場合はタイプごとのデフォルト値
+        default_factory = _PROPERTY_DEFAULT_FACTORIES.get(prop_type)
+        return default_factory() if default_factory else None
     
     def _parse_datetime(self, datetime_str: Optional[str]) -> Optional[datetime]:
         """ISO形式の日時文字列をdatetimeオブジェクトに変換"""
@@ -525,7 +882,7 @@ class NotionClient:
         
         try:
             # ISO形式の日時をパース
-            return datetime.fromisoformat(datetime_str.replace('Z', '+00:00'))
-        except (ValueError, AttributeError):
+            return _parse_iso_datetime(datetime_str)
+        except (ValueError, AttributeError, TypeError):
             self.logger.warning(f"日時のパースに失敗: {datetime_str}")
             return None
\ No newline at end of file
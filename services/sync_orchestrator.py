@@ -3,21 +3,55 @@
 Notion-Obsidian同期プロセス全体を調整するクラス
 """
 
+import os
+import re
+import time
 import logging
-from typing import Dict, List, Any, Optional
+import multiprocessing
+import itertools
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple, Iterator
 from datetime import datetime
+from pathlib import Path
 
-from models.config import AppConfig
+from models.config import AppConfig, ConversionConfig
 from models.notion import NotionPage, NotionPageContent
 from models.markdown import MarkdownConversionResult
 from services.notion_client import NotionClient
 from services.data_processor import DataProcessor
+from services.cache_manager import CacheManager, ChangeDetector
 from utils.file_manager import FileManager
 
 
+# 大きすぎる・長すぎる内容を示す整合性チェック警告の判定パターン
+_LARGE_CONTENT_WARNING_RE = re.compile("長すぎます|大きすぎます")
+
+# 変換ワーカープロセスごとに1つだけ生成するDataProcessor
+_worker_data_processor: Optional[DataProcessor] = None
+
+
+def _init_conversion_worker(conversion_config: ConversionConfig) -> None:
+    """変換ワーカープロセスの初期化"""
+    global _worker_data_processor
+    _worker_data_processor = DataProcessor(conversion_config)
+
+
+def _convert_in_worker(page_content: NotionPageContent, file_naming: str,
+                       include_properties: bool) -> MarkdownConversionResult:
+    """変換ワーカープロセス内でページをMarkdownに変換"""
+    return _worker_data_processor.convert_page_to_markdown(page_content, file_naming, include_properties)
+
+
 class SyncResult:
     """同期結果を表すクラス"""
     
+    # インスタンスごとの__dict__を持たせず、属性アクセスとメモリ使用量を抑える
+    __slots__ = (
+        "start_time", "end_time", "total_pages", "successful_pages", "failed_pages",
+        "skipped_pages", "conversion_results", "errors", "warnings", "failed_page_records",
+        "_start_mono", "_duration", "_success_rate",
+    )
+    
     def __init__(self):
         self.start_time = datetime.now()
         self.end_time: Optional[datetime] = None
@@ -28,6 +62,15 @@ class SyncResult:
         self.conversion_results: List[MarkdownConversionResult] = []
         self.errors: List[str] = []
         self.warnings: List[str] = []
+        # 取得・変換に失敗したページ (ページID, タイトル, 例外のrepr)
+        self.failed_page_records: List[Tuple[str, str, str]] = []
+        
+        # 所要時間の計測用（壁時計の時刻はレポート表示にのみ使う）
+        self._start_mono = time.monotonic()
+        
+        # 完了時に確定する集計値（完了前はNone）
+        self._duration: Optional[float] = None
+        self._success_rate: Optional[float] = None
         
     def add_error(self, error: str) -> None:
         """エラーを追加"""
@@ -38,22 +81,31 @@ class SyncResult:
         self.warnings.append(warning)
         
     def complete(self) -> None:
-        """同期完了時に呼び出す"""
+        """同期完了時に呼び出す（所要時間と成功率をここで確定させる）"""
         self.end_time = datetime.now()
+        self._duration = time.monotonic() - self._start_mono
+        self._success_rate = self._calculate_success_rate()
         
     @property
     def duration(self) -> float:
         """同期にかかった時間（秒）"""
-        if self.end_time:
-            return (self.end_time - self.start_time).total_seconds()
+        if self._duration is not None:
+            return self._duration
         return 0.0
         
     @property
     def success_rate(self) -> float:
         """成功率（%）"""
+        if self._success_rate is not None:
+            return self._success_rate
+        return self._calculate_success_rate()
+    
+    def _calculate_success_rate(self) -> float:
+        """現在の件数から成功率（%）を計算"""
         if self.total_pages == 0:
             return 0.0
-        return (self.successful_pages / self.total_pages) * 100
+        # 未変更でスキップしたページは最新の状態として成功に含める
+        return ((self.successful_pages + self.skipped_pages) / self.total_pages) * 100
         
     def get_summary(self) -> Dict[str, Any]:
         """同期結果のサマリーを取得"""
@@ -89,7 +141,8 @@ class SyncOrchestrator:
         # コンポーネントを初期化
         self.notion_client = NotionClient(
             config.notion.api_token,
-            config.notion.database_id
+            config.notion.database_id,
+            max_concurrent_requests=config.sync.concurrency
         )
         self.data_processor = DataProcessor(config.sync.conversion)
         self.file_manager = FileManager(
@@ -97,6 +150,194 @@ class SyncOrchestrator:
             config.obsidian.subfolder
         )
         
+        # ページコンテンツ取得用の共有ワーカープール（同時実行数の上限を兼ねる）
+        self._fetch_pool = ThreadPoolExecutor(
+            max_workers=config.sync.concurrency,
+            thread_name_prefix="page-fetch"
+        )
+        
+        # ファイル書き込み用のワーカー（変換済みバッチの書き込みを次バッチの取得と並行させる）
+        # 単一スレッドにすることでバッチ間のファイル名競合解決を順序通りに行う
+        self._write_pool = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="file-write"
+        )
+        
+        # Markdown変換用のプロセスプール（初回使用時に生成）
+        self._convert_pool: Optional[ProcessPoolExecutor] = None
+        
+        # ページ一覧のキャッシュ（取得時刻, ページ一覧）
+        # プレビュー・前提条件検証・同期本体で同じ一覧を再取得しないようにする
+        self._pages_cache: Optional[Tuple[float, List[NotionPage]]] = None
+        self._pages_cache_ttl = 60.0
+        
+        # ボルト構造検証結果のキャッシュ（検証時刻, 問題のリスト）
+        self._vault_issues_cache: Optional[Tuple[float, List[str]]] = None
+        self._vault_issues_ttl = 5.0
+        
+        # 書き込み権限テストの成功を信頼する期限（time.monotonic基準）
+        self._write_probe_ok_until: Optional[float] = None
+        self._write_probe_ttl = 300.0
+        
+        # 古いバックアップの整理を最後に行った時刻（time.monotonic基準）
+        self._last_backup_prune: Optional[float] = None
+        self._backup_prune_interval = 86400.0
+        
+        # 増分同期用の変更検出（前回同期時の最終編集日時と比較）
+        self.change_detector: Optional[ChangeDetector] = None
+        if config.sync.incremental:
+            cache_manager = CacheManager(
+                config.sync.conversion,
+                cache_dir=str(Path(config.obsidian.vault_path) / ".notion_sync_cache")
+            )
+            self.change_detector = ChangeDetector(cache_manager)
+        
+    def close(self) -> None:
+        """取得・書き込み・変換のワーカープールとNotionクライアントを終了"""
+        self._fetch_pool.shutdown(wait=True)
+        self._write_pool.shutdown(wait=True)
+        if self._convert_pool is not None:
+            self._convert_pool.shutdown(wait=True)
+            self._convert_pool = None
+        self.notion_client.close()
+    
+    def __enter__(self) -> "SyncOrchestrator":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def _get_database_pages_cached(self) -> List[NotionPage]:
+        """
+        データベースのページ一覧を取得（TTL付きキャッシュ）
+        
+        Returns:
+            NotionPageオブジェクトのリスト
+        """
+        pages = self._get_fresh_cached_pages()
+        if pages is not None:
+            return pages
+        
+        pages = self.notion_client.get_database_pages()
+        self._pages_cache = (time.monotonic(), pages)
+        return pages
+    
+    def _get_fresh_cached_pages(self) -> Optional[List[NotionPage]]:
+        """
+        有効期限内のキャッシュ済みページ一覧を取得（APIは呼ばない）
+        
+        Returns:
+            キャッシュがないか期限切れの場合はNone
+        """
+        if self._pages_cache is None:
+            return None
+        
+        cached_at, pages = self._pages_cache
+        if time.monotonic() - cached_at >= self._pages_cache_ttl:
+            return None
+        return pages
+    
+    def invalidate_pages_cache(self) -> None:
+        """ページ一覧のキャッシュを破棄"""
+        self._pages_cache = None
+    
+    def _validate_vault_structure_cached(self) -> List[str]:
+        """
+        ボルト構造を検証（接続テストと前提条件検証が続けて呼ぶため短時間キャッシュ）
+        
+        Returns:
+            問題のリスト
+        """
+        if self._vault_issues_cache is not None:
+            checked_at, issues = self._vault_issues_cache
+            if time.monotonic() - checked_at < self._vault_issues_ttl:
+                return issues
+        
+        issues = self.file_manager.validate_vault_structure()
+        self._vault_issues_cache = (time.monotonic(), issues)
+        return issues
+    
+    def _filter_changed_pages(self, pages: List[NotionPage], result: SyncResult) -> List[NotionPage]:
+        """
+        前回同期以降に変更されていないページを除外（増分同期が無効の場合はそのまま返す）
+        
+        Args:
+            pages: ページのリスト
+            result: 同期結果オブジェクト（スキップ数を加算）
+            
+        Returns:
+            同期が必要なページのリスト
+        """
+        if self.change_detector is None:
+            return pages
+        
+        cache_manager = self.change_detector.cache_manager
+        changed_pages = []
+        for page in pages:
+            last_edited = page.last_edited_time.isoformat() if page.last_edited_time else ""
+            cached_entry = cache_manager.get_page_cache(page.id)
+            
+            # 未変更でも出力ファイルが消えている場合は再同期する
+            if (cached_entry is not None
+                    and not self.change_detector.should_sync_page(page.id, last_edited)
+                    and self.file_manager.file_exists(cached_entry.file_path)):
+                result.skipped_pages += 1
+                continue
+            changed_pages.append(page)
+        
+        return changed_pages
+    
+    def _next_changed_batch(self, batches: Iterator[List[NotionPage]], result: SyncResult,
+                            count_pages: bool) -> Optional[List[NotionPage]]:
+        """
+        次に処理するバッチを取得（未変更ページのみのバッチは飛ばす）
+        
+        Args:
+            batches: ページバッチのイテレーター
+            result: 同期結果オブジェクト
+            count_pages: 取得したページ数を対象ページ数に加算するかどうか
+            
+        Returns:
+            同期が必要なページのバッチ（残りがない場合はNone）
+        """
+        for batch in batches:
+            if count_pages:
+                result.total_pages += len(batch)
+            batch = self._filter_changed_pages(batch, result)
+            if batch:
+                return batch
+        return None
+    
+    def _update_change_cache(self, conversion_results: List[MarkdownConversionResult],
+                             write_results: Dict[str, Any]) -> None:
+        """
+        書き込みに成功したページの最終編集日時をキャッシュに記録
+        
+        Args:
+            conversion_results: 変換結果のリスト（競合解決後のファイル名）
+            write_results: safe_batch_writeの結果
+        """
+        if self.change_detector is None:
+            return
+        
+        cache_manager = self.change_detector.cache_manager
+        written = write_results.get("write_results", {})
+        for conversion_result in conversion_results:
+            markdown_file = conversion_result.markdown_file
+            page_id = markdown_file.frontmatter.get("notion_id")
+            if not page_id or not written.get(markdown_file.filename):
+                continue
+            
+            cache_manager.update_page_cache(
+                page_id,
+                Path(markdown_file.filename).stem,
+                markdown_file.frontmatter.get("last_edited_time") or "",
+                markdown_file.content,
+                markdown_file.filename
+            )
+        
+        cache_manager.save_cache()
+    
     def sync_single_page(self, page_id: str) -> bool:
         """
         単一ページの同期
@@ -108,7 +349,7 @@ class SyncOrchestrator:
             同期成功時True
         """
         try:
-            self.logger.info(f"単一ページ同期開始: {page_id}")
+            self.logger.info("単一ページ同期開始: %s", page_id)
             
             # ページコンテンツを取得
             page_content = self.notion_client.get_page_content(page_id)
@@ -127,16 +368,30 @@ class SyncOrchestrator:
             )
             
             if success:
-                self.logger.info(f"単一ページ同期完了: {page_content.page.title}")
+                self.logger.info("単一ページ同期完了: %s", page_content.page.title)
                 return True
             else:
-                self.logger.error(f"ファイル書き込み失敗: {conversion_result.markdown_file.filename}")
+                self._write_probe_ok_until = None
+                self.logger.error("ファイル書き込み失敗: %s", conversion_result.markdown_file.filename)
                 return False
                 
         except Exception as e:
-            self.logger.error(f"単一ページ同期エラー (ID: {page_id}): {str(e)}")
+            self.logger.error("単一ページ同期エラー (ID: %s): %s", page_id, e)
             return False
     
+    def _probe_notion(self) -> Tuple[bool, Any, Optional[Exception]]:
+        """
+        Notion接続とデータベースアクセスを確認
+        
+        Returns:
+            (接続可否, データベース情報, データベースアクセス時の例外) のタプル
+        """
+        connected = self.notion_client.test_connection()
+        try:
+            return connected, self.notion_client.get_database_info(), None
+        except Exception as e:
+            return connected, None, e
+    
     def test_sync_connection(self) -> Dict[str, Any]:
         """
         同期接続テスト
@@ -155,23 +410,38 @@ class SyncOrchestrator:
         }
         
         try:
-            # Notion接続テスト
-            if self.notion_client.test_connection():
+            # Notion側の確認はネットワーク待ちのためワーカーで行い、その間にボルト側を確認する
+            # （接続テストとデータベース情報はキャッシュを共有するため、Notion側は順に実行）
+            notion_future = self._fetch_pool.submit(self._probe_notion)
+            
+            # Obsidianボルト検証
+            vault_issues = self._validate_vault_structure_cached()
+            
+            # ファイル書き込み権限テスト（直近で成功していれば省略）
+            write_error = None
+            if self._write_probe_ok_until is None or time.monotonic() >= self._write_probe_ok_until:
+                try:
+                    test_file_path = self.file_manager.sync_path / ".sync_test.tmp"
+                    test_file_path.write_text("テスト")
+                    test_file_path.unlink()
+                    self._write_probe_ok_until = time.monotonic() + self._write_probe_ttl
+                except Exception as e:
+                    write_error = e
+            
+            # Notion接続テスト・データベースアクセステストの結果
+            notion_connected, db_info, db_error = notion_future.result()
+            if notion_connected:
                 test_results["notion_connection"] = True
                 self.logger.info("Notion接続テスト: 成功")
             else:
                 test_results["errors"].append("Notion APIに接続できません")
                 
-            # データベースアクセステスト
-            try:
-                db_info = self.notion_client.get_database_info()
+            if db_error is None:
                 test_results["database_access"] = True
-                self.logger.info(f"データベースアクセステスト: 成功 ({db_info.title})")
-            except Exception as e:
-                test_results["errors"].append(f"データベースにアクセスできません: {str(e)}")
+                self.logger.info("データベースアクセステスト: 成功 (%s)", db_info.title)
+            else:
+                test_results["errors"].append(f"データベースにアクセスできません: {str(db_error)}")
                 
-            # Obsidianボルト検証
-            vault_issues = self.file_manager.validate_vault_structure()
             if not vault_issues:
                 test_results["obsidian_vault"] = True
                 self.logger.info("Obsidianボルト検証: 成功")
@@ -180,15 +450,11 @@ class SyncOrchestrator:
                 for issue in vault_issues:
                     test_results["warnings"].append(f"ボルト問題: {issue}")
                     
-            # ファイル書き込み権限テスト
-            try:
-                test_file_path = self.file_manager.sync_path / ".sync_test.tmp"
-                test_file_path.write_text("テスト")
-                test_file_path.unlink()
+            if write_error is None:
                 test_results["file_write_permission"] = True
                 self.logger.info("ファイル書き込み権限テスト: 成功")
-            except Exception as e:
-                test_results["errors"].append(f"ファイル書き込み権限がありません: {str(e)}")
+            else:
+                test_results["errors"].append(f"ファイル書き込み権限がありません: {str(write_error)}")
                 
             # 総合判定
             test_results["overall_status"] = (
@@ -215,10 +481,10 @@ class SyncOrchestrator:
             プレビュー情報の辞書
         """
         try:
-            self.logger.info(f"同期プレビュー開始 (最大{max_pages}ページ)")
+            self.logger.info("同期プレビュー開始 (最大%sページ)", max_pages)
             
             # ページ一覧を取得
-            pages = self.notion_client.get_database_pages(page_size=max_pages)
+            pages = self._get_database_pages_cached()
             
             preview_info = {
                 "total_pages_in_database": len(pages),
@@ -248,11 +514,11 @@ class SyncOrchestrator:
                 preview_info["potential_conflicts"] = list(conflicts.keys())
                 preview_info["warnings"].append(f"{len(conflicts)}件のファイル名競合が予想されます")
             
-            self.logger.info(f"同期プレビュー完了: {len(pages)}ページ検出")
+            self.logger.info("同期プレビュー完了: %sページ検出", len(pages))
             return preview_info
             
         except Exception as e:
-            self.logger.error(f"同期プレビューエラー: {str(e)}")
+            self.logger.error("同期プレビューエラー: %s", e)
             return {
                 "error": str(e),
                 "total_pages_in_database": 0,
@@ -298,22 +564,27 @@ class SyncOrchestrator:
                 validation_result["is_valid"] = False
             
             # ボルト書き込み確認
-            vault_issues = self.file_manager.validate_vault_structure()
-            critical_issues = [issue for issue in vault_issues if "権限" in issue or "存在しません" in issue]
+            vault_issues = self._validate_vault_structure_cached()
+            
+            # クリティカルな問題はエラー、それ以外は警告として1回の走査で振り分ける
+            has_critical_issue = False
+            for issue in vault_issues:
+                if "権限" in issue or "存在しません" in issue:
+                    validation_result["errors"].append(f"ボルトエラー: {issue}")
+                    has_critical_issue = True
+                else:
+                    validation_result["warnings"].append(f"ボルト警告: {issue}")
             
-            if not critical_issues:
+            if not has_critical_issue:
                 validation_result["checks"]["vault_writable"] = True
             else:
-                for issue in critical_issues:
-                    validation_result["errors"].append(f"ボルトエラー: {issue}")
                 validation_result["is_valid"] = False
             
-            # 非クリティカルな問題は警告として追加
-            non_critical_issues = [issue for issue in vault_issues if issue not in critical_issues]
-            for issue in non_critical_issues:
-                validation_result["warnings"].append(f"ボルト警告: {issue}")
-            
             # 重大な競合チェック
+            if self.config.sync.skip_preflight_preview:
+                validation_result["checks"]["no_critical_conflicts"] = True
+                return validation_result
+            
             try:
                 preview = self.get_sync_preview(max_pages=10)
                 if len(preview.get("potential_conflicts", [])) > 5:
@@ -357,58 +628,187 @@ class SyncOrchestrator:
             for warning in validation["warnings"]:
                 result.add_warning(warning)
             
-            # すべてのページを取得
-            pages = self.notion_client.get_database_pages()
-            result.total_pages = len(pages)
+            # 前提条件検証で取得済みの一覧があれば再利用し、なければ
+            # ページネーションに沿ってバッチ単位で受け取りながら処理する
+            batch_size = self.config.sync.batch_size
+            cached_pages = self._get_fresh_cached_pages()
+            if cached_pages is not None:
+                result.total_pages = len(cached_pages)
+                self.logger.info("同期対象ページ数: %s", result.total_pages)
+                batches = iter([cached_pages[i:i + batch_size] for i in range(0, len(cached_pages), batch_size)])
+            else:
+                batches = self.notion_client.get_pages_in_batches(batch_size)
             
-            if result.total_pages == 0:
-                result.add_warning("同期対象のページが見つかりませんでした")
+            streaming = cached_pages is None
+            batch = self._next_changed_batch(batches, result, streaming)
+            if batch is None:
+                if result.skipped_pages > 0:
+                    self.logger.info("変更されたページはありません（%sページ未変更）", result.skipped_pages)
+                else:
+                    result.add_warning("同期対象のページが見つかりませんでした")
                 result.complete()
                 return result
             
-            self.logger.info(f"同期対象ページ数: {result.total_pages}")
-            
-            # バッチサイズに分割して処理
-            batch_size = self.config.sync.batch_size
-            batches = [pages[i:i + batch_size] for i in range(0, len(pages), batch_size)]
-            
-            for batch_index, batch in enumerate(batches):
-                self.logger.info(f"バッチ {batch_index + 1}/{len(batches)} 処理開始 ({len(batch)}ページ)")
-                
-                # バッチ内のページを処理
-                batch_results = self._process_page_batch(batch, result, progress_callback)
-                result.conversion_results.extend(batch_results)
-            
-            # ファイル書き込み（競合解決付き）
-            if result.conversion_results:
-                write_results = self.file_manager.safe_batch_write(
-                    result.conversion_results,
-                    overwrite=self.config.sync.overwrite_existing,
-                    resolve_conflicts=True
-                )
-                
-                # 書き込み結果を反映
-                result.successful_pages = write_results["successful_writes"]
-                result.failed_pages = write_results["failed_writes"]
-                
-                if write_results["conflicts_detected"] > 0:
-                    result.add_warning(f"{write_results['conflicts_detected']}件のファイル名競合を解決しました")
-                
-                if write_results["conflict_report"]:
-                    self.logger.info("競合解決レポート:\n" + write_results["conflict_report"])
+            # 現在のバッチを変換している間に次のバッチの取得を先行させ、
+            # 変換済みのバッチは書き込みワーカーに渡して取得と並行に書き込む
+            pending_fetches = self._submit_page_fetches(batch)
+            fetches = pending_fetches
+            pending_writes = []
+            used_filenames = set()
+            batch_index = 0
+            try:
+                while batch is not None:
+                    batch_index += 1
+                    self.logger.info("バッチ %s 処理開始 (%sページ)", batch_index, len(batch))
+                    
+                    fetches = pending_fetches
+                    next_batch = self._next_changed_batch(batches, result, streaming)
+                    if next_batch is not None:
+                        pending_fetches = self._submit_page_fetches(next_batch)
+                    
+                    # バッチ内のページを処理
+                    batch_results = self._process_page_batch(batch, result, progress_callback, fetches)
+                    result.conversion_results.extend(batch_results)
+                    if batch_results:
+                        pending_writes.append((batch_results, self._write_pool.submit(
+                            self.file_manager.safe_batch_write,
+                            batch_results,
+                            overwrite=self.config.sync.overwrite_existing,
+                            resolve_conflicts=True,
+                            used_filenames=used_filenames
+                        )))
+                    batch = next_batch
+            finally:
+                # 途中で例外が発生した場合も、未開始の取得は取り消し、
+                # 投入済みの書き込みは完了を待って結果とキャッシュに反映する
+                for future in fetches + pending_fetches:
+                    future.cancel()
+                if pending_writes:
+                    self._apply_write_results(pending_writes, result)
+            
+            if streaming:
+                self.logger.info("同期対象ページ数: %s", result.total_pages)
             
             result.complete()
-            self.logger.info(f"全ページ同期完了: {result.successful_pages}/{result.total_pages}ページ成功")
+            self.logger.info("全ページ同期完了: %s/%sページ成功", result.successful_pages, result.total_pages)
             
             return result
             
         except Exception as e:
-            self.logger.error(f"全ページ同期エラー: {str(e)}")
+            self.logger.error("全ページ同期エラー: %s", e)
             result.add_error(f"同期中にエラーが発生しました: {str(e)}")
             result.complete()
             return result
     
-    def _process_page_batch(self, pages: List[NotionPage], result: SyncResult, progress_callback=None) -> List[MarkdownConversionResult]:
+    def _apply_write_results(self, pending_writes: List[Tuple[List[MarkdownConversionResult], Future]],
+                             result: SyncResult) -> None:
+        """
+        投入済みの書き込みの完了を待ち、成功・失敗件数と変更検出キャッシュに反映
+        
+        Args:
+            pending_writes: (変換結果のリスト, 書き込みFuture) のリスト
+            result: 同期結果オブジェクト
+        """
+        write_results = self._collect_write_results(pending_writes, result)
+        
+        # 書き込み結果を反映
+        result.successful_pages = write_results["successful_writes"]
+        result.failed_pages = write_results["failed_writes"]
+        
+        if result.successful_pages > 0:
+            self.invalidate_pages_cache()
+        if result.failed_pages > 0:
+            self._write_probe_ok_until = None
+        
+        self._update_change_cache(result.conversion_results, write_results)
+        
+        if write_results["conflicts_detected"] > 0:
+            result.add_warning(f"{write_results['conflicts_detected']}件のファイル名競合を解決しました")
+        
+        if write_results["conflict_report"]:
+            self.logger.info("競合解決レポート:\n%s", write_results["conflict_report"])
+    
+    def _collect_write_results(self, pending_writes: List[Tuple[List[MarkdownConversionResult], Future]],
+                               result: SyncResult) -> Dict[str, Any]:
+        """
+        バッチごとのsafe_batch_write結果を待機して1つにまとめる
+        
+        Args:
+            pending_writes: (変換結果のリスト, 書き込みFuture) のリスト
+            result: 同期結果オブジェクト
+            
+        Returns:
+            safe_batch_writeと同じ形式の書き込み結果の辞書
+        """
+        merged = {
+            "conflicts_detected": 0,
+            "write_results": {},
+            "successful_writes": 0,
+            "failed_writes": 0,
+            "conflict_report": None
+        }
+        conflict_reports = []
+        
+        for batch_results, future in pending_writes:
+            try:
+                write_results = future.result()
+            except Exception as e:
+                error_msg = f"ファイル書き込みエラー: {str(e)}"
+                result.add_error(error_msg)
+                self.logger.error(error_msg)
+                merged["failed_writes"] += len(batch_results)
+                continue
+            
+            merged["conflicts_detected"] += write_results["conflicts_detected"]
+            merged["write_results"].update(write_results.get("write_results", {}))
+            merged["successful_writes"] += write_results["successful_writes"]
+            merged["failed_writes"] += write_results["failed_writes"]
+            if write_results["conflict_report"]:
+                conflict_reports.append(write_results["conflict_report"])
+        
+        if conflict_reports:
+            merged["conflict_report"] = "\n".join(conflict_reports)
+        return merged
+    
+    def _submit_page_fetches(self, pages: List[NotionPage]) -> List[Future]:
+        """
+        ページコンテンツの取得を共有ワーカープールに投入
+        
+        Args:
+            pages: 取得するページのリスト
+            
+        Returns:
+            ページ順に並んだFutureのリスト
+        """
+        return [
+            self._fetch_pool.submit(self.notion_client.get_page_content, page.id)
+            for page in pages
+        ]
+    
+    def _get_convert_pool(self) -> Optional[ProcessPoolExecutor]:
+        """
+        Markdown変換用のプロセスプールを取得
+        
+        Returns:
+            conversion_workersが0の場合はNone
+        """
+        workers = self.config.sync.conversion_workers
+        if workers <= 0:
+            return None
+        
+        if self._convert_pool is None:
+            # スレッドを持つ親プロセスをforkしないよう、forkserver（非対応環境ではspawn）を使う
+            start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            self._convert_pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context(start_method),
+                initializer=_init_conversion_worker,
+                initargs=(self.config.sync.conversion,)
+            )
+        return self._convert_pool
+    
+    def _process_page_batch(self, pages: List[NotionPage], result: SyncResult, progress_callback=None,
+                            fetches: Optional[List[Future]] = None) -> List[MarkdownConversionResult]:
         """
         ページバッチを処理
         
@@ -416,13 +816,22 @@ class SyncOrchestrator:
             pages: 処理するページのリスト
             result: 同期結果オブジェクト
             progress_callback: 進捗コールバック関数
+            fetches: 投入済みのコンテンツ取得Future（省略時はここで投入）
             
         Returns:
             変換結果のリスト
         """
         batch_results = []
         
-        for page in pages:
+        # ページコンテンツの取得はネットワーク待ちが支配的なため並行に発行し、
+        # 変換と結果の記録はページ順を保ったまま呼び出し元スレッドで行う
+        if fetches is None:
+            fetches = self._submit_page_fetches(pages)
+        
+        convert_pool = self._get_convert_pool()
+        conversions = []
+        
+        for page, future in zip(pages, fetches):
             try:
                 # 進捗コールバック
                 if progress_callback:
@@ -430,14 +839,34 @@ class SyncOrchestrator:
                     progress_callback(current_progress, result.total_pages, page.title)
                 
                 # ページコンテンツを取得
-                page_content = self.notion_client.get_page_content(page.id)
+                page_content = future.result()
                 
-                # Markdownに変換
-                conversion_result = self.data_processor.convert_page_to_markdown(
-                    page_content,
-                    self.config.sync.file_naming,
-                    self.config.sync.include_properties
-                )
+                # Markdownに変換（プロセスプールがあれば投入のみ行う）
+                if convert_pool is not None:
+                    conversion = convert_pool.submit(
+                        _convert_in_worker,
+                        page_content,
+                        self.config.sync.file_naming,
+                        self.config.sync.include_properties
+                    )
+                else:
+                    conversion = self.data_processor.convert_page_to_markdown(
+                        page_content,
+                        self.config.sync.file_naming,
+                        self.config.sync.include_properties
+                    )
+                conversions.append((page, conversion))
+                
+            except Exception as e:
+                error_msg = f"ページ処理エラー ({page.title}): {str(e)}"
+                result.add_error(error_msg)
+                result.failed_page_records.append((page.id, page.title, repr(e)))
+                self.logger.error(error_msg)
+                continue
+        
+        for page, conversion in conversions:
+            try:
+                conversion_result = conversion.result() if isinstance(conversion, Future) else conversion
                 
                 batch_results.append(conversion_result)
                 
@@ -445,11 +874,12 @@ class SyncOrchestrator:
                 for warning in conversion_result.warnings:
                     result.add_warning(f"{page.title}: {warning}")
                 
-                self.logger.debug(f"ページ変換完了: {page.title}")
+                self.logger.debug("ページ変換完了: %s", page.title)
                 
             except Exception as e:
                 error_msg = f"ページ処理エラー ({page.title}): {str(e)}"
                 result.add_error(error_msg)
+                result.failed_page_records.append((page.id, page.title, repr(e)))
                 self.logger.error(error_msg)
                 continue
         
@@ -469,7 +899,7 @@ class SyncOrchestrator:
         result = SyncResult()
         
         try:
-            self.logger.info(f"フィルター同期開始: {filter_dict}")
+            self.logger.info("フィルター同期開始: %s", filter_dict)
             
             # フィルター条件でページを取得
             pages = self.notion_client.get_database_pages(filter_dict=filter_dict)
@@ -480,9 +910,10 @@ class SyncOrchestrator:
                 result.complete()
                 return result
             
-            self.logger.info(f"フィルター対象ページ数: {result.total_pages}")
+            self.logger.info("フィルター対象ページ数: %s", result.total_pages)
             
-            # ページを処理
+            # ページを処理（増分同期では未変更ページを除く）
+            pages = self._filter_changed_pages(pages, result)
             batch_results = self._process_page_batch(pages, result, progress_callback)
             result.conversion_results.extend(batch_results)
             
@@ -496,14 +927,18 @@ class SyncOrchestrator:
                 
                 result.successful_pages = write_results["successful_writes"]
                 result.failed_pages = write_results["failed_writes"]
+                if result.failed_pages > 0:
+                    self._write_probe_ok_until = None
+                
+                self._update_change_cache(result.conversion_results, write_results)
             
             result.complete()
-            self.logger.info(f"フィルター同期完了: {result.successful_pages}/{result.total_pages}ページ成功")
+            self.logger.info("フィルター同期完了: %s/%sページ成功", result.successful_pages, result.total_pages)
             
             return result
             
         except Exception as e:
-            self.logger.error(f"フィルター同期エラー: {str(e)}")
+            self.logger.error("フィルター同期エラー: %s", e)
             result.add_error(f"フィルター同期中にエラーが発生しました: {str(e)}")
             result.complete()
             return result
@@ -520,17 +955,9 @@ class SyncOrchestrator:
             SyncResultオブジェクト
         """
         try:
-            self.logger.info(f"更新日時フィルター同期開始: {after_date}")
-            
-            pages = self.notion_client.get_pages_modified_after(after_date)
-            
-            if not pages:
-                result = SyncResult()
-                result.add_warning(f"{after_date}以降に更新されたページが見つかりませんでした")
-                result.complete()
-                return result
+            self.logger.info("更新日時フィルター同期開始: %s", after_date)
             
-            # フィルター同期として処理
+            # 更新日時の絞り込みはNotion側のフィルターに任せ、クエリは1回で済ませる
             filter_dict = {
                 "timestamp": "last_edited_time",
                 "last_edited_time": {
@@ -538,6 +965,7 @@ class SyncOrchestrator:
                 }
             }
             
+            # 該当ページが無い場合の警告はsync_pages_by_filterが追加する
             return self.sync_pages_by_filter(filter_dict, progress_callback)
             
         except Exception as e:
@@ -559,10 +987,11 @@ class SyncOrchestrator:
             
             # ファイルシステム統計
             disk_usage = self.file_manager.get_disk_usage()
-            markdown_files = self.file_manager.list_markdown_files()
             
-            # 整合性チェック
-            integrity_results = self.file_manager.batch_verify_integrity()
+            # 整合性チェック（前回から変更のないファイルは読み込まない）
+            # 検証対象は同期パス内の全Markdownファイルのため、ファイル一覧も兼ねる
+            integrity_results = self.file_manager.batch_verify_integrity(quick=True)
+            markdown_files = list(integrity_results)
             valid_files = sum(1 for result in integrity_results.values() if result.get("is_valid", False))
             
             return {
@@ -585,7 +1014,7 @@ class SyncOrchestrator:
             }
             
         except Exception as e:
-            self.logger.error(f"統計情報取得エラー: {str(e)}")
+            self.logger.error("統計情報取得エラー: %s", e)
             return {
                 "error": str(e),
                 "database_stats": {},
@@ -608,13 +1037,22 @@ class SyncOrchestrator:
         try:
             self.logger.info("同期回復処理開始")
             
-            # 失敗したページのIDを特定
-            failed_page_ids = []
-            for error in failed_result.errors:
-                if "ページ処理エラー" in error:
-                    # エラーメッセージからページIDを抽出（簡易実装）
-                    # 実際の実装では、より詳細なエラー追跡が必要
-                    pass
+            # 失敗したページが記録されていれば、そのページだけを並行に再同期
+            failed_page_ids = list(dict.fromkeys(record[0] for record in failed_result.failed_page_records))
+            if failed_page_ids:
+                self.logger.info("失敗した%sページの再同期を試行", len(failed_page_ids))
+                recovery_result.total_pages = len(failed_page_ids)
+                
+                for page_id, success in zip(failed_page_ids, self._fetch_pool.map(self.sync_single_page, failed_page_ids)):
+                    if success:
+                        recovery_result.successful_pages += 1
+                    else:
+                        recovery_result.failed_pages += 1
+                        recovery_result.add_error(f"ページの再同期に失敗しました (ID: {page_id})")
+                
+                recovery_result.complete()
+                self.logger.info("回復処理完了: %s/%sページを回復", recovery_result.successful_pages, recovery_result.total_pages)
+                return recovery_result
             
             # 代替として、最近更新されたページを再同期
             recent_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
@@ -623,14 +1061,14 @@ class SyncOrchestrator:
             recovery_result = self.sync_pages_modified_after(recent_date)
             
             if recovery_result.successful_pages > 0:
-                self.logger.info(f"回復処理完了: {recovery_result.successful_pages}ページを回復")
+                self.logger.info("回復処理完了: %sページを回復", recovery_result.successful_pages)
             else:
                 recovery_result.add_warning("回復できるページが見つかりませんでした")
             
             return recovery_result
             
         except Exception as e:
-            self.logger.error(f"回復処理エラー: {str(e)}")
+            self.logger.error("回復処理エラー: %s", e)
             recovery_result.add_error(f"回復処理中にエラーが発生しました: {str(e)}")
             recovery_result.complete()
             return recovery_result
@@ -663,15 +1101,13 @@ class SyncOrchestrator:
         # エラー詳細
         if sync_result.errors:
             report_lines.append("## エラー")
-            for i, error in enumerate(sync_result.errors, 1):
-                report_lines.append(f"{i}. {error}")
+            report_lines.extend(map("{0}. {1}".format, itertools.count(1), sync_result.errors))
             report_lines.append("")
         
         # 警告詳細
         if sync_result.warnings:
             report_lines.append("## 警告")
-            for i, warning in enumerate(sync_result.warnings, 1):
-                report_lines.append(f"{i}. {warning}")
+            report_lines.extend(map("{0}. {1}".format, itertools.count(1), sync_result.warnings))
             report_lines.append("")
         
         # 変換統計
@@ -711,16 +1147,27 @@ class SyncOrchestrator:
         logger = logging.getLogger()
         logger.setLevel(getattr(logging, self.config.logging.level))
         
-        # コンソールハンドラー
-        console_handler = logging.StreamHandler()
-        console_formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        # 繰り返し呼ばれても同じ出力先のハンドラーを重複して追加しない
+        has_console_handler = any(
+            type(handler) is logging.StreamHandler for handler in logger.handlers
+        )
+        log_file_path = os.path.abspath(self.config.logging.file) if self.config.logging.file else None
+        has_file_handler = any(
+            isinstance(handler, logging.FileHandler) and handler.baseFilename == log_file_path
+            for handler in logger.handlers
         )
-        console_handler.setFormatter(console_formatter)
-        logger.addHandler(console_handler)
+        
+        # コンソールハンドラー
+        if not has_console_handler:
+            console_handler = logging.StreamHandler()
+            console_formatter = logging.Formatter(
+                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+            )
+            console_handler.setFormatter(console_formatter)
+            logger.addHandler(console_handler)
         
         # ファイルハンドラー（設定されている場合）
-        if self.config.logging.file:
+        if log_file_path and not has_file_handler:
             file_handler = logging.FileHandler(self.config.logging.file, encoding='utf-8')
             file_formatter = logging.Formatter(
                 '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
@@ -761,11 +1208,11 @@ class SyncOrchestrator:
                     interruption_info["partial_save_successful"] = write_results["successful_writes"]
                     interruption_info["partial_save_failed"] = write_results["failed_writes"]
                     
-                    self.logger.info(f"中断時に{write_results['successful_writes']}ファイルを保存しました")
+                    self.logger.info("中断時に%sファイルを保存しました", write_results['successful_writes'])
                     
                 except Exception as e:
                     interruption_info["partial_save_error"] = str(e)
-                    self.logger.error(f"中断時の部分保存エラー: {str(e)}")
+                    self.logger.error("中断時の部分保存エラー: %s", e)
             
             # 整合性チェック
             try:
@@ -777,7 +1224,7 @@ class SyncOrchestrator:
                 interruption_info["corrupted_files"] = corrupted_files
                 
                 if corrupted_files:
-                    self.logger.warning(f"{len(corrupted_files)}個の破損ファイルを検出しました")
+                    self.logger.warning("%s個の破損ファイルを検出しました", len(corrupted_files))
                 
             except Exception as e:
                 interruption_info["integrity_check_error"] = str(e)
@@ -785,13 +1232,40 @@ class SyncOrchestrator:
             return interruption_info
             
         except Exception as e:
-            self.logger.error(f"中断処理エラー: {str(e)}")
+            self.logger.error("中断処理エラー: %s", e)
             return {
                 "interruption_time": datetime.now().isoformat(),
                 "error": str(e),
                 "can_resume": False
             }
     
+    def _cleanup_one(self, filename: str) -> Tuple[Optional[str], bool, Optional[str]]:
+        """
+        破損ファイル1件をバックアップへ退避して元の位置から取り除く
+        
+        Args:
+            filename: 対象ファイル名
+            
+        Returns:
+            (バックアップファイル名, 削除したか, エラーメッセージ)のタプル
+        """
+        backup_name = None
+        try:
+            # 破損ファイルはバックアップ名へリネームし、内容のコピーと削除を省く
+            if self.file_manager.backup_file(filename, ".corrupted", move=True):
+                backup_name = f"{filename}.corrupted"
+                deleted = True
+            else:
+                deleted = self.file_manager.delete_file(filename)
+        except OSError as e:
+            error_msg = f"ファイル削除エラー ({filename}): {str(e)}"
+            self.logger.error(error_msg)
+            return backup_name, False, error_msg
+        
+        if deleted:
+            self.logger.debug("破損ファイルを削除: %s", filename)
+        return backup_name, deleted, None
+    
     def cleanup_failed_files(self) -> Dict[str, Any]:
         """
         失敗したファイルのクリーンアップ
@@ -802,8 +1276,8 @@ class SyncOrchestrator:
         try:
             self.logger.info("失敗ファイルのクリーンアップ開始")
             
-            # 整合性チェック
-            integrity_results = self.file_manager.batch_verify_integrity()
+            # 整合性チェック（読み取り不可のファイルは毎回検証される）
+            integrity_results = self.file_manager.batch_verify_integrity(quick=True)
             
             cleanup_result = {
                 "checked_files": len(integrity_results),
@@ -813,41 +1287,51 @@ class SyncOrchestrator:
                 "errors": []
             }
             
+            corrupted_files = []
             for filename, result in integrity_results.items():
                 if not result.get("exists", True):
                     continue
                     
                 if not result.get("readable", True):
-                    cleanup_result["corrupted_files"].append(filename)
-                    
-                    # バックアップを作成してから削除
-                    try:
-                        if self.file_manager.backup_file(filename, ".corrupted"):
-                            cleanup_result["backup_files"].append(f"{filename}.corrupted")
-                        
-                        if self.file_manager.delete_file(filename):
-                            cleanup_result["deleted_files"].append(filename)
-                            self.logger.info(f"破損ファイルを削除: {filename}")
-                        
-                    except Exception as e:
-                        error_msg = f"ファイル削除エラー ({filename}): {str(e)}"
-                        cleanup_result["errors"].append(error_msg)
-                        self.logger.error(error_msg)
+                    corrupted_files.append(filename)
                 
                 elif not result.get("is_valid", True):
                     # 警告があるが読み取り可能なファイル
                     warnings = result.get("warnings", [])
-                    if any("長すぎます" in w or "大きすぎます" in w for w in warnings):
-                        self.logger.warning(f"大きなファイルを検出: {filename}")
+                    if any(_LARGE_CONTENT_WARNING_RE.search(w) for w in warnings):
+                        self.logger.warning("大きなファイルを検出: %s", filename)
+            
+            cleanup_result["corrupted_files"] = corrupted_files
+            
+            # 破損ファイルごとのバックアップと削除は互いに独立しているため並列に行う
+            if corrupted_files:
+                with ThreadPoolExecutor(max_workers=min(8, len(corrupted_files)),
+                                        thread_name_prefix="cleanup") as executor:
+                    outcomes = list(executor.map(self._cleanup_one, corrupted_files))
+                
+                for filename, (backup_name, deleted, error_msg) in zip(corrupted_files, outcomes):
+                    if backup_name:
+                        cleanup_result["backup_files"].append(backup_name)
+                    if deleted:
+                        cleanup_result["deleted_files"].append(filename)
+                    if error_msg:
+                        cleanup_result["errors"].append(error_msg)
+                
+                if cleanup_result["deleted_files"]:
+                    self.logger.info("破損ファイルを削除: %s", ", ".join(cleanup_result["deleted_files"]))
             
-            # 古いバックアップファイルをクリーンアップ
-            self.file_manager.cleanup_old_backups(max_backups=3)
+            # 古いバックアップファイルをクリーンアップ（新しいバックアップがなければ1日1回まで）
+            now = time.monotonic()
+            if (cleanup_result["backup_files"] or self._last_backup_prune is None
+                    or now - self._last_backup_prune >= self._backup_prune_interval):
+                self.file_manager.cleanup_old_backups(max_backups=3)
+                self._last_backup_prune = now
             
-            self.logger.info(f"クリーンアップ完了: {len(cleanup_result['deleted_files'])}ファイル削除")
+            self.logger.info("クリーンアップ完了: %sファイル削除", len(cleanup_result['deleted_files']))
             return cleanup_result
             
         except Exception as e:
-            self.logger.error(f"クリーンアップエラー: {str(e)}")
+            self.logger.error("クリーンアップエラー: %s", e)
             return {
                 "error": str(e),
                 "checked_files": 0,
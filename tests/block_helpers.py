@@ -0,0 +1,47 @@
+"""
+ブロック変換テストで共有するNotionBlockの作成ヘルパー
+"""
+
+from models.notion import NotionBlock
+
+
+def rich_text(text):
+    """装飾なしのリッチテキスト配列を作成"""
+    return [{"plain_text": text, "annotations": {}}]
+
+
+def rich_text_block(block_type, text, **extra):
+    """リッチテキストを1つだけ持つテスト用ブロックを作成"""
+    return NotionBlock(
+        id=f"test_{block_type}",
+        type=block_type,
+        content={
+            block_type: {
+                "rich_text": rich_text(text),
+                **extra
+            }
+        }
+    )
+
+
+def media_block(block_type, url, caption, **extra):
+    """外部URLとキャプションを持つテスト用メディアブロックを作成"""
+    return NotionBlock(
+        id=f"test_{block_type}",
+        type=block_type,
+        content={
+            block_type: {
+                "type": "external",
+                "external": {"url": url},
+                "caption": rich_text(caption),
+                **extra
+            }
+        }
+    )
+
+
+# 内容を持たないブロックはテスト間で共有する（変更する場合はcopy.copyで複製すること）
+DIVIDER_BLOCK = NotionBlock(id="test_divider", type="divider", content={})
+COLUMN_LIST_BLOCK = NotionBlock(id="test_column_list", type="column_list", content={})
+COLUMN_BLOCK = NotionBlock(id="test_column", type="column", content={})
+BREADCRUMB_BLOCK = NotionBlock(id="test_breadcrumb", type="breadcrumb", content={})
@@ -0,0 +1,11 @@
+"""
+テスト共通のフィクスチャ
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def shared_vault(tmp_path_factory):
+    """読み取り専用のパス検証テストで共有するObsidianボルト用ディレクトリ"""
+    return str(tmp_path_factory.mktemp("vault"))
@@ -0,0 +1,57 @@
+"""
+高度なブロック変換機能の統合テスト
+複数ブロックをまとめて変換する経路を検証する
+"""
+
+import pytest
+
+from services.advanced_block_converter import AdvancedBlockConverter
+from models.config import ConversionConfig
+from models.notion import NotionBlock
+from tests.block_helpers import COLUMN_LIST_BLOCK, rich_text_block
+
+
+@pytest.mark.integration
+class TestAdvancedBlockConverterIntegration:
+    """AdvancedBlockConverter の統合テスト"""
+    
+    def test_convert_blocks_to_markdown_integration(self):
+        """ブロックリスト全体の変換統合テスト"""
+        blocks = [
+            rich_text_block("heading_1", "メインタイトル"),
+            rich_text_block("paragraph", "これは段落です。"),
+            rich_text_block("bulleted_list_item", "リストアイテム")
+        ]
+        
+        converter = AdvancedBlockConverter(ConversionConfig())
+        result = converter.convert_blocks_to_markdown(blocks)
+        
+        assert "# メインタイトル" in result
+        assert "これは段落です。" in result
+        assert "- リストアイテム" in result
+    
+    def test_integration_with_limited_blocks(self):
+        """制限のあるブロックタイプの統合テスト"""
+        blocks = [
+            NotionBlock(
+                id="db_block",
+                type="child_database",
+                content={"child_database": {"title": "タスク管理"}}
+            ),
+            COLUMN_LIST_BLOCK,
+            rich_text_block("template", "日報テンプレート")
+        ]
+        
+        # テーブルモード、セパレーターモードで変換
+        config = ConversionConfig(database_mode="table", column_layout="separator")
+        converter = AdvancedBlockConverter(config)
+        
+        result = converter.convert_blocks_to_markdown(blocks)
+        
+        assert "📊 タスク管理" in result
+        assert "📋 カラムレイアウト開始" in result
+        assert "📋 **テンプレート: 日報テンプレート**" in result
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
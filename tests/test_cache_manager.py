@@ -3,8 +3,6 @@
 """
 
 import pytest
-import tempfile
-import shutil
 import json
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -58,16 +56,13 @@ class TestPageCacheEntry:
 class TestCacheManager:
     """CacheManager のテスト"""
     
-    def setup_method(self):
-        """テストセットアップ"""
-        self.temp_dir = tempfile.mkdtemp()
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """テストセットアップ（一時ディレクトリはpytestが管理）"""
+        self.temp_dir = str(tmp_path)
         self.config = ConversionConfig()
         self.cache_manager = CacheManager(self.config, self.temp_dir)
     
-    def teardown_method(self):
-        """テストクリーンアップ"""
-        shutil.rmtree(self.temp_dir)
-    
     def test_initialization(self):
         """初期化テスト"""
         assert self.cache_manager.config == self.config
@@ -218,6 +213,50 @@ class TestCacheManager:
         assert "old_page" not in self.cache_manager.cache
         assert "new_page" in self.cache_manager.cache
     
+    def test_cleanup_old_cache_keeps_refreshed_entry(self):
+        """更新し直したエントリが削除されないテスト"""
+        old_time = (datetime.now() - timedelta(days=35)).isoformat()
+        self.cache_manager.cache["page"] = PageCacheEntry(
+            page_id="page",
+            title="ページ",
+            last_edited_time="2024-01-01T00:00:00Z",
+            content_hash="abc123",
+            file_path="page.md",
+            cached_at=old_time
+        )
+        self.cache_manager.cleanup_old_cache(max_age_days=40)
+        assert "page" in self.cache_manager.cache
+        
+        # 同じページを更新すると、cached_atが新しくなり削除対象から外れる
+        self.cache_manager.update_page_cache(
+            "page", "ページ", "2024-01-02T00:00:00Z", "コンテンツ", "page.md"
+        )
+        self.cache_manager.cleanup_old_cache(max_age_days=30)
+        
+        assert "page" in self.cache_manager.cache
+    
+    def test_cleanup_old_cache_removes_replaced_older_entry(self):
+        """より古いcached_atで直接置き換えたエントリが削除されるテスト"""
+        self.cache_manager.update_page_cache(
+            "page", "ページ", "2024-01-01T00:00:00Z", "コンテンツ", "page.md"
+        )
+        self.cache_manager.cleanup_old_cache(max_age_days=30)
+        assert "page" in self.cache_manager.cache
+        
+        # 件数を変えずにエントリだけを古いcached_atのものに置き換える
+        old_time = (datetime.now() - timedelta(days=35)).isoformat()
+        self.cache_manager.cache["page"] = PageCacheEntry(
+            page_id="page",
+            title="ページ",
+            last_edited_time="2024-01-01T00:00:00Z",
+            content_hash="abc123",
+            file_path="page.md",
+            cached_at=old_time
+        )
+        self.cache_manager.cleanup_old_cache(max_age_days=30)
+        
+        assert "page" not in self.cache_manager.cache
+    
     def test_get_cache_stats(self):
         """キャッシュ統計取得テスト"""
         # 空のキャッシュ
@@ -251,17 +290,14 @@ class TestCacheManager:
 class TestChangeDetector:
     """ChangeDetector のテスト"""
     
-    def setup_method(self):
-        """テストセットアップ"""
-        self.temp_dir = tempfile.mkdtemp()
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """テストセットアップ（一時ディレクトリはpytestが管理）"""
+        self.temp_dir = str(tmp_path)
         self.config = ConversionConfig()
         self.cache_manager = CacheManager(self.config, self.temp_dir)
         self.change_detector = ChangeDetector(self.cache_manager)
     
-    def teardown_method(self):
-        """テストクリーンアップ"""
-        shutil.rmtree(self.temp_dir)
-    
     def test_detect_changes_new_pages(self):
         """新規ページ検出テスト"""
         current_pages = [
@@ -4,8 +4,7 @@
 
 import pytest
 import asyncio
-import time
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 from services.concurrent_processor import (
     ConcurrentProcessor, RateLimiter, ProgressTracker, 
@@ -62,19 +61,27 @@ class TestRateLimiter:
     @pytest.mark.asyncio
     async def test_rate_limiter_acquire(self):
         """レート制限取得テスト"""
-        limiter = RateLimiter(max_requests_per_second=10.0, burst_limit=2)
-        
-        # 最初の2回は即座に取得可能
-        assert await limiter.acquire() == True
-        assert await limiter.acquire() == True
-        
-        # 3回目は待機が発生する
-        start_time = time.time()
-        assert await limiter.acquire() == True
-        elapsed_time = time.time() - start_time
-        
-        # 待機時間が発生していることを確認（厳密ではないが概算）
-        assert elapsed_time > 0.05  # 50ms以上の待機
+        # 実際に待機せず、asyncio.sleepで進む擬似的な単調時計を使う
+        clock = [100.0]
+        
+        async def fake_sleep(seconds):
+            clock[0] += seconds
+        
+        fake_time = Mock(monotonic=lambda: clock[0])
+        with patch('services.concurrent_processor.time', fake_time), \
+             patch('services.concurrent_processor.asyncio.sleep', AsyncMock(side_effect=fake_sleep)) as mock_sleep:
+            limiter = RateLimiter(max_requests_per_second=10.0, burst_limit=2)
+            
+            # 最初の2回は即座に取得可能
+            assert await limiter.acquire() == True
+            assert await limiter.acquire() == True
+            mock_sleep.assert_not_called()
+            
+            # 3回目はトークン1個分（0.1秒）の待機が発生する
+            assert await limiter.acquire() == True
+            mock_sleep.assert_awaited_once()
+            assert mock_sleep.await_args.args[0] == pytest.approx(0.1)
+            assert clock[0] == pytest.approx(100.1)
     
     def test_get_wait_time(self):
         """待機時間取得テスト"""
@@ -157,7 +164,6 @@ class TestConcurrentProcessor:
         ]
         
         def mock_processor(page):
-            time.sleep(0.1)  # 短い待機をシミュレート
             return f"処理済み: {page['data']}"
         
         results = self.processor.process_pages_threaded(pages, mock_processor)
@@ -165,6 +171,21 @@ class TestConcurrentProcessor:
         assert len(results) == 2
         assert all(result.success for result in results)
         assert all(result.processing_time > 0 for result in results)
+        assert sorted(result.page_id for result in results) == ["page1", "page2"]
+    
+    def test_process_pages_threaded_reuses_executor(self):
+        """スレッドプールが呼び出し間で再利用されるテスト"""
+        pages = [{"id": "page1", "data": "データ1"}]
+        
+        self.processor.process_pages_threaded(pages, lambda page: page["data"])
+        executor = self.processor._executor
+        self.processor.process_pages_threaded(pages, lambda page: page["data"])
+        
+        assert executor is not None
+        assert self.processor._executor is executor
+        
+        self.processor.close()
+        assert self.processor._executor is None
     
     def test_process_pages_batch(self):
         """バッチ処理テスト"""
@@ -312,6 +333,39 @@ class TestIntegration:
         assert len(progress_updates) == 5
         assert progress_updates[-1] == (5, 5)  # 最後は完了状態
     
+    @pytest.mark.asyncio
+    async def test_async_processing_progress_callback_error_propagates(self):
+        """進捗コールバックの例外が呼び出し元に伝わるテスト"""
+        pages = [{"id": f"page{i}", "data": i} for i in range(3)]
+        
+        def progress_callback(completed, total):
+            raise RuntimeError("コールバックエラー")
+        
+        async def mock_processor(page):
+            return page['data']
+        
+        with pytest.raises(RuntimeError, match="コールバックエラー"):
+            await self.processor.process_pages_async(pages, mock_processor, progress_callback)
+    
+    @pytest.mark.asyncio
+    async def test_async_processing_with_progress_interval(self):
+        """進捗通知間隔付き非同期処理テスト"""
+        pages = [{"id": f"page{i}", "data": i} for i in range(5)]
+        progress_updates = []
+        
+        def progress_callback(completed, total):
+            progress_updates.append((completed, total))
+        
+        async def mock_processor(page):
+            return page['data'] * 2
+        
+        results = await self.processor.process_pages_async(
+            pages, mock_processor, progress_callback, progress_interval=2
+        )
+        
+        assert len(results) == 5
+        assert progress_updates == [(2, 5), (4, 5), (5, 5)]
+    
     def test_threaded_processing_with_rate_limit(self):
         """レート制限付きスレッド処理テスト"""
         pages = [{"id": f"page{i}", "data": i} for i in range(3)]
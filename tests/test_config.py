@@ -38,20 +38,18 @@ class TestNotionConfig:
 class TestObsidianConfig:
     """ObsidianConfig のテスト"""
     
-    def test_valid_config_with_temp_dir(self):
+    def test_valid_config_with_temp_dir(self, shared_vault):
         """一時ディレクトリを使用した有効な設定のテスト"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config = ObsidianConfig(vault_path=temp_dir)
-            assert config.vault_path == temp_dir
-            assert config.subfolder is None
+        config = ObsidianConfig(vault_path=shared_vault)
+        assert config.vault_path == shared_vault
+        assert config.subfolder is None
     
-    def test_valid_config_with_subfolder(self):
+    def test_valid_config_with_subfolder(self, shared_vault):
         """サブフォルダ付きの有効な設定のテスト"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config = ObsidianConfig(vault_path=temp_dir, subfolder="notes")
-            assert config.subfolder == "notes"
-            expected_path = str(Path(temp_dir) / "notes")
-            assert config.full_sync_path == expected_path
+        config = ObsidianConfig(vault_path=shared_vault, subfolder="notes")
+        assert config.subfolder == "notes"
+        expected_path = str(Path(shared_vault) / "notes")
+        assert config.full_sync_path == expected_path
     
     def test_nonexistent_path(self):
         """存在しないパスでのテスト"""
@@ -125,6 +123,8 @@ class TestSyncConfig:
         assert config.include_properties is True
         assert config.overwrite_existing is True
         assert config.batch_size == 10
+        assert config.concurrency == 5
+        assert config.conversion_workers == 0
         assert isinstance(config.conversion, ConversionConfig)
     
     def test_valid_custom_config(self):
@@ -157,6 +157,11 @@ class TestSyncConfig:
         """バッチサイズが大きすぎる場合のテスト"""
         with pytest.raises(ValueError, match="batch_sizeは100以下である必要があります"):
             SyncConfig(batch_size=101)
+    
+    def test_invalid_concurrency_zero(self):
+        """同時実行数が0の場合のテスト"""
+        with pytest.raises(ValueError, match="concurrencyは正の整数である必要があります"):
+            SyncConfig(concurrency=0)
 
 
 class TestLoggingConfig:
@@ -183,78 +188,87 @@ class TestLoggingConfig:
 class TestAppConfig:
     """AppConfig のテスト"""
     
-    def test_from_dict_minimal(self):
+    def test_from_dict_minimal(self, shared_vault):
         """最小限の辞書からの設定作成テスト"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_dict = {
-                'notion': {
-                    'api_token': 'test_token',
-                    'database_id': 'test_db_id'
-                },
-                'obsidian': {
-                    'vault_path': temp_dir
-                }
+        config_dict = {
+            'notion': {
+                'api_token': 'test_token',
+                'database_id': 'test_db_id'
+            },
+            'obsidian': {
+                'vault_path': shared_vault
             }
-            config = AppConfig.from_dict(config_dict)
-            assert config.notion.api_token == 'test_token'
-            assert config.obsidian.vault_path == temp_dir
-            assert config.sync.batch_size == 10  # デフォルト値
-            assert config.logging.level == "INFO"  # デフォルト値
+        }
+        config = AppConfig.from_dict(config_dict)
+        assert config.notion.api_token == 'test_token'
+        assert config.obsidian.vault_path == shared_vault
+        assert config.sync.batch_size == 10  # デフォルト値
+        assert config.logging.level == "INFO"  # デフォルト値
     
-    def test_from_dict_full(self):
+    def test_from_dict_full(self, shared_vault):
         """完全な辞書からの設定作成テスト"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_dict = {
-                'notion': {
-                    'api_token': 'test_token',
-                    'database_id': 'test_db_id'
-                },
-                'obsidian': {
-                    'vault_path': temp_dir,
-                    'subfolder': 'notes'
-                },
-                'sync': {
-                    'file_naming': '{title}_{id}',
-                    'include_properties': False,
-                    'batch_size': 5,
-                    'conversion': {
-                        'database_mode': 'description',
-                        'quality_level': 'lenient'
-                    }
-                },
-                'logging': {
-                    'level': 'DEBUG',
-                    'file': 'debug.log'
+        config_dict = {
+            'notion': {
+                'api_token': 'test_token',
+                'database_id': 'test_db_id'
+            },
+            'obsidian': {
+                'vault_path': shared_vault,
+                'subfolder': 'notes'
+            },
+            'sync': {
+                'file_naming': '{title}_{id}',
+                'include_properties': False,
+                'batch_size': 5,
+                'conversion': {
+                    'database_mode': 'description',
+                    'quality_level': 'lenient'
                 }
+            },
+            'logging': {
+                'level': 'DEBUG',
+                'file': 'debug.log'
             }
-            config = AppConfig.from_dict(config_dict)
-            assert config.notion.api_token == 'test_token'
-            assert config.obsidian.subfolder == 'notes'
-            assert config.sync.file_naming == '{title}_{id}'
-            assert config.sync.include_properties is False
-            assert config.sync.batch_size == 5
-            assert config.sync.conversion.database_mode == 'description'
-            assert config.sync.conversion.quality_level == 'lenient'
-            assert config.logging.level == 'DEBUG'
-            assert config.logging.file == 'debug.log'
+        }
+        config = AppConfig.from_dict(config_dict)
+        assert config.notion.api_token == 'test_token'
+        assert config.obsidian.subfolder == 'notes'
+        assert config.sync.file_naming == '{title}_{id}'
+        assert config.sync.include_properties is False
+        assert config.sync.batch_size == 5
+        assert config.sync.conversion.database_mode == 'description'
+        assert config.sync.conversion.quality_level == 'lenient'
+        assert config.logging.level == 'DEBUG'
+        assert config.logging.file == 'debug.log'
+    
+    def test_from_dict_does_not_modify_input(self, shared_vault):
+        """入力辞書を変更しないことのテスト"""
+        config_dict = {
+            'notion': {'api_token': 'test_token', 'database_id': 'test_db_id'},
+            'obsidian': {'vault_path': shared_vault},
+            'sync': {'batch_size': 5, 'conversion': {'quality_level': 'lenient'}}
+        }
+        first = AppConfig.from_dict(config_dict)
+        second = AppConfig.from_dict(config_dict)
+        assert config_dict['sync']['conversion'] == {'quality_level': 'lenient'}
+        assert first.sync.conversion.quality_level == 'lenient'
+        assert second.sync.conversion.quality_level == 'lenient'
     
-    def test_validate_success(self):
+    def test_validate_success(self, shared_vault):
         """検証成功のテスト"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config = AppConfig(
-                notion=NotionConfig(api_token="test", database_id="test"),
-                obsidian=ObsidianConfig(vault_path=temp_dir)
-            )
-            # 例外が発生しないことを確認
-            config.validate()
+        config = AppConfig(
+            notion=NotionConfig(api_token="test", database_id="test"),
+            obsidian=ObsidianConfig(vault_path=shared_vault)
+        )
+        # 例外が発生しないことを確認
+        config.validate()
     
-    def test_validate_invalid_sync_path_parent(self):
+    def test_validate_invalid_sync_path_parent(self, shared_vault):
         """同期先の親ディレクトリが存在しない場合のテスト"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            invalid_path = os.path.join(temp_dir, "nonexistent", "subfolder")
-            config = AppConfig(
-                notion=NotionConfig(api_token="test", database_id="test"),
-                obsidian=ObsidianConfig(vault_path=temp_dir, subfolder="nonexistent/subfolder")
-            )
-            with pytest.raises(ValueError, match="同期先の親ディレクトリが存在しません"):
-                config.validate()
\ No newline at end of file
+        invalid_path = os.path.join(shared_vault, "nonexistent", "subfolder")
+        config = AppConfig(
+            notion=NotionConfig(api_token="test", database_id="test"),
+            obsidian=ObsidianConfig(vault_path=shared_vault, subfolder="nonexistent/subfolder")
+        )
+        with pytest.raises(ValueError, match="同期先の親ディレクトリが存在しません"):
+            config.validate()
\ No newline at end of file
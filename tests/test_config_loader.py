@@ -3,8 +3,8 @@
 """
 
 import pytest
-import tempfile
 import os
+import yaml
 from pathlib import Path
 from unittest.mock import patch, mock_open
 
@@ -12,18 +12,34 @@ from utils.config_loader import ConfigLoader, ConfigLoadError
 from models.config import AppConfig
 
 
+# 複数のテストで使う設定ファイルの内容
+_YAML_MINIMAL = """
+notion:
+  api_token: "test_token"
+  database_id: "test_db_id"
+
+obsidian:
+  vault_path: "/test/vault"
+"""
+
+_YAML_MISSING_API_TOKEN = """
+notion:
+  # api_token が欠けている
+  database_id: "test_db_id"
+
+obsidian:
+  vault_path: "/test/vault"
+"""
+
+
 class TestConfigLoader:
     """ConfigLoader のテスト"""
     
-    def setup_method(self):
-        """テストセットアップ"""
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """テストセットアップ（一時ディレクトリはpytestが管理）"""
         self.config_loader = ConfigLoader()
-        self.temp_dir = tempfile.mkdtemp()
-    
-    def teardown_method(self):
-        """テストクリーンアップ"""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        self.temp_dir = str(tmp_path)
     
     def test_load_valid_config(self):
         """有効な設定ファイルの読み込みテスト"""
@@ -159,14 +175,7 @@ notion:
     
     def test_load_missing_required_field(self):
         """必須フィールドが欠けている設定ファイルのテスト"""
-        config_content = """
-notion:
-  # api_token が欠けている
-  database_id: "test_db_id"
-
-obsidian:
-  vault_path: "/test/vault"
-"""
+        config_content = _YAML_MISSING_API_TOKEN
         
         config_path = os.path.join(self.temp_dir, "config.yaml")
         with open(config_path, 'w', encoding='utf-8') as f:
@@ -175,6 +184,30 @@ obsidian:
         with pytest.raises(ConfigLoadError, match="Notion設定の必須フィールドが見つかりません: api_token"):
             self.config_loader.load_config(config_path)
     
+    def test_load_yaml_file_reuses_parse_until_modified(self):
+        """ファイルが変更されるまでYAMLのパース結果が再利用されるテスト"""
+        config_path = os.path.join(self.temp_dir, "config.yaml")
+        with open(config_path, 'w', encoding='utf-8') as f:
+            f.write(_YAML_MINIMAL)
+        
+        with patch('yaml.load', wraps=yaml.load) as mock_load:
+            first = self.config_loader._load_yaml_file(config_path)
+            first['notion']['api_token'] = "changed"
+            second = self.config_loader._load_yaml_file(config_path)
+            
+            assert mock_load.call_count == 1
+            assert second['notion']['api_token'] == "test_token"
+            
+            # 更新時刻が変われば再度パースされる
+            with open(config_path, 'w', encoding='utf-8') as f:
+                f.write(_YAML_MISSING_API_TOKEN)
+            stat = os.stat(config_path)
+            os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            third = self.config_loader._load_yaml_file(config_path)
+            
+            assert mock_load.call_count == 2
+            assert 'api_token' not in third['notion']
+    
     def test_find_config_file(self):
         """設定ファイル検索のテスト"""
         # テスト用の設定ファイルを作成
@@ -221,14 +254,7 @@ obsidian:
     
     def test_validate_config_file_valid(self):
         """有効な設定ファイルの検証テスト"""
-        config_content = """
-notion:
-  api_token: "test_token"
-  database_id: "test_db_id"
-
-obsidian:
-  vault_path: "/test/vault"
-"""
+        config_content = _YAML_MINIMAL
         
         config_path = os.path.join(self.temp_dir, "config.yaml")
         with open(config_path, 'w', encoding='utf-8') as f:
@@ -241,14 +267,7 @@ obsidian:
     
     def test_validate_config_file_invalid(self):
         """無効な設定ファイルの検証テスト"""
-        config_content = """
-notion:
-  # api_token が欠けている
-  database_id: "test_db_id"
-
-obsidian:
-  vault_path: "/test/vault"
-"""
+        config_content = _YAML_MISSING_API_TOKEN
         
         config_path = os.path.join(self.temp_dir, "config.yaml")
         with open(config_path, 'w', encoding='utf-8') as f:
@@ -279,6 +298,23 @@ obsidian:
         assert "MISSING_TOKEN" in result["missing_env_vars"]
         assert len(result["warnings"]) > 0
     
+    def test_validate_config_file_reuses_structure_check(self):
+        """同じファイルの再検証では構文・構造チェックを再利用し、環境変数は毎回チェックするテスト"""
+        config_path = os.path.join(self.temp_dir, "config.yaml")
+        with open(config_path, 'w', encoding='utf-8') as f:
+            f.write(_YAML_MINIMAL.replace('"test_token"', '"${CACHED_TOKEN}"'))
+        
+        with patch.object(self.config_loader, '_load_yaml_file',
+                          wraps=self.config_loader._load_yaml_file) as mock_load:
+            first = self.config_loader.validate_config_file(config_path)
+            with patch.dict(os.environ, {'CACHED_TOKEN': 'token'}):
+                second = self.config_loader.validate_config_file(config_path)
+        
+        assert mock_load.call_count == 1
+        assert first["is_valid"] is True
+        assert first["missing_env_vars"] == ["CACHED_TOKEN"]
+        assert second["missing_env_vars"] == []
+    
     def test_expand_env_vars_in_string(self):
         """文字列内環境変数展開のテスト"""
         with patch.dict(os.environ, {'TEST_VAR': 'test_value'}):
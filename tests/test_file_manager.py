@@ -0,0 +1,50 @@
+"""
+ファイル管理システムのユニットテスト
+"""
+
+import os
+
+import pytest
+
+from utils.file_manager import FileManager
+
+
+class TestFileManager:
+    """FileManager のテスト"""
+    
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """テストセットアップ（一時ディレクトリはpytestが管理）"""
+        self.vault_dir = tmp_path / "vault"
+        self.vault_dir.mkdir()
+        self.file_manager = FileManager(str(self.vault_dir))
+    
+    def test_get_disk_usage(self):
+        """ディスク使用量取得テスト"""
+        (self.vault_dir / "page.md").write_text("12345", encoding="utf-8")
+        (self.vault_dir / "sub").mkdir()
+        (self.vault_dir / "sub" / "nested.md").write_text("123", encoding="utf-8")
+        
+        usage = self.file_manager.get_disk_usage()
+        
+        assert usage["file_count"] == 2
+        assert usage["total_size_bytes"] == 8
+    
+    def test_get_disk_usage_does_not_follow_symlinked_directories(self, tmp_path):
+        """シンボリックリンクのディレクトリを辿らないテスト"""
+        (self.vault_dir / "page.md").write_text("12345", encoding="utf-8")
+        
+        # ボルト外のディレクトリへのリンクと、自分自身を指すリンク（ループ）
+        outside_dir = tmp_path / "outside"
+        outside_dir.mkdir()
+        (outside_dir / "outside.md").write_text("outside content", encoding="utf-8")
+        try:
+            os.symlink(outside_dir, self.vault_dir / "outside_link", target_is_directory=True)
+            os.symlink(self.vault_dir, self.vault_dir / "loop_link", target_is_directory=True)
+        except (OSError, NotImplementedError):
+            pytest.skip("シンボリックリンクを作成できない環境")
+        
+        usage = self.file_manager.get_disk_usage()
+        
+        assert usage["file_count"] == 1
+        assert usage["total_size_bytes"] == 5
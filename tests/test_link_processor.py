@@ -69,6 +69,24 @@ class TestNotionLinkProcessor:
         assert link_ref.is_valid == True
         assert link_ref.target_id is None
     
+    def test_process_non_http_link(self):
+        """http(s)以外のリンク処理テスト"""
+        for url in ["mailto:test@example.com", "tel:0123456789", "#section", "/relative/path"]:
+            link_ref = self.processor.process_link(url)
+            
+            assert link_ref.link_type == "external"
+            assert link_ref.is_valid == True
+        
+        assert len(self.processor.broken_links) == 0
+    
+    def test_process_notion_link_without_lowercase_http_scheme(self):
+        """スキーム無し・大文字スキームのNotionリンクが外部リンク扱いされないテスト"""
+        for url in ["notion.so/test/abc123def456", "HTTPS://www.notion.so/test/abc123def456"]:
+            link_ref = self.processor.process_link(url)
+            
+            assert link_ref.link_type == "internal"
+            assert link_ref.is_valid == False
+    
     def test_process_notion_page_link_valid(self):
         """有効なNotionページリンク処理テスト"""
         page_id = "abc123def456"
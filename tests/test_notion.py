@@ -191,6 +191,25 @@ class TestNotionBlock:
         assert text_content[0].plain_text == "Hello World"
         assert block.get_plain_text() == "Hello World"
     
+    def test_block_payload_and_rich_text(self):
+        """ブロック固有データとリッチテキストの取得テスト"""
+        block = NotionBlock(
+            id="code_id",
+            type="code",
+            content={
+                "code": {
+                    "rich_text": [{"plain_text": "print(1)", "annotations": {}}],
+                    "language": "python"
+                }
+            }
+        )
+        assert block.payload["language"] == "python"
+        assert block.rich_text[0]["plain_text"] == "print(1)"
+        
+        empty_block = NotionBlock(id="divider_id", type="divider")
+        assert empty_block.payload == {}
+        assert empty_block.rich_text == []
+    
     def test_heading_block(self):
         """見出しブロックのテスト"""
         block = NotionBlock(
@@ -4,6 +4,7 @@
 
 import pytest
 import tempfile
+import time
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
 
@@ -109,10 +110,24 @@ class TestSyncOrchestrator:
         orchestrator = SyncOrchestrator(self.config)
         
         # コンポーネントが正しく初期化されることを確認
-        mock_notion_client.assert_called_once_with("test_token", "test_db")
+        mock_notion_client.assert_called_once_with("test_token", "test_db", max_concurrent_requests=5)
         mock_data_processor.assert_called_once()
         mock_file_manager.assert_called_once_with(self.temp_dir, None)
     
+    @patch('services.sync_orchestrator.NotionClient')
+    @patch('services.sync_orchestrator.DataProcessor')
+    @patch('services.sync_orchestrator.FileManager')
+    def test_close_shuts_down_pools(self, mock_file_manager, mock_data_processor, mock_notion_client):
+        """コンテキストマネージャー終了時にワーカープールとNotionクライアントを終了するテスト"""
+        with SyncOrchestrator(self.config) as orchestrator:
+            assert orchestrator._fetch_pool.submit(lambda: 1).result() == 1
+        
+        mock_notion_client.return_value.close.assert_called_once()
+        with pytest.raises(RuntimeError):
+            orchestrator._fetch_pool.submit(lambda: 1)
+        with pytest.raises(RuntimeError):
+            orchestrator._write_pool.submit(lambda: 1)
+    
     @patch('services.sync_orchestrator.NotionClient')
     @patch('services.sync_orchestrator.DataProcessor')
     @patch('services.sync_orchestrator.FileManager')
@@ -329,4 +344,335 @@ class TestSyncOrchestrator:
         assert result["is_valid"] is False
         assert result["checks"]["notion_accessible"] is False
         assert result["checks"]["vault_writable"] is False
-        assert len(result["errors"]) > 0
\ No newline at end of file
+        assert len(result["errors"]) > 0
+    
+    @patch('services.sync_orchestrator.NotionClient')
+    @patch('services.sync_orchestrator.DataProcessor')
+    @patch('services.sync_orchestrator.FileManager')
+    def test_process_page_batch_keeps_order(self, mock_file_manager_class, mock_data_processor_class, mock_notion_client_class):
+        """並行取得時もページ順に結果が返るテスト"""
+        # モックを設定
+        mock_notion_client = Mock()
+        mock_data_processor = Mock()
+        
+        mock_notion_client_class.return_value = mock_notion_client
+        mock_data_processor_class.return_value = mock_data_processor
+        mock_file_manager_class.return_value = Mock()
+        
+        pages = [
+            NotionPage(
+                id=f"page_{i}",
+                created_time=datetime.now(),
+                last_edited_time=datetime.now(),
+                created_by={},
+                last_edited_by={}
+            )
+            for i in range(4)
+        ]
+        
+        def get_page_content(page_id):
+            if page_id == "page_2":
+                raise Exception("API エラー")
+            page = next(p for p in pages if p.id == page_id)
+            return NotionPageContent(page=page, blocks=[])
+        
+        mock_notion_client.get_page_content.side_effect = get_page_content
+        mock_data_processor.convert_page_to_markdown.side_effect = lambda content, *args: MarkdownConversionResult(
+            markdown_file=MarkdownFile(filename=f"{content.page.id}.md")
+        )
+        
+        # テスト実行
+        orchestrator = SyncOrchestrator(self.config)
+        result = SyncResult()
+        batch_results = orchestrator._process_page_batch(pages, result)
+        
+        # 結果確認
+        assert [r.markdown_file.filename for r in batch_results] == ["page_0.md", "page_1.md", "page_3.md"]
+        assert len(result.errors) == 1
+    
+    @patch('services.sync_orchestrator.NotionClient')
+    @patch('services.sync_orchestrator.DataProcessor')
+    @patch('services.sync_orchestrator.FileManager')
+    def test_database_pages_cached_between_calls(self, mock_file_manager_class, mock_data_processor_class, mock_notion_client_class):
+        """ページ一覧がプレビュー間で再利用されるテスト"""
+        # モックを設定
+        mock_notion_client = Mock()
+        mock_data_processor = Mock()
+        mock_file_manager = Mock()
+        
+        mock_notion_client_class.return_value = mock_notion_client
+        mock_data_processor_class.return_value = mock_data_processor
+        mock_file_manager_class.return_value = mock_file_manager
+        
+        mock_notion_client.get_database_pages.return_value = []
+        mock_file_manager.check_file_conflicts.return_value = {}
+        
+        # テスト実行
+        orchestrator = SyncOrchestrator(self.config)
+        orchestrator.get_sync_preview(max_pages=5)
+        orchestrator.get_sync_preview(max_pages=10)
+        
+        # 結果確認
+        assert mock_notion_client.get_database_pages.call_count == 1
+        
+        orchestrator.invalidate_pages_cache()
+        orchestrator.get_sync_preview(max_pages=5)
+        assert mock_notion_client.get_database_pages.call_count == 2
+    
+    @patch('services.sync_orchestrator.NotionClient')
+    @patch('services.sync_orchestrator.DataProcessor')
+    @patch('services.sync_orchestrator.FileManager')
+    def test_sync_all_pages_streams_batches(self, mock_file_manager_class, mock_data_processor_class, mock_notion_client_class):
+        """プレビューを省略した場合にバッチ単位で取得しながら同期するテスト"""
+        # モックを設定
+        mock_notion_client = Mock()
+        mock_data_processor = Mock()
+        mock_file_manager = Mock()
+        
+        mock_notion_client_class.return_value = mock_notion_client
+        mock_data_processor_class.return_value = mock_data_processor
+        mock_file_manager_class.return_value = mock_file_manager
+        
+        pages = [
+            NotionPage(
+                id=f"page_{i}",
+                created_time=datetime.now(),
+                last_edited_time=datetime.now(),
+                created_by={},
+                last_edited_by={}
+            )
+            for i in range(3)
+        ]
+        
+        mock_notion_client.test_connection.return_value = True
+        mock_notion_client.get_pages_in_batches.return_value = iter([pages[:2], pages[2:]])
+        mock_notion_client.get_page_content.side_effect = lambda page_id: NotionPageContent(
+            page=next(p for p in pages if p.id == page_id), blocks=[]
+        )
+        mock_data_processor.convert_page_to_markdown.side_effect = lambda content, *args: MarkdownConversionResult(
+            markdown_file=MarkdownFile(filename=f"{content.page.id}.md")
+        )
+        mock_file_manager.validate_vault_structure.return_value = []
+        mock_file_manager.safe_batch_write.side_effect = lambda results, **kwargs: {
+            "successful_writes": len(results),
+            "failed_writes": 0,
+            "conflicts_detected": 0,
+            "conflict_report": None
+        }
+        
+        # テスト実行
+        self.config.sync.skip_preflight_preview = True
+        orchestrator = SyncOrchestrator(self.config)
+        result = orchestrator.sync_all_pages()
+        
+        # 結果確認
+        assert result.total_pages == 3
+        assert result.successful_pages == 3
+        assert [r.markdown_file.filename for r in result.conversion_results] == ["page_0.md", "page_1.md", "page_2.md"]
+        assert mock_file_manager.safe_batch_write.call_count == 2
+        mock_notion_client.get_database_pages.assert_not_called()
+    
+    @patch('services.sync_orchestrator.NotionClient')
+    @patch('services.sync_orchestrator.DataProcessor')
+    @patch('services.sync_orchestrator.FileManager')
+    def test_sync_all_pages_waits_for_writes_on_error(self, mock_file_manager_class, mock_data_processor_class, mock_notion_client_class):
+        """バッチ取得が途中で失敗しても投入済みの書き込みを待って反映するテスト"""
+        # モックを設定
+        mock_notion_client = Mock()
+        mock_data_processor = Mock()
+        mock_file_manager = Mock()
+        
+        mock_notion_client_class.return_value = mock_notion_client
+        mock_data_processor_class.return_value = mock_data_processor
+        mock_file_manager_class.return_value = mock_file_manager
+        
+        edited_time = datetime(2024, 1, 1, 12, 0, 0)
+        pages = [
+            NotionPage(
+                id=f"page_{i}",
+                created_time=edited_time,
+                last_edited_time=edited_time,
+                created_by={},
+                last_edited_by={}
+            )
+            for i in range(4)
+        ]
+        
+        def get_pages_in_batches(batch_size):
+            yield pages[:2]
+            yield pages[2:]
+            raise RuntimeError("ページ一覧の取得に失敗")
+        
+        written = []
+        
+        def slow_batch_write(results, **kwargs):
+            time.sleep(0.2)
+            written.extend(r.markdown_file.filename for r in results)
+            return {
+                "successful_writes": len(results),
+                "failed_writes": 0,
+                "conflicts_detected": 0,
+                "write_results": {r.markdown_file.filename: True for r in results},
+                "conflict_report": None
+            }
+        
+        mock_notion_client.test_connection.return_value = True
+        mock_notion_client.get_pages_in_batches.side_effect = get_pages_in_batches
+        mock_notion_client.get_page_content.side_effect = lambda page_id: NotionPageContent(
+            page=next(p for p in pages if p.id == page_id), blocks=[]
+        )
+        mock_data_processor.convert_page_to_markdown.side_effect = lambda content, *args: MarkdownConversionResult(
+            markdown_file=MarkdownFile(
+                filename=f"{content.page.id}.md",
+                frontmatter={
+                    "notion_id": content.page.id,
+                    "last_edited_time": content.page.last_edited_time.isoformat()
+                },
+                content="本文"
+            )
+        )
+        mock_file_manager.validate_vault_structure.return_value = []
+        mock_file_manager.safe_batch_write.side_effect = slow_batch_write
+        
+        # テスト実行
+        self.config.sync.skip_preflight_preview = True
+        self.config.sync.incremental = True
+        orchestrator = SyncOrchestrator(self.config)
+        result = orchestrator.sync_all_pages()
+        
+        # 結果確認（最初のバッチの書き込みは返却前に完了し、件数とキャッシュに反映される）
+        assert written == ["page_0.md", "page_1.md"]
+        assert result.successful_pages == 2
+        assert len(result.errors) == 1
+        cache_manager = orchestrator.change_detector.cache_manager
+        assert cache_manager.get_page_cache("page_0") is not None
+        assert cache_manager.get_page_cache("page_2") is None
+    
+    @patch('services.sync_orchestrator.NotionClient')
+    @patch('services.sync_orchestrator.DataProcessor')
+    def test_incremental_sync_skips_unchanged_pages(self, mock_data_processor_class, mock_notion_client_class):
+        """増分同期で未変更ページをスキップするテスト"""
+        # モックを設定
+        mock_notion_client = Mock()
+        mock_data_processor = Mock()
+        
+        mock_notion_client_class.return_value = mock_notion_client
+        mock_data_processor_class.return_value = mock_data_processor
+        
+        edited_time = datetime(2024, 1, 1, 12, 0, 0)
+        pages = [
+            NotionPage(
+                id=f"page_{i}",
+                created_time=edited_time,
+                last_edited_time=edited_time,
+                created_by={},
+                last_edited_by={}
+            )
+            for i in range(2)
+        ]
+        
+        mock_notion_client.test_connection.return_value = True
+        mock_notion_client.get_pages_in_batches.side_effect = lambda batch_size: iter([list(pages)])
+        mock_notion_client.get_page_content.side_effect = lambda page_id: NotionPageContent(
+            page=next(p for p in pages if p.id == page_id), blocks=[]
+        )
+        mock_data_processor.convert_page_to_markdown.side_effect = lambda content, *args: MarkdownConversionResult(
+            markdown_file=MarkdownFile(
+                filename=f"{content.page.id}.md",
+                frontmatter={
+                    "notion_id": content.page.id,
+                    "last_edited_time": content.page.last_edited_time.isoformat()
+                },
+                content="本文"
+            )
+        )
+        
+        # テスト実行
+        self.config.sync.skip_preflight_preview = True
+        self.config.sync.incremental = True
+        with SyncOrchestrator(self.config) as orchestrator:
+            first_result = orchestrator.sync_all_pages()
+        
+        pages[1].last_edited_time = datetime(2024, 1, 2, 12, 0, 0)
+        with SyncOrchestrator(self.config) as orchestrator:
+            second_result = orchestrator.sync_all_pages()
+        
+        # 結果確認
+        assert first_result.successful_pages == 2
+        assert second_result.total_pages == 2
+        assert second_result.skipped_pages == 1
+        assert second_result.successful_pages == 1
+        assert second_result.success_rate == 100.0
+        assert [r.markdown_file.filename for r in second_result.conversion_results] == ["page_1.md"]
+    
+    @patch('services.sync_orchestrator.NotionClient')
+    @patch('services.sync_orchestrator.DataProcessor')
+    @patch('services.sync_orchestrator.FileManager')
+    def test_recover_from_failed_sync_resyncs_failed_pages(self, mock_file_manager_class, mock_data_processor_class, mock_notion_client_class):
+        """記録された失敗ページのみを再同期するテスト"""
+        # モックを設定
+        mock_notion_client = Mock()
+        mock_notion_client_class.return_value = mock_notion_client
+        mock_data_processor_class.return_value = Mock()
+        mock_file_manager_class.return_value = Mock()
+        
+        failed_result = SyncResult()
+        failed_result.failed_page_records.append(("page_1", "ページ1", "Exception('API エラー')"))
+        failed_result.failed_page_records.append(("page_2", "ページ2", "Exception('API エラー')"))
+        
+        # テスト実行
+        orchestrator = SyncOrchestrator(self.config)
+        with patch.object(orchestrator, 'sync_single_page', side_effect=lambda page_id: page_id == "page_1"):
+            recovery_result = orchestrator.recover_from_failed_sync(failed_result)
+        
+        # 結果確認
+        assert recovery_result.total_pages == 2
+        assert recovery_result.successful_pages == 1
+        assert recovery_result.failed_pages == 1
+        mock_notion_client.get_pages_modified_after.assert_not_called()
+    
+    @patch('services.sync_orchestrator.NotionClient')
+    @patch('services.sync_orchestrator.DataProcessor')
+    @patch('services.sync_orchestrator.FileManager')
+    def test_sync_pages_modified_after_queries_once(self, mock_file_manager_class, mock_data_processor_class, mock_notion_client_class):
+        """更新日時フィルター同期がNotionへの事前確認クエリを発行しないテスト"""
+        # モックを設定
+        mock_notion_client = Mock()
+        mock_notion_client.get_database_pages.return_value = []
+        mock_notion_client_class.return_value = mock_notion_client
+        mock_data_processor_class.return_value = Mock()
+        mock_file_manager_class.return_value = Mock()
+        
+        after_date = datetime(2024, 1, 1)
+        
+        # テスト実行
+        orchestrator = SyncOrchestrator(self.config)
+        result = orchestrator.sync_pages_modified_after(after_date)
+        
+        # 結果確認（該当ページ無しの警告は1件だけ）
+        mock_notion_client.get_pages_modified_after.assert_not_called()
+        mock_notion_client.get_database_pages.assert_called_once()
+        filter_dict = mock_notion_client.get_database_pages.call_args.kwargs["filter_dict"]
+        assert filter_dict["last_edited_time"]["after"] == after_date.isoformat()
+        assert result.warnings == ["フィルター条件に一致するページが見つかりませんでした"]
+        assert result.errors == []
+    
+    @patch('services.sync_orchestrator.NotionClient')
+    @patch('services.sync_orchestrator.DataProcessor')
+    @patch('services.sync_orchestrator.FileManager')
+    def test_sync_pages_modified_after_query_error(self, mock_file_manager_class, mock_data_processor_class, mock_notion_client_class):
+        """更新日時フィルター同期のクエリ失敗時にページ無しの警告を出さないテスト"""
+        # モックを設定
+        mock_notion_client = Mock()
+        mock_notion_client.get_database_pages.side_effect = Exception("API Error")
+        mock_notion_client_class.return_value = mock_notion_client
+        mock_data_processor_class.return_value = Mock()
+        mock_file_manager_class.return_value = Mock()
+        
+        # テスト実行
+        orchestrator = SyncOrchestrator(self.config)
+        result = orchestrator.sync_pages_modified_after(datetime(2024, 1, 1))
+        
+        # 結果確認
+        assert len(result.errors) == 1
+        assert result.warnings == []
@@ -3,28 +3,79 @@
 YAML設定ファイルと環境変数を処理するユーティリティ
 """
 
+import copy
 import os
 import logging
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional, List
-import yaml
+from typing import Dict, Any, Optional, List, Tuple
 from dotenv import load_dotenv
 
 from models.config import AppConfig
 
+# ${VAR_NAME} 形式の環境変数参照
+_ENV_VAR_RE = re.compile(r'\$\{([^}]+)\}')
+
+# create_default_configで書き出すデフォルト設定（内容は固定のため毎回YAMLに変換しない）
+_DEFAULT_CONFIG_YAML = """\
+notion:
+  api_token: ${NOTION_API_TOKEN}
+  database_id: your-database-id-here
+obsidian:
+  vault_path: /path/to/your/obsidian/vault
+  subfolder: notion-sync
+sync:
+  file_naming: '{title}'
+  include_properties: true
+  overwrite_existing: true
+  batch_size: 10
+  concurrency: 5
+  conversion_workers: 0
+  skip_preflight_preview: false
+  incremental: false
+  conversion:
+    database_mode: table
+    column_layout: separator
+    unsupported_blocks: placeholder
+    quality_level: standard
+logging:
+  level: INFO
+  file: sync.log
+"""
+
 
 class ConfigLoadError(Exception):
     """設定読み込み関連のエラー"""
     pass
 
 
+@lru_cache(maxsize=32)
+def _parse_yaml_cached(file_path: str, mtime_ns: int, size: int) -> Any:
+    """
+    YAMLファイルをパース（パス・更新時刻・サイズが同じ間は結果を再利用）
+    
+    返り値は共有されるため、呼び出し側で変更しないこと
+    """
+    # PyYAMLの読み込みは重いため、YAMLを実際に扱うときまで遅延させる
+    import yaml
+    
+    # libyaml無しでビルドされたPyYAMLでは純Python実装のSafeLoaderを使用
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return yaml.load(f, Loader=loader)
+
+
 class ConfigLoader:
     """設定ファイル読み込みクラス"""
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         
+        # validate_config_fileの構文・構造チェック結果
+        # キー: (絶対パス, 更新時刻(ns), サイズ)、値: (設定辞書（読み込み失敗時はNone）, エラー一覧)
+        self._validation_cache: Dict[Tuple[str, int, int], Tuple[Optional[Dict[str, Any]], Tuple[str, ...]]] = {}
+        
         # 環境変数を読み込み
         load_dotenv()
     
@@ -105,9 +156,14 @@ class ConfigLoader:
         Returns:
             読み込まれた設定辞書
         """
+        import yaml
+        
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                config_dict = yaml.safe_load(f)
+            # 同じファイルを繰り返し読み込む場合はパース結果を再利用し、呼び出し側にはコピーを返す
+            file_stat = os.stat(file_path)
+            config_dict = copy.deepcopy(_parse_yaml_cached(
+                os.path.abspath(file_path), file_stat.st_mtime_ns, file_stat.st_size
+            ))
             
             if not isinstance(config_dict, dict):
                 raise ConfigLoadError("設定ファイルの形式が正しくありません（辞書である必要があります）")
@@ -155,6 +211,10 @@ class ConfigLoader:
         Returns:
             環境変数が展開された文字列
         """
+        # 環境変数参照を含まない文字列は置換処理を省略
+        if '${' not in text:
+            return text
+        
         # ${VAR_NAME} 形式の環境変数を展開
         def replace_env_var(match):
             var_name = match.group(1)
@@ -167,10 +227,7 @@ class ConfigLoader:
             return env_value
         
         # ${VAR_NAME} パターンを検索して置換
-        pattern = r'\$\{([^}]+)\}'
-        expanded_text = re.sub(pattern, replace_env_var, text)
-        
-        return expanded_text
+        return _ENV_VAR_RE.sub(replace_env_var, text)
     
     def _validate_config_dict(self, config_dict: Dict[str, Any]) -> None:
         """
@@ -210,36 +267,9 @@ class ConfigLoader:
         Args:
             output_path: 出力先パス
         """
-        default_config = {
-            'notion': {
-                'api_token': '${NOTION_API_TOKEN}',
-                'database_id': 'your-database-id-here'
-            },
-            'obsidian': {
-                'vault_path': '/path/to/your/obsidian/vault',
-                'subfolder': 'notion-sync'
-            },
-            'sync': {
-                'file_naming': '{title}',
-                'include_properties': True,
-                'overwrite_existing': True,
-                'batch_size': 10,
-                'conversion': {
-                    'database_mode': 'table',
-                    'column_layout': 'separator',
-                    'unsupported_blocks': 'placeholder',
-                    'quality_level': 'standard'
-                }
-            },
-            'logging': {
-                'level': 'INFO',
-                'file': 'sync.log'
-            }
-        }
-        
         try:
             with open(output_path, 'w', encoding='utf-8') as f:
-                yaml.dump(default_config, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+                f.write(_DEFAULT_CONFIG_YAML)
             
             self.logger.info(f"デフォルト設定ファイルを作成しました: {output_path}")
             
@@ -265,26 +295,30 @@ class ConfigLoader:
         
         try:
             # ファイルの存在確認
-            if not os.path.exists(config_path):
+            try:
+                file_stat = os.stat(config_path)
+            except OSError:
                 validation_result["errors"].append(f"設定ファイルが存在しません: {config_path}")
                 validation_result["is_valid"] = False
                 return validation_result
             
-            # YAML構文チェック
-            try:
-                config_dict = self._load_yaml_file(config_path)
-            except ConfigLoadError as e:
-                validation_result["errors"].append(str(e))
-                validation_result["is_valid"] = False
-                return validation_result
+            # 構文・構造チェックはファイル内容だけで決まるため、同じ版のファイルでは結果を再利用する
+            cache_key = (os.path.abspath(config_path), file_stat.st_mtime_ns, file_stat.st_size)
+            cached = self._validation_cache.get(cache_key)
+            if cached is None:
+                cached = self._validate_config_structure(config_path)
+                self._validation_cache[cache_key] = cached
+            config_dict, errors = cached
             
-            # 基本構造チェック
-            try:
-                self._validate_config_dict(config_dict)
-            except ConfigLoadError as e:
-                validation_result["errors"].append(str(e))
+            if errors:
+                validation_result["errors"].extend(errors)
                 validation_result["is_valid"] = False
             
+            # YAMLとして読み込めなかった場合は以降のチェックを行わない
+            if config_dict is None:
+                return validation_result
+            
+            # 環境変数・パスは実行環境によって変わるため毎回チェックする
             # 環境変数チェック
             missing_vars = self._check_environment_variables(config_dict)
             if missing_vars:
@@ -304,6 +338,30 @@ class ConfigLoader:
             validation_result["is_valid"] = False
             return validation_result
     
+    def _validate_config_structure(self, config_path: str) -> Tuple[Optional[Dict[str, Any]], Tuple[str, ...]]:
+        """
+        設定ファイルのYAML構文と基本構造をチェック
+        
+        Args:
+            config_path: 設定ファイルのパス
+            
+        Returns:
+            (設定辞書（読み込み失敗時はNone）, エラーメッセージのタプル)
+        """
+        # YAML構文チェック
+        try:
+            config_dict = self._load_yaml_file(config_path)
+        except ConfigLoadError as e:
+            return None, (str(e),)
+        
+        # 基本構造チェック
+        try:
+            self._validate_config_dict(config_dict)
+        except ConfigLoadError as e:
+            return config_dict, (str(e),)
+        
+        return config_dict, ()
+    
     def _check_environment_variables(self, config_dict: Dict[str, Any]) -> List[str]:
         """
         設定で使用されている環境変数をチェック
@@ -319,9 +377,7 @@ class ConfigLoader:
         def check_value(value):
             if isinstance(value, str):
                 # ${VAR_NAME} パターンを検索
-                pattern = r'\$\{([^}]+)\}'
-                matches = re.findall(pattern, value)
-                for var_name in matches:
+                for var_name in _ENV_VAR_RE.findall(value):
                     if os.getenv(var_name) is None:
                         missing_vars.append(var_name)
             elif isinstance(value, dict):
@@ -375,6 +431,20 @@ sync:
   # 各バッチで処理するページ数
   batch_size: 10
   
+  # ページコンテンツを同時に取得する数（Notionのレート制限に注意）
+  concurrency: 5
+  
+  # Markdown変換に使うプロセス数（0の場合は同期プロセス内で変換）
+  # 大量のページを同期する場合にCPUコア数程度を指定すると変換が並列化される
+  conversion_workers: 0
+  
+  # 同期前のファイル名競合プレビューを省略するかどうか
+  skip_preflight_preview: false
+  
+  # 前回同期以降に更新されたページのみ同期するかどうか
+  # 最終編集日時はボルト内の .notion_sync_cache に記録される
+  incremental: false
+  
   # Notionの制限を処理するための変換設定
   conversion:
     # データベースブロックの処理方法: "table", "description", "skip"
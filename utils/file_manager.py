@@ -4,6 +4,8 @@ Obsidianボルトのファイル操作を管理するクラス
 """
 
 import os
+import json
+import heapq
 import logging
 import tempfile
 import shutil
@@ -14,6 +16,11 @@ from contextlib import contextmanager
 
 from models.markdown import MarkdownFile, MarkdownConversionResult
 
+try:
+    import orjson
+except ImportError:  # オプション依存関係（未インストール時は標準jsonを使用）
+    orjson = None
+
 
 class FileOperationError(Exception):
     """ファイル操作関連のエラー"""
@@ -35,6 +42,9 @@ class FileManager:
         self.subfolder = subfolder
         self.logger = logging.getLogger(__name__)
         
+        # 整合性チェック結果のインデックスファイル名（同期パス直下）
+        self.integrity_index_name = ".integrity_index.json"
+        
         # ファイルロック用の辞書
         self._file_locks = {}
         self._locks_lock = threading.Lock()
@@ -204,11 +214,28 @@ class FileManager:
         try:
             # ディレクトリの存在確認
             self.ensure_directory_exists()
+        except Exception as e:
+            self.logger.error(f"ファイル書き込みエラー: {markdown_file.filename} - {str(e)}")
+            return False
+        
+        return self._write_to_sync_path(markdown_file, overwrite)
+    
+    def _write_to_sync_path(self, markdown_file: MarkdownFile, overwrite: bool) -> bool:
+        """
+        同期パスが存在する前提でMarkdownファイルを書き込み
+        
+        Args:
+            markdown_file: MarkdownFileオブジェクト
+            overwrite: 既存ファイルを上書きするかどうか
             
+        Returns:
+            書き込み成功時True
+        """
+        try:
             file_path = self.sync_path / markdown_file.filename
             
-            # 上書き確認
-            if file_path.exists() and not overwrite:
+            # 上書き確認（上書きする場合は存在確認のstatを省く）
+            if not overwrite and file_path.exists():
                 self.logger.warning(f"ファイルが既に存在します（上書きしません）: {markdown_file.filename}")
                 return False
             
@@ -234,9 +261,16 @@ class FileManager:
         """
         results = {}
         
+        # ディレクトリの確認はファイルごとではなくバッチ全体で1回だけ行う
+        try:
+            self.ensure_directory_exists()
+        except Exception as e:
+            self.logger.error(f"ファイル書き込みエラー: {str(e)}")
+            return {result.markdown_file.filename: False for result in conversion_results}
+        
         for result in conversion_results:
             filename = result.markdown_file.filename
-            success = self.write_markdown_file(result.markdown_file, overwrite)
+            success = self._write_to_sync_path(result.markdown_file, overwrite)
             results[filename] = success
             
             if success:
@@ -316,13 +350,15 @@ class FileManager:
             self.logger.error(f"ファイル削除エラー: {filename} - {str(e)}")
             return False
     
-    def backup_file(self, filename: str, backup_suffix: str = ".backup") -> bool:
+    def backup_file(self, filename: str, backup_suffix: str = ".backup", move: bool = False) -> bool:
         """
         ファイルをバックアップ
         
         Args:
             filename: ファイル名
             backup_suffix: バックアップファイルの接尾辞
+            move: Trueの場合はコピーせず元ファイルをバックアップ名へリネームする
+                  （同一ディレクトリ内のためメタデータ操作のみで済む）
             
         Returns:
             バックアップ成功時True
@@ -336,7 +372,11 @@ class FileManager:
         backup_path = file_path.with_suffix(file_path.suffix + backup_suffix)
         
         try:
-            shutil.copy2(file_path, backup_path)
+            if move:
+                with self._get_file_lock(str(file_path)):
+                    os.replace(file_path, backup_path)
+            else:
+                shutil.copy2(file_path, backup_path)
             self.logger.debug(f"ファイルバックアップ成功: {filename} -> {backup_path.name}")
             return True
             
@@ -352,16 +392,22 @@ class FileManager:
             max_backups: 保持する最大バックアップ数
         """
         try:
-            backup_files = list(self.sync_path.glob("*.backup"))
-            
-            if len(backup_files) <= max_backups:
+            # ディレクトリ走査時に得られるstat情報を使い、ファイルごとのstat呼び出しを省く
+            with os.scandir(self.sync_path) as entries:
+                backup_entries = [
+                    (entry.stat(follow_symlinks=False).st_mtime_ns, entry.name)
+                    for entry in entries
+                    if entry.name.endswith(".backup") and entry.is_file(follow_symlinks=False)
+                ]
+            
+            if len(backup_entries) <= max_backups:
                 return
             
-            # 更新日時でソート（古い順）
-            backup_files.sort(key=lambda p: p.stat().st_mtime)
-            
-            # 古いファイルを削除
-            files_to_delete = backup_files[:-max_backups]
+            # 更新日時が古いものから削除対象の件数分だけ取り出す（全件のソートは不要）
+            files_to_delete = [
+                self.sync_path / name
+                for _, name in heapq.nsmallest(len(backup_entries) - max_backups, backup_entries)
+            ]
             for backup_file in files_to_delete:
                 try:
                     backup_file.unlink()
@@ -385,10 +431,17 @@ class FileManager:
             total_size = 0
             file_count = 0
             
-            for file_path in self.sync_path.rglob("*"):
-                if file_path.is_file():
-                    total_size += file_path.stat().st_size
-                    file_count += 1
+            # os.scandirのエントリはファイル種別を保持しているため、ファイルごとのstatは1回で済む
+            # シンボリックリンクは辿らない（リンクのループや同期フォルダ外のディレクトリを数えないため）
+            pending_dirs = [self.sync_path] if self.sync_path.is_dir() else []
+            while pending_dirs:
+                with os.scandir(pending_dirs.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending_dirs.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            total_size += entry.stat().st_size
+                            file_count += 1
             
             return {
                 "total_size_bytes": total_size,
@@ -478,18 +531,22 @@ class FileManager:
         
         return conflicts
     
-    def resolve_filename_conflicts(self, markdown_files: List[MarkdownFile]) -> List[MarkdownFile]:
+    def resolve_filename_conflicts(self, markdown_files: List[MarkdownFile],
+                                   used_filenames: Optional[set] = None) -> List[MarkdownFile]:
         """
         ファイル名の競合を解決
         
         Args:
             markdown_files: MarkdownFileオブジェクトのリスト
+            used_filenames: 使用済みファイル名のセット（複数回の呼び出しで共有する場合に指定、
+                            解決後のファイル名が追加される）
             
         Returns:
             競合が解決されたMarkdownFileオブジェクトのリスト
         """
         resolved_files = []
-        used_filenames = set()
+        if used_filenames is None:
+            used_filenames = set()
         
         for md_file in markdown_files:
             original_filename = md_file.filename
@@ -567,7 +624,8 @@ class FileManager:
     
     def safe_batch_write(self, conversion_results: List[MarkdownConversionResult],
                         overwrite: bool = True,
-                        resolve_conflicts: bool = True) -> Dict[str, Any]:
+                        resolve_conflicts: bool = True,
+                        used_filenames: Optional[set] = None) -> Dict[str, Any]:
         """
         安全なバッチ書き込み（競合チェック付き）
         
@@ -575,6 +633,8 @@ class FileManager:
             conversion_results: MarkdownConversionResultオブジェクトのリスト
             overwrite: 既存ファイルを上書きするかどうか
             resolve_conflicts: 競合を自動解決するかどうか
+            used_filenames: 同じ同期処理内の先行バッチで使用済みのファイル名のセット
+                            （指定時は先行バッチとの重複も解決する）
             
         Returns:
             書き込み結果の詳細辞書
@@ -584,10 +644,11 @@ class FileManager:
         # 競合チェック
         conflicts = self.check_file_conflicts(markdown_files)
         
-        # 競合解決
-        if resolve_conflicts and conflicts:
-            self.logger.info(f"{len(conflicts)}件のファイル名競合を検出、自動解決を実行")
-            resolved_files = self.resolve_filename_conflicts(markdown_files)
+        # 競合解決（先行バッチとの重複はこのバッチ内の競合チェックでは検出できないため常に解決する）
+        if resolve_conflicts and (conflicts or used_filenames is not None):
+            if conflicts:
+                self.logger.info(f"{len(conflicts)}件のファイル名競合を検出、自動解決を実行")
+            resolved_files = self.resolve_filename_conflicts(markdown_files, used_filenames)
             
             # 解決されたファイルで結果を更新
             for i, resolved_file in enumerate(resolved_files):
@@ -606,24 +667,26 @@ class FileManager:
             "conflict_report": self.create_conflict_resolution_report(conflicts) if conflicts else None
         }
     
-    def verify_file_integrity(self, filename: str) -> Dict[str, Any]:
+    def verify_file_integrity(self, filename: str,
+                              file_stat: Optional[os.stat_result] = None) -> Dict[str, Any]:
         """
         ファイルの整合性を検証
         
         Args:
             filename: ファイル名
+            file_stat: ディレクトリ走査で取得済みのstat情報（指定時は存在確認とstatを省略）
             
         Returns:
             整合性チェック結果
         """
         file_path = self.sync_path / filename
         
-        if not file_path.exists():
+        if file_stat is None and not file_path.exists():
             return {"exists": False, "error": "ファイルが存在しません"}
         
         try:
             # ファイルサイズチェック
-            file_size = file_path.stat().st_size
+            file_size = (file_stat or file_path.stat()).st_size
             
             # 読み取り可能性チェック
             with open(file_path, 'r', encoding='utf-8') as f:
@@ -649,18 +712,29 @@ class FileManager:
         except Exception as e:
             return {"exists": True, "readable": False, "error": str(e)}
     
-    def batch_verify_integrity(self, filenames: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+    def batch_verify_integrity(self, filenames: Optional[List[str]] = None,
+                               quick: bool = False) -> Dict[str, Dict[str, Any]]:
         """
         複数ファイルの整合性を一括検証
         
         Args:
             filenames: 検証するファイル名のリスト（Noneの場合は全Markdownファイル）
+            quick: 前回検証時からサイズ・更新日時が変わっていないファイルは
+                   インデックスの結果を再利用し、読み込みを省略するかどうか
             
         Returns:
             ファイル名と整合性チェック結果の辞書
         """
+        if quick:
+            return self._quick_verify_integrity(filenames)
+        
         if filenames is None:
-            filenames = self.list_markdown_files()
+            # 一覧取得と同じ走査でstat情報も得て、ファイルごとのstat呼び出しを省く
+            stats = self._scan_markdown_stats()
+            return {
+                filename: self.verify_file_integrity(filename, stats[filename])
+                for filename in sorted(stats)
+            }
         
         results = {}
         for filename in filenames:
@@ -668,6 +742,87 @@ class FileManager:
         
         return results
     
+    def _scan_markdown_stats(self) -> Dict[str, os.stat_result]:
+        """
+        同期ディレクトリを1回走査し、Markdownファイルのstat情報を取得
+        
+        Returns:
+            ファイル名とstat情報の辞書
+        """
+        stats = {}
+        try:
+            with os.scandir(self.sync_path) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".md") and entry.is_file():
+                        stats[entry.name] = entry.stat()
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.error(f"ファイル一覧取得エラー: {str(e)}")
+        
+        return stats
+    
+    def _quick_verify_integrity(self, filenames: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        インデックスを使った差分整合性検証
+        
+        Args:
+            filenames: 検証するファイル名のリスト（Noneの場合は全Markdownファイル）
+            
+        Returns:
+            ファイル名と整合性チェック結果の辞書
+        """
+        index_path = self.sync_path / self.integrity_index_name
+        try:
+            with open(index_path, 'rb') as f:
+                data = f.read()
+            index = orjson.loads(data) if orjson is not None else json.loads(data)
+        except (OSError, ValueError):
+            index = {}
+        
+        stats = self._scan_markdown_stats()
+        if filenames is None:
+            filenames = sorted(stats)
+        
+        results = {}
+        reused_count = 0
+        index_changed = False
+        for filename in filenames:
+            stat = stats.get(filename)
+            if stat is None:
+                results[filename] = self.verify_file_integrity(filename)
+                continue
+            
+            signature = [stat.st_size, stat.st_mtime_ns]
+            cached = index.get(filename)
+            if cached and cached.get("signature") == signature:
+                results[filename] = cached["result"]
+                reused_count += 1
+                continue
+            
+            result = self.verify_file_integrity(filename, stat)
+            results[filename] = result
+            # 読み取れなかったファイルは次回も必ず検証する
+            if result.get("readable"):
+                index[filename] = {"signature": signature, "result": result}
+                index_changed = True
+            elif index.pop(filename, None) is not None:
+                index_changed = True
+        
+        # 削除されたファイルのエントリを除き、変更があった場合のみインデックスを保存
+        stale_names = [name for name in index if name not in stats]
+        for name in stale_names:
+            del index[name]
+        if stats and (index_changed or stale_names):
+            if orjson is not None:
+                serialized = orjson.dumps(index).decode('utf-8')
+            else:
+                serialized = json.dumps(index, ensure_ascii=False)
+            self._atomic_write(index_path, serialized)
+        
+        self.logger.debug(f"整合性検証: {len(results)}ファイル中{reused_count}ファイルは前回結果を再利用")
+        return results
+    
     def create_integrity_report(self, integrity_results: Dict[str, Dict[str, Any]]) -> str:
         """
         整合性チェックレポートを作成